@@ -15,7 +15,6 @@
 import base64
 import json
 from pathlib import Path
-from types import SimpleNamespace
 from typing import TYPE_CHECKING, Dict, List, Pattern, Union, cast
 
 from playwright._impl._api_structures import (
@@ -48,10 +47,8 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class Browser(ChannelOwner):
-
-    Events = SimpleNamespace(
-        Disconnected="disconnected",
-    )
+    class Events:
+        Disconnected = "disconnected"
 
     def __init__(
         self, parent: "BrowserType", type: str, guid: str, initializer: Dict
@@ -61,6 +58,7 @@ class Browser(ChannelOwner):
         self._is_connected = True
         self._is_closed_or_closing = False
         self._should_close_connection_on_close = False
+        self._is_connected_over_cdp = False
 
         self._contexts: List[BrowserContext] = []
         self._channel.on("close", lambda _: self._on_close())
@@ -15,7 +15,6 @@
 import asyncio
 import json
 from pathlib import Path
-from types import SimpleNamespace
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -49,6 +48,7 @@ from playwright._impl._frame import Frame
 from playwright._impl._har_router import HarRouter
 from playwright._impl._helper import (
     HarRecordingMetadata,
+    InterceptionEnabler,
     RouteFromHarNotFoundPolicy,
     RouteHandler,
     RouteHandlerCallback,
@@ -73,17 +73,15 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class BrowserContext(ChannelOwner):
-
-    Events = SimpleNamespace(
-        BackgroundPage="backgroundpage",
-        Close="close",
-        Page="page",
-        ServiceWorker="serviceworker",
-        Request="request",
-        Response="response",
-        RequestFailed="requestfailed",
-        RequestFinished="requestfinished",
-    )
+    class Events:
+        BackgroundPage = "backgroundpage"
+        Close = "close"
+        Page = "page"
+        ServiceWorker = "serviceworker"
+        Request = "request"
+        Response = "response"
+        RequestFailed = "requestfailed"
+        RequestFinished = "requestfinished"
 
     def __init__(
         self, parent: ChannelOwner, type: str, guid: str, initializer: Dict
@@ -91,6 +89,7 @@ class BrowserContext(ChannelOwner):
         super().__init__(parent, type, guid, initializer)
         self._pages: List[Page] = []
         self._routes: List[RouteHandler] = []
+        self._interception = InterceptionEnabler(self._channel)
         self._bindings: Dict[str, Any] = {}
         self._timeout_settings = TimeoutSettings(None)
         self._browser: Optional["Browser"] = None
@@ -111,7 +110,7 @@ class BrowserContext(ChannelOwner):
         )
         self._channel.on(
             "route",
-            lambda params: asyncio.create_task(
+            lambda params: self._create_task(
                 self._on_route(
                     from_channel(params.get("route")),
                 )
@@ -192,7 +191,7 @@ class BrowserContext(ChannelOwner):
                 handled = await route_handler.handle(route)
             finally:
                 if len(self._routes) == 0:
-                    asyncio.create_task(self._disable_interception())
+                    self._create_task(self._disable_interception())
             if handled:
                 return
         await route._internal_continue(is_internal=True)
@@ -201,7 +200,7 @@ class BrowserContext(ChannelOwner):
         func = self._bindings.get(binding_call._initializer["name"])
         if func is None:
             return
-        asyncio.create_task(binding_call.call(func))
+        self._create_task(binding_call.call(func))
 
     def set_default_navigation_timeout(self, timeout: float) -> None:
         self._timeout_settings.set_navigation_timeout(timeout)
@@ -306,19 +305,18 @@ class BrowserContext(ChannelOwner):
             ),
         )
         if len(self._routes) == 1:
-            await self._channel.send(
-                "setNetworkInterceptionEnabled", dict(enabled=True)
-            )
+            await self._interception.enable()
+        else:
+            await self._interception.wait()
 
     async def unroute(
         self, url: URLMatch, handler: Optional[RouteHandlerCallback] = None
     ) -> None:
-        self._routes = list(
-            filter(
-                lambda r: r.matcher.match != url or (handler and r.handler != handler),
-                self._routes,
-            )
-        )
+        self._routes = [
+            route
+            for route in self._routes
+            if route.matcher.match != url or (handler and route.handler != handler)
+        ]
         if len(self._routes) == 0:
             await self._disable_interception()
 
@@ -176,6 +176,7 @@ class BrowserType(ChannelOwner):
         if default_context:
             browser._contexts.append(default_context)
             default_context._browser = browser
+        browser._is_connected_over_cdp = True
         browser._set_browser_type(self)
         return browser
 
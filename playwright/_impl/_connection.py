@@ -18,7 +18,18 @@ import inspect
 import sys
 import traceback
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Union,
+    cast,
+)
 
 from greenlet import greenlet
 from pyee import EventEmitter
@@ -120,6 +131,7 @@ class ChannelOwner(AsyncIOEventEmitter):
             self._parent._objects[guid] = self
 
         self._event_to_subscription_mapping: Dict[str, str] = {}
+        self._pending_tasks: Set[asyncio.Task] = set()
 
     def _dispose(self) -> None:
         # Clean up from parent and connection.
@@ -132,6 +144,14 @@ class ChannelOwner(AsyncIOEventEmitter):
             object._dispose()
         self._objects.clear()
 
+    def _create_task(self, coro: Coroutine) -> asyncio.Task:
+        # The event loop only keeps weak references to tasks, so hold on to the
+        # fire-and-forget ones until they finish.
+        task = self._loop.create_task(coro)
+        self._pending_tasks.add(task)
+        task.add_done_callback(self._pending_tasks.discard)
+        return task
+
     def _adopt(self, child: "ChannelOwner") -> None:
         del cast("ChannelOwner", child._parent)._objects[child._guid]
         self._objects[child._guid] = child
@@ -148,13 +168,15 @@ class ChannelOwner(AsyncIOEventEmitter):
             )
 
     def _add_event_handler(self, event: str, k: Any, v: Any) -> None:
-        if not self.listeners(event):
+        # Only subscription-backed events need the listener count, so check the
+        # mapping first and skip building the listeners list for everything else.
+        if event in self._event_to_subscription_mapping and not self.listeners(event):
             self._update_subscription(event, True)
         super()._add_event_handler(event, k, v)
 
     def remove_listener(self, event: str, f: Any) -> None:
         super().remove_listener(event, f)
-        if not self.listeners(event):
+        if event in self._event_to_subscription_mapping and not self.listeners(event):
             self._update_subscription(event, False)
 
 
@@ -278,9 +300,10 @@ class Connection(EventEmitter):
         id = self._last_id
         callback = ProtocolCallback(self._loop)
         task = asyncio.current_task(self._loop)
+        # Only walk the stack when the sync layer has not captured it already.
+        stack_trace = getattr(task, "__pw_stack_trace__", None)
         callback.stack_trace = cast(
-            traceback.StackSummary,
-            getattr(task, "__pw_stack_trace__", traceback.extract_stack()),
+            traceback.StackSummary, stack_trace or traceback.extract_stack()
         )
         self._callbacks[id] = callback
         message = {
@@ -411,7 +434,7 @@ class Connection(EventEmitter):
         if self._api_zone.get():
             return await cb()
         task = asyncio.current_task(self._loop)
-        st: List[inspect.FrameInfo] = getattr(task, "__pw_stack__", inspect.stack())
+        st: List[inspect.FrameInfo] = getattr(task, "__pw_stack__", None) or _stack()
         metadata = _extract_metadata_from_stack(st, is_internal)
         if metadata:
             self._api_zone.set(metadata)
@@ -426,7 +449,7 @@ class Connection(EventEmitter):
         if self._api_zone.get():
             return cb()
         task = asyncio.current_task(self._loop)
-        st: List[inspect.FrameInfo] = getattr(task, "__pw_stack__", inspect.stack())
+        st: List[inspect.FrameInfo] = getattr(task, "__pw_stack__", None) or _stack()
         metadata = _extract_metadata_from_stack(st, is_internal)
         if metadata:
             self._api_zone.set(metadata)
@@ -436,6 +459,12 @@ class Connection(EventEmitter):
             self._api_zone.set(None)
 
 
+def _stack() -> List[inspect.FrameInfo]:
+    # Only file names, line numbers and frames are used, so skip reading the
+    # source context lines that inspect.stack() loads by default.
+    return inspect.stack(0)[1:]
+
+
 def from_channel(channel: Channel) -> Any:
     return channel._object
 
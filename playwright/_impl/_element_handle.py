@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import base64
+import binascii
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union, cast
@@ -304,7 +304,7 @@ class ElementHandle(JSHandle):
                 )
             )
         encoded_binary = await self._channel.send("screenshot", params)
-        decoded_binary = base64.b64decode(encoded_binary)
+        decoded_binary = binascii.a2b_base64(encoded_binary)
         if path:
             make_dirs_for_file(path)
             await async_writefile(path, decoded_binary)
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import base64
+import binascii
 import json
 import pathlib
 import typing
@@ -421,7 +422,7 @@ class APIResponse:
             )
             if result is None:
                 raise Error("Response has been disposed")
-            return base64.b64decode(result["binary"])
+            return binascii.a2b_base64(result["binary"])
         except Error as exc:
             if is_safe_close_error(exc):
                 raise Error("Response has been disposed")
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import asyncio
 import sys
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Pattern, Set, Union, cast
@@ -121,8 +120,11 @@ class Frame(ChannelOwner):
             self._page.emit("domcontentloaded", self._page)
 
     def _on_frame_navigated(self, event: FrameNavigatedEvent) -> None:
+        old_name = self.name
         self._url = event["url"]
         self._name = event["name"]
+        if self.name != old_name and hasattr(self, "_page") and self._page:
+            self._page._on_frame_renamed(self, old_name)
         self._event_emitter.emit("navigated", event)
         if "error" not in event and hasattr(self, "_page") and self._page:
             self._page.emit("framenavigated", self)
@@ -217,7 +219,7 @@ class Frame(ChannelOwner):
                 return await request.response()
             return None
 
-        return EventContextManagerImpl(asyncio.create_task(continuation()))
+        return EventContextManagerImpl(self._create_task(continuation()))
 
     async def wait_for_url(
         self,
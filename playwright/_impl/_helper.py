@@ -51,6 +51,7 @@ else:  # pragma: no cover
 
 if TYPE_CHECKING:  # pragma: no cover
     from playwright._impl._api_structures import HeadersArray
+    from playwright._impl._connection import Channel
     from playwright._impl._network import Request, Response, Route
 
 URLMatch = Union[str, Pattern[str], Callable[[str], bool]]
@@ -150,9 +151,13 @@ Env = Dict[str, Union[str, float, bool]]
 
 
 class URLMatcher:
+    # Upper bound for the per-matcher cache of regex match results.
+    _max_cached_matches = 1024
+
     def __init__(self, base_url: Union[str, None], match: URLMatch) -> None:
         self._callback: Optional[Callable[[str], bool]] = None
         self._regex_obj: Optional[Pattern[str]] = None
+        self._match_cache: Dict[str, bool] = {}
         if isinstance(match, str):
             if base_url and not match.startswith("*"):
                 match = urljoin(base_url, match)
@@ -168,7 +173,18 @@ class URLMatcher:
         if self._callback:
             return self._callback(url)
         if self._regex_obj:
-            return cast(bool, self._regex_obj.search(url))
+            # Callbacks may be stateful, but a compiled regex is pure, so its
+            # results can be reused for the same URL (e.g. repeated assets).
+            # Only single dict operations are used, so a matcher shared between
+            # threads can at worst recompute a result.
+            cached = self._match_cache.get(url)
+            if cached is not None:
+                return cached
+            result = bool(self._regex_obj.search(url))
+            if len(self._match_cache) >= self._max_cached_matches:
+                self._match_cache.clear()
+            self._match_cache[url] = result
+            return result
         return False
 
 
@@ -241,19 +257,46 @@ def patch_error_message(message: Optional[str]) -> Optional[str]:
 
 
 def locals_to_params(args: Dict) -> Dict:
-    copy = {}
-    for key in args:
-        if key == "self":
-            continue
-        if args[key] is not None:
-            copy[key] = args[key]
-    return copy
+    return {
+        key: value for key, value in args.items() if value is not None and key != "self"
+    }
 
 
 def monotonic_time() -> int:
     return math.floor(time.monotonic() * 1000)
 
 
+class InterceptionEnabler:
+    # Routes registered while interception is being enabled wait for that same
+    # round-trip instead of returning before interception is active.
+    def __init__(self, channel: "Channel") -> None:
+        self._channel = channel
+        self._enabling: Optional[asyncio.Future] = None
+
+    async def enable(self) -> None:
+        enabling = self._enabling = asyncio.get_running_loop().create_future()
+        try:
+            await self._channel.send(
+                "setNetworkInterceptionEnabled", dict(enabled=True)
+            )
+        except Exception as e:
+            enabling.set_exception(e)
+            # Mark it retrieved: there may be no concurrent caller waiting.
+            enabling.exception()
+            raise
+        else:
+            enabling.set_result(None)
+        finally:
+            if not enabling.done():
+                enabling.cancel()
+            if self._enabling is enabling:
+                self._enabling = None
+
+    async def wait(self) -> None:
+        if self._enabling:
+            await self._enabling
+
+
 class RouteHandler:
     def __init__(
         self,
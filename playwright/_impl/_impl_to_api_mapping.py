@@ -40,12 +40,14 @@ class ImplToApiMapping:
     def from_maybe_impl(
         self, obj: Any, visited: Optional[Map[Any, Union[List, Dict]]] = None
     ) -> Any:
+        # Most generated properties return plain values; hand those back before
+        # setting up any of the container bookkeeping below.
+        if not obj or isinstance(obj, (str, int, float, bytes)):
+            return obj
         # Python does share default arguments between calls, so we need to
         # create a new map if it is not provided.
         if not visited:
             visited = Map()
-        if not obj:
-            return obj
         if isinstance(obj, dict):
             if obj in visited:
                 return visited[obj]
@@ -74,6 +76,10 @@ class ImplToApiMapping:
 
     def from_impl(self, obj: Any) -> Any:
         assert obj
+        # Objects that were wrapped before carry their wrapper along.
+        api_instance = getattr(obj, API_ATTR, None)
+        if api_instance:
+            return api_instance
         result = self.from_maybe_impl(obj)
         assert result
         return result
@@ -90,11 +96,11 @@ class ImplToApiMapping:
     def to_impl(
         self, obj: Any, visited: Optional[Map[Any, Union[List, Dict]]] = None
     ) -> Any:
+        if not obj or isinstance(obj, (str, int, float, bytes)):
+            return obj
         if visited is None:
             visited = Map()
         try:
-            if not obj:
-                return obj
             if isinstance(obj, dict):
                 if obj in visited:
                     return visited[obj]
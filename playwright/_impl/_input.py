@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Dict
+
 from playwright._impl._connection import Channel
 from playwright._impl._helper import MouseButton, locals_to_params
 
@@ -23,13 +25,13 @@ class Keyboard:
         self._dispatcher_fiber = channel._connection._dispatcher_fiber
 
     async def down(self, key: str) -> None:
-        await self._channel.send("keyboardDown", locals_to_params(locals()))
+        await self._channel.send("keyboardDown", {"key": key})
 
     async def up(self, key: str) -> None:
-        await self._channel.send("keyboardUp", locals_to_params(locals()))
+        await self._channel.send("keyboardUp", {"key": key})
 
     async def insert_text(self, text: str) -> None:
-        await self._channel.send("keyboardInsertText", locals_to_params(locals()))
+        await self._channel.send("keyboardInsertText", {"text": text})
 
     async def type(self, text: str, delay: float = None) -> None:
         await self._channel.send("keyboardType", locals_to_params(locals()))
@@ -45,7 +47,11 @@ class Mouse:
         self._dispatcher_fiber = channel._connection._dispatcher_fiber
 
     async def move(self, x: float, y: float, steps: int = None) -> None:
-        await self._channel.send("mouseMove", locals_to_params(locals()))
+        # Drags and hovers send moves in bursts, so build the params directly.
+        params: Dict[str, float] = {"x": x, "y": y}
+        if steps is not None:
+            params["steps"] = steps
+        await self._channel.send("mouseMove", params)
 
     async def down(
         self,
@@ -81,7 +87,7 @@ class Mouse:
         await self.click(x, y, delay=delay, button=button, clickCount=2)
 
     async def wheel(self, deltaX: float, deltaY: float) -> None:
-        await self._channel.send("mouseWheel", locals_to_params(locals()))
+        await self._channel.send("mouseWheel", {"deltaX": deltaX, "deltaY": deltaY})
 
 
 class Touchscreen:
@@ -91,4 +97,4 @@ class Touchscreen:
         self._dispatcher_fiber = channel._connection._dispatcher_fiber
 
     async def tap(self, x: float, y: float) -> None:
-        await self._channel.send("touchscreenTap", locals_to_params(locals()))
+        await self._channel.send("touchscreenTap", {"x": x, "y": y})
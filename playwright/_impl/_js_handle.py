@@ -159,6 +159,9 @@ def serialize_value(
 
 
 def serialize_argument(arg: Serializable = None) -> Any:
+    if arg is None:
+        # Most evaluate() calls pass no argument; skip the visitor bookkeeping.
+        return dict(value=dict(v="null"), handles=[])
     handles: List[Channel] = []
     value = serialize_value(arg, handles)
     return dict(value=value, handles=handles)
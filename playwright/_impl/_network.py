@@ -14,12 +14,12 @@
 
 import asyncio
 import base64
+import binascii
 import inspect
 import json
 import mimetypes
 from collections import defaultdict
 from pathlib import Path
-from types import SimpleNamespace
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -28,6 +28,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
     Union,
     cast,
 )
@@ -48,7 +49,11 @@ from playwright._impl._connection import (
     from_nullable_channel,
 )
 from playwright._impl._event_context_manager import EventContextManagerImpl
-from playwright._impl._helper import FallbackOverrideParameters, locals_to_params
+from playwright._impl._helper import (
+    FallbackOverrideParameters,
+    async_readfile,
+    locals_to_params,
+)
 from playwright._impl._wait_helper import WaitHelper
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -93,6 +98,7 @@ class Request(ChannelOwner):
         self._fallback_overrides: FallbackOverrideParameters = (
             FallbackOverrideParameters()
         )
+        self._post_data_json: Optional[Tuple[Any]] = None
 
     def __repr__(self) -> str:
         return f"<Request url={self.url!r} method={self.method!r}>"
@@ -101,6 +107,7 @@ class Request(ChannelOwner):
         self._fallback_overrides = cast(
             FallbackOverrideParameters, {**self._fallback_overrides, **overrides}
         )
+        self._post_data_json = None
 
     @property
     def url(self) -> str:
@@ -131,6 +138,12 @@ class Request(ChannelOwner):
 
     @property
     def post_data_json(self) -> Optional[Any]:
+        # Parsed once per post data; fallback overrides reset the cached value.
+        if self._post_data_json is None:
+            self._post_data_json = (self._parse_post_data_json(),)
+        return self._post_data_json[0]
+
+    def _parse_post_data_json(self) -> Optional[Any]:
         post_data = self.post_data
         if not post_data:
             return None
@@ -287,7 +300,7 @@ class Route(ChannelOwner):
             length = len(body)
         elif path:
             del params["path"]
-            file_content = Path(path).read_bytes()
+            file_content = await async_readfile(path)
             params["body"] = base64.b64encode(file_content).decode()
             params["isBase64"] = True
             length = len(file_content)
@@ -380,14 +393,13 @@ class Route(ChannelOwner):
             # When page closes or crashes, we catch any potential rejects from this Route.
             # Note that page could be missing when routing popup's initial request that
             # does not have a Page initialized just yet.
-            fut = asyncio.create_task(future)
+            fut = self._create_task(future)
             # Rewrite the user's stack to the new task which runs in the background.
             setattr(
                 fut,
                 "__pw_stack__",
-                getattr(
-                    asyncio.current_task(self._loop), "__pw_stack__", inspect.stack()
-                ),
+                getattr(asyncio.current_task(self._loop), "__pw_stack__", None)
+                or inspect.stack(0),
             )
             await asyncio.wait(
                 [fut, page._closed_or_crashed_future],
@@ -482,7 +494,7 @@ class Response(ChannelOwner):
 
     async def body(self) -> bytes:
         binary = await self._channel.send("body")
-        return base64.b64decode(binary)
+        return binascii.a2b_base64(binary)
 
     async def text(self) -> str:
         content = await self.body()
@@ -501,13 +513,11 @@ class Response(ChannelOwner):
 
 
 class WebSocket(ChannelOwner):
-
-    Events = SimpleNamespace(
-        Close="close",
-        FrameReceived="framereceived",
-        FrameSent="framesent",
-        Error="socketerror",
-    )
+    class Events:
+        Close = "close"
+        FrameReceived = "framereceived"
+        FrameSent = "framesent"
+        Error = "socketerror"
 
     def __init__(
         self, parent: ChannelOwner, type: str, guid: str, initializer: Dict
@@ -592,6 +602,7 @@ class RawHeaders:
     def __init__(self, headers: HeadersArray) -> None:
         self._headers_array = headers
         self._headers_map: Dict[str, Dict[str, bool]] = defaultdict(dict)
+        self._headers_dict: Optional[Dict[str, str]] = None
         for header in headers:
             self._headers_map[header["name"].lower()][header["value"]] = True
 
@@ -610,10 +621,17 @@ class RawHeaders:
         return list(self._headers_map[name.lower()].keys())
 
     def headers(self) -> Dict[str, str]:
-        result = {}
-        for name in self._headers_map.keys():
-            result[name] = cast(str, self.get(name))
-        return result
+        # The headers never change once received, so the joined values are reused.
+        # Callers get their own copy from the generated API layer (mapping copies
+        # dicts); impl code must treat the result as read-only.
+        if self._headers_dict is None:
+            result = {}
+            for name in self._headers_map.keys():
+                result[name] = cast(str, self.get(name))
+            if not result:
+                return result
+            self._headers_dict = result
+        return self._headers_dict
 
     def headers_array(self) -> HeadersArray:
         return self._headers_array
@@ -13,12 +13,11 @@
 # limitations under the License.
 
 import asyncio
-import base64
+import binascii
 import inspect
 import re
 import sys
 from pathlib import Path
-from types import SimpleNamespace
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -59,6 +58,7 @@ from playwright._impl._helper import (
     ColorScheme,
     DocumentLoadState,
     ForcedColors,
+    InterceptionEnabler,
     KeyboardModifier,
     MouseButton,
     ReducedMotion,
@@ -102,28 +102,29 @@ if TYPE_CHECKING:  # pragma: no cover
 
 
 class Page(ChannelOwner):
-
-    Events = SimpleNamespace(
-        Close="close",
-        Crash="crash",
-        Console="console",
-        Dialog="dialog",
-        Download="download",
-        FileChooser="filechooser",
-        DOMContentLoaded="domcontentloaded",
-        PageError="pageerror",
-        Request="request",
-        Response="response",
-        RequestFailed="requestfailed",
-        RequestFinished="requestfinished",
-        FrameAttached="frameattached",
-        FrameDetached="framedetached",
-        FrameNavigated="framenavigated",
-        Load="load",
-        Popup="popup",
-        WebSocket="websocket",
-        Worker="worker",
-    )
+    class Events:
+        Close = "close"
+        Crash = "crash"
+        Console = "console"
+        Dialog = "dialog"
+        Download = "download"
+        FileChooser = "filechooser"
+        DOMContentLoaded = "domcontentloaded"
+        PageError = "pageerror"
+        Request = "request"
+        Response = "response"
+        RequestFailed = "requestfailed"
+        RequestFinished = "requestfinished"
+        FrameAttached = "frameattached"
+        FrameDetached = "framedetached"
+        FrameNavigated = "framenavigated"
+        Load = "load"
+        Popup = "popup"
+        WebSocket = "websocket"
+        Worker = "worker"
+
+    # Events that abort any other pending expect_event() wait.
+    _fatal_events = ((Events.Crash, "Page crashed"), (Events.Close, "Page closed"))
     accessibility: Accessibility
     keyboard: Keyboard
     mouse: Mouse
@@ -142,11 +143,18 @@ class Page(ChannelOwner):
         self._main_frame: Frame = from_channel(initializer["mainFrame"])
         self._main_frame._page = self
         self._frames = [self._main_frame]
+        self._frames_snapshot: Optional[List[Frame]] = None
+        self._frames_by_name: Dict[str, List[Frame]] = {
+            self._main_frame.name: [self._main_frame]
+        }
         self._viewport_size: Optional[ViewportSize] = initializer.get("viewportSize")
         self._is_closed = False
         self._workers: List["Worker"] = []
+        self._workers_snapshot: Optional[List["Worker"]] = None
         self._bindings: Dict[str, Any] = {}
         self._routes: List[RouteHandler] = []
+        self._url_matchers: Dict[Union[str, Pattern[str]], URLMatcher] = {}
+        self._interception = InterceptionEnabler(self._channel)
         self._owned_context: Optional["BrowserContext"] = None
         self._timeout_settings: TimeoutSettings = TimeoutSettings(
             self._browser_context._timeout_settings
@@ -154,72 +162,23 @@ class Page(ChannelOwner):
         self._video: Optional[Video] = None
         self._opener = cast("Page", from_nullable_channel(initializer.get("opener")))
 
-        self._channel.on(
-            "bindingCall",
-            lambda params: self._on_binding(from_channel(params["binding"])),
-        )
-        self._channel.on("close", lambda _: self._on_close())
-        self._channel.on(
-            "console",
-            lambda params: self.emit(
-                Page.Events.Console, from_channel(params["message"])
-            ),
-        )
-        self._channel.on("crash", lambda _: self._on_crash())
-        self._channel.on("dialog", lambda params: self._on_dialog(params))
-        self._channel.on("download", lambda params: self._on_download(params))
-        self._channel.on(
-            "fileChooser",
-            lambda params: self.emit(
-                Page.Events.FileChooser,
-                FileChooser(
-                    self, from_channel(params["element"]), params["isMultiple"]
-                ),
-            ),
-        )
-        self._channel.on(
-            "frameAttached",
-            lambda params: self._on_frame_attached(from_channel(params["frame"])),
-        )
-        self._channel.on(
-            "frameDetached",
-            lambda params: self._on_frame_detached(from_channel(params["frame"])),
-        )
-        self._channel.on(
-            "pageError",
-            lambda params: self.emit(
-                Page.Events.PageError, parse_error(params["error"]["error"])
-            ),
-        )
-        self._channel.on(
-            "route",
-            lambda params: asyncio.create_task(
-                self._on_route(from_channel(params["route"]))
-            ),
-        )
-        self._channel.on("video", lambda params: self._on_video(params))
-        self._channel.on(
-            "webSocket",
-            lambda params: self.emit(
-                Page.Events.WebSocket, from_channel(params["webSocket"])
-            ),
-        )
-        self._channel.on(
-            "worker", lambda params: self._on_worker(from_channel(params["worker"]))
-        )
+        self._channel.on("bindingCall", self._on_binding_call_event)
+        self._channel.on("close", self._on_close_event)
+        self._channel.on("console", self._on_console_event)
+        self._channel.on("crash", self._on_crash_event)
+        self._channel.on("dialog", self._on_dialog)
+        self._channel.on("download", self._on_download)
+        self._channel.on("fileChooser", self._on_file_chooser_event)
+        self._channel.on("frameAttached", self._on_frame_attached_event)
+        self._channel.on("frameDetached", self._on_frame_detached_event)
+        self._channel.on("pageError", self._on_page_error_event)
+        self._channel.on("route", self._on_route_event)
+        self._channel.on("video", self._on_video)
+        self._channel.on("webSocket", self._on_web_socket_event)
+        self._channel.on("worker", self._on_worker_event)
         self._closed_or_crashed_future: asyncio.Future = asyncio.Future()
-        self.on(
-            Page.Events.Close,
-            lambda _: self._closed_or_crashed_future.set_result(True)
-            if not self._closed_or_crashed_future.done()
-            else None,
-        )
-        self.on(
-            Page.Events.Crash,
-            lambda _: self._closed_or_crashed_future.set_result(True)
-            if not self._closed_or_crashed_future.done()
-            else None,
-        )
+        self.on(Page.Events.Close, self._on_closed_or_crashed)
+        self.on(Page.Events.Crash, self._on_closed_or_crashed)
 
         self._set_event_to_subscription_mapping(
             {
@@ -234,16 +193,75 @@ class Page(ChannelOwner):
     def __repr__(self) -> str:
         return f"<Page url={self.url!r}>"
 
+    # Protocol event handlers are bound methods rather than per-instance lambdas
+    # so that constructing a Page does not allocate a closure for each event.
+    def _on_binding_call_event(self, params: Any) -> None:
+        self._on_binding(from_channel(params["binding"]))
+
+    def _on_close_event(self, params: Any) -> None:
+        self._on_close()
+
+    def _on_console_event(self, params: Any) -> None:
+        self.emit(Page.Events.Console, from_channel(params["message"]))
+
+    def _on_crash_event(self, params: Any) -> None:
+        self._on_crash()
+
+    def _on_file_chooser_event(self, params: Any) -> None:
+        self.emit(
+            Page.Events.FileChooser,
+            FileChooser(self, from_channel(params["element"]), params["isMultiple"]),
+        )
+
+    def _on_frame_attached_event(self, params: Any) -> None:
+        self._on_frame_attached(from_channel(params["frame"]))
+
+    def _on_frame_detached_event(self, params: Any) -> None:
+        self._on_frame_detached(from_channel(params["frame"]))
+
+    def _on_page_error_event(self, params: Any) -> None:
+        self.emit(Page.Events.PageError, parse_error(params["error"]["error"]))
+
+    def _on_route_event(self, params: Any) -> asyncio.Task:
+        return self._create_task(self._on_route(from_channel(params["route"])))
+
+    def _on_web_socket_event(self, params: Any) -> None:
+        self.emit(Page.Events.WebSocket, from_channel(params["webSocket"]))
+
+    def _on_worker_event(self, params: Any) -> None:
+        self._on_worker(from_channel(params["worker"]))
+
+    def _on_closed_or_crashed(self, page: "Page") -> None:
+        if not self._closed_or_crashed_future.done():
+            self._closed_or_crashed_future.set_result(True)
+
     def _on_frame_attached(self, frame: Frame) -> None:
         frame._page = self
         self._frames.append(frame)
+        self._frames_snapshot = None
+        self._frames_by_name.setdefault(frame.name, []).append(frame)
         self.emit(Page.Events.FrameAttached, frame)
 
     def _on_frame_detached(self, frame: Frame) -> None:
         self._frames.remove(frame)
+        self._frames_snapshot = None
+        same_name = self._frames_by_name.get(frame.name, [])
+        if frame in same_name:
+            same_name.remove(frame)
+        if not same_name:
+            self._frames_by_name.pop(frame.name, None)
         frame._detached = True
         self.emit(Page.Events.FrameDetached, frame)
 
+    def _on_frame_renamed(self, frame: Frame, old_name: str) -> None:
+        # Renames are rare, so rebuild both buckets to keep them in frame order.
+        for name in (old_name, frame.name):
+            same_name = [f for f in self._frames if f.name == name]
+            if same_name:
+                self._frames_by_name[name] = same_name
+            else:
+                self._frames_by_name.pop(name, None)
+
     async def _on_route(self, route: Route) -> None:
         route_handlers = self._routes.copy()
         for route_handler in route_handlers:
@@ -255,7 +273,7 @@ class Page(ChannelOwner):
                 handled = await route_handler.handle(route)
             finally:
                 if len(self._routes) == 0:
-                    asyncio.create_task(self._disable_interception())
+                    self._create_task(self._disable_interception())
             if handled:
                 return
         await self._browser_context._on_route(route)
@@ -263,20 +281,23 @@ class Page(ChannelOwner):
     def _on_binding(self, binding_call: "BindingCall") -> None:
         func = self._bindings.get(binding_call._initializer["name"])
         if func:
-            asyncio.create_task(binding_call.call(func))
+            self._create_task(binding_call.call(func))
         self._browser_context._on_binding(binding_call)
 
     def _on_worker(self, worker: "Worker") -> None:
         self._workers.append(worker)
+        self._workers_snapshot = None
         worker._page = self
         self.emit(Page.Events.Worker, worker)
 
     def _on_close(self) -> None:
         self._is_closed = True
-        if self in self._browser_context._pages:
+        try:
             self._browser_context._pages.remove(self)
-        if self in self._browser_context._background_pages:
-            self._browser_context._background_pages.remove(self)
+        except ValueError:
+            pass
+        self._browser_context._background_pages.discard(self)
+        self._url_matchers.clear()
         self.emit(Page.Events.Close, self)
 
     def _on_crash(self) -> None:
@@ -288,9 +309,9 @@ class Page(ChannelOwner):
             self.emit(Page.Events.Dialog, dialog)
         else:
             if dialog.type == "beforeunload":
-                asyncio.create_task(dialog.accept())
+                self._create_task(dialog.accept())
             else:
-                asyncio.create_task(dialog.dismiss())
+                self._create_task(dialog.dismiss())
 
     def _on_download(self, params: Any) -> None:
         url = params["url"]
@@ -318,6 +339,9 @@ class Page(ChannelOwner):
         return self._main_frame
 
     def frame(self, name: str = None, url: URLMatch = None) -> Optional[Frame]:
+        if name and not url:
+            same_name = self._frames_by_name.get(name)
+            return same_name[0] if same_name else None
         matcher = (
             URLMatcher(self._browser_context._options.get("baseURL"), url)
             if url
@@ -332,7 +356,11 @@ class Page(ChannelOwner):
 
     @property
     def frames(self) -> List[Frame]:
-        return self._frames.copy()
+        # The snapshot is only rebuilt after a frame is attached or detached; the
+        # API layer copies it into a fresh list before handing it to the user.
+        if self._frames_snapshot is None:
+            self._frames_snapshot = self._frames.copy()
+        return self._frames_snapshot
 
     def set_default_navigation_timeout(self, timeout: float) -> None:
         self._timeout_settings.set_navigation_timeout(timeout)
@@ -361,37 +389,51 @@ class Page(ChannelOwner):
         state: Literal["attached", "detached", "hidden", "visible"] = None,
         strict: bool = None,
     ) -> Optional[ElementHandle]:
-        return await self._main_frame.wait_for_selector(**locals_to_params(locals()))
+        return await self._main_frame.wait_for_selector(
+            selector=selector, timeout=timeout, state=state, strict=strict
+        )
 
     async def is_checked(
         self, selector: str, strict: bool = None, timeout: float = None
     ) -> bool:
-        return await self._main_frame.is_checked(**locals_to_params(locals()))
+        return await self._main_frame.is_checked(
+            selector=selector, strict=strict, timeout=timeout
+        )
 
     async def is_disabled(
         self, selector: str, strict: bool = None, timeout: float = None
     ) -> bool:
-        return await self._main_frame.is_disabled(**locals_to_params(locals()))
+        return await self._main_frame.is_disabled(
+            selector=selector, strict=strict, timeout=timeout
+        )
 
     async def is_editable(
         self, selector: str, strict: bool = None, timeout: float = None
     ) -> bool:
-        return await self._main_frame.is_editable(**locals_to_params(locals()))
+        return await self._main_frame.is_editable(
+            selector=selector, strict=strict, timeout=timeout
+        )
 
     async def is_enabled(
         self, selector: str, strict: bool = None, timeout: float = None
     ) -> bool:
-        return await self._main_frame.is_enabled(**locals_to_params(locals()))
+        return await self._main_frame.is_enabled(
+            selector=selector, strict=strict, timeout=timeout
+        )
 
     async def is_hidden(
         self, selector: str, strict: bool = None, timeout: float = None
     ) -> bool:
-        return await self._main_frame.is_hidden(**locals_to_params(locals()))
+        return await self._main_frame.is_hidden(
+            selector=selector, strict=strict, timeout=timeout
+        )
 
     async def is_visible(
         self, selector: str, strict: bool = None, timeout: float = None
     ) -> bool:
-        return await self._main_frame.is_visible(**locals_to_params(locals()))
+        return await self._main_frame.is_visible(
+            selector=selector, strict=strict, timeout=timeout
+        )
 
     async def dispatch_event(
         self,
@@ -401,7 +443,13 @@ class Page(ChannelOwner):
         timeout: float = None,
         strict: bool = None,
     ) -> None:
-        return await self._main_frame.dispatch_event(**locals_to_params(locals()))
+        return await self._main_frame.dispatch_event(
+            selector=selector,
+            type=type,
+            eventInit=eventInit,
+            timeout=timeout,
+            strict=strict,
+        )
 
     async def evaluate(self, expression: str, arg: Serializable = None) -> Any:
         return await self._main_frame.evaluate(expression, arg)
@@ -437,12 +485,14 @@ class Page(ChannelOwner):
         content: str = None,
         type: str = None,
     ) -> ElementHandle:
-        return await self._main_frame.add_script_tag(**locals_to_params(locals()))
+        return await self._main_frame.add_script_tag(
+            url=url, path=path, content=content, type=type
+        )
 
     async def add_style_tag(
         self, url: str = None, path: Union[str, Path] = None, content: str = None
     ) -> ElementHandle:
-        return await self._main_frame.add_style_tag(**locals_to_params(locals()))
+        return await self._main_frame.add_style_tag(url=url, path=path, content=content)
 
     async def expose_function(self, name: str, callback: Callable) -> None:
         await self.expose_binding(name, lambda source, *args: callback(*args))
@@ -479,7 +529,9 @@ class Page(ChannelOwner):
         timeout: float = None,
         waitUntil: DocumentLoadState = None,
     ) -> None:
-        return await self._main_frame.set_content(**locals_to_params(locals()))
+        return await self._main_frame.set_content(
+            html=html, timeout=timeout, waitUntil=waitUntil
+        )
 
     async def goto(
         self,
@@ -488,7 +540,9 @@ class Page(ChannelOwner):
         waitUntil: DocumentLoadState = None,
         referer: str = None,
     ) -> Optional[Response]:
-        return await self._main_frame.goto(**locals_to_params(locals()))
+        return await self._main_frame.goto(
+            url=url, timeout=timeout, waitUntil=waitUntil, referer=referer
+        )
 
     async def reload(
         self,
@@ -504,7 +558,7 @@ class Page(ChannelOwner):
         state: Literal["domcontentloaded", "load", "networkidle"] = None,
         timeout: float = None,
     ) -> None:
-        return await self._main_frame.wait_for_load_state(**locals_to_params(locals()))
+        return await self._main_frame.wait_for_load_state(state=state, timeout=timeout)
 
     async def wait_for_url(
         self,
@@ -512,7 +566,9 @@ class Page(ChannelOwner):
         wait_until: DocumentLoadState = None,
         timeout: float = None,
     ) -> None:
-        return await self._main_frame.wait_for_url(**locals_to_params(locals()))
+        return await self._main_frame.wait_for_url(
+            url=url, wait_until=wait_until, timeout=timeout
+        )
 
     async def wait_for_event(
         self, event: str, predicate: Callable = None, timeout: float = None
@@ -596,19 +652,18 @@ class Page(ChannelOwner):
             ),
         )
         if len(self._routes) == 1:
-            await self._channel.send(
-                "setNetworkInterceptionEnabled", dict(enabled=True)
-            )
+            await self._interception.enable()
+        else:
+            await self._interception.wait()
 
     async def unroute(
         self, url: URLMatch, handler: Optional[RouteHandlerCallback] = None
     ) -> None:
-        self._routes = list(
-            filter(
-                lambda r: r.matcher.match != url or (handler and r.handler != handler),
-                self._routes,
-            )
-        )
+        self._routes = [
+            route
+            for route in self._routes
+            if route.matcher.match != url or (handler and route.handler != handler)
+        ]
         if len(self._routes) == 0:
             await self._disable_interception()
 
@@ -663,7 +718,9 @@ class Page(ChannelOwner):
                 )
             )
         encoded_binary = await self._channel.send("screenshot", params)
-        decoded_binary = base64.b64decode(encoded_binary)
+        # a2b_base64 reads the ASCII str in place, unlike b64decode which first
+        # encodes it into an intermediate bytes copy of the whole payload.
+        decoded_binary = binascii.a2b_base64(encoded_binary)
         if path:
             make_dirs_for_file(path)
             await async_writefile(path, decoded_binary)
@@ -698,7 +755,19 @@ class Page(ChannelOwner):
         trial: bool = None,
         strict: bool = None,
     ) -> None:
-        return await self._main_frame.click(**locals_to_params(locals()))
+        return await self._main_frame.click(
+            selector=selector,
+            modifiers=modifiers,
+            position=position,
+            delay=delay,
+            button=button,
+            clickCount=clickCount,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=noWaitAfter,
+            trial=trial,
+            strict=strict,
+        )
 
     async def dblclick(
         self,
@@ -713,7 +782,18 @@ class Page(ChannelOwner):
         strict: bool = None,
         trial: bool = None,
     ) -> None:
-        return await self._main_frame.dblclick(**locals_to_params(locals()))
+        return await self._main_frame.dblclick(
+            selector=selector,
+            modifiers=modifiers,
+            position=position,
+            delay=delay,
+            button=button,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=noWaitAfter,
+            strict=strict,
+            trial=trial,
+        )
 
     async def tap(
         self,
@@ -726,7 +806,16 @@ class Page(ChannelOwner):
         strict: bool = None,
         trial: bool = None,
     ) -> None:
-        return await self._main_frame.tap(**locals_to_params(locals()))
+        return await self._main_frame.tap(
+            selector=selector,
+            modifiers=modifiers,
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=noWaitAfter,
+            strict=strict,
+            trial=trial,
+        )
 
     async def fill(
         self,
@@ -737,7 +826,14 @@ class Page(ChannelOwner):
         strict: bool = None,
         force: bool = None,
     ) -> None:
-        return await self._main_frame.fill(**locals_to_params(locals()))
+        return await self._main_frame.fill(
+            selector=selector,
+            value=value,
+            timeout=timeout,
+            noWaitAfter=noWaitAfter,
+            strict=strict,
+            force=force,
+        )
 
     def locator(
         self,
@@ -807,27 +903,37 @@ class Page(ChannelOwner):
     async def focus(
         self, selector: str, strict: bool = None, timeout: float = None
     ) -> None:
-        return await self._main_frame.focus(**locals_to_params(locals()))
+        return await self._main_frame.focus(
+            selector=selector, strict=strict, timeout=timeout
+        )
 
     async def text_content(
         self, selector: str, strict: bool = None, timeout: float = None
     ) -> Optional[str]:
-        return await self._main_frame.text_content(**locals_to_params(locals()))
+        return await self._main_frame.text_content(
+            selector=selector, strict=strict, timeout=timeout
+        )
 
     async def inner_text(
         self, selector: str, strict: bool = None, timeout: float = None
     ) -> str:
-        return await self._main_frame.inner_text(**locals_to_params(locals()))
+        return await self._main_frame.inner_text(
+            selector=selector, strict=strict, timeout=timeout
+        )
 
     async def inner_html(
         self, selector: str, strict: bool = None, timeout: float = None
     ) -> str:
-        return await self._main_frame.inner_html(**locals_to_params(locals()))
+        return await self._main_frame.inner_html(
+            selector=selector, strict=strict, timeout=timeout
+        )
 
     async def get_attribute(
         self, selector: str, name: str, strict: bool = None, timeout: float = None
     ) -> Optional[str]:
-        return await self._main_frame.get_attribute(**locals_to_params(locals()))
+        return await self._main_frame.get_attribute(
+            selector=selector, name=name, strict=strict, timeout=timeout
+        )
 
     async def hover(
         self,
@@ -840,7 +946,16 @@ class Page(ChannelOwner):
         strict: bool = None,
         trial: bool = None,
     ) -> None:
-        return await self._main_frame.hover(**locals_to_params(locals()))
+        return await self._main_frame.hover(
+            selector=selector,
+            modifiers=modifiers,
+            position=position,
+            timeout=timeout,
+            noWaitAfter=noWaitAfter,
+            force=force,
+            strict=strict,
+            trial=trial,
+        )
 
     async def drag_and_drop(
         self,
@@ -854,7 +969,17 @@ class Page(ChannelOwner):
         strict: bool = None,
         trial: bool = None,
     ) -> None:
-        return await self._main_frame.drag_and_drop(**locals_to_params(locals()))
+        return await self._main_frame.drag_and_drop(
+            source=source,
+            target=target,
+            sourcePosition=sourcePosition,
+            targetPosition=targetPosition,
+            force=force,
+            noWaitAfter=noWaitAfter,
+            timeout=timeout,
+            strict=strict,
+            trial=trial,
+        )
 
     async def select_option(
         self,
@@ -868,14 +993,24 @@ class Page(ChannelOwner):
         force: bool = None,
         strict: bool = None,
     ) -> List[str]:
-        params = locals_to_params(locals())
-        return await self._main_frame.select_option(**params)
+        return await self._main_frame.select_option(
+            selector=selector,
+            value=value,
+            index=index,
+            label=label,
+            element=element,
+            timeout=timeout,
+            noWaitAfter=noWaitAfter,
+            force=force,
+            strict=strict,
+        )
 
     async def input_value(
         self, selector: str, strict: bool = None, timeout: float = None
     ) -> str:
-        params = locals_to_params(locals())
-        return await self._main_frame.input_value(**params)
+        return await self._main_frame.input_value(
+            selector=selector, strict=strict, timeout=timeout
+        )
 
     async def set_input_files(
         self,
@@ -885,7 +1020,13 @@ class Page(ChannelOwner):
         strict: bool = None,
         noWaitAfter: bool = None,
     ) -> None:
-        return await self._main_frame.set_input_files(**locals_to_params(locals()))
+        return await self._main_frame.set_input_files(
+            selector=selector,
+            files=files,
+            timeout=timeout,
+            strict=strict,
+            noWaitAfter=noWaitAfter,
+        )
 
     async def type(
         self,
@@ -896,7 +1037,14 @@ class Page(ChannelOwner):
         noWaitAfter: bool = None,
         strict: bool = None,
     ) -> None:
-        return await self._main_frame.type(**locals_to_params(locals()))
+        return await self._main_frame.type(
+            selector=selector,
+            text=text,
+            delay=delay,
+            timeout=timeout,
+            noWaitAfter=noWaitAfter,
+            strict=strict,
+        )
 
     async def press(
         self,
@@ -907,7 +1055,14 @@ class Page(ChannelOwner):
         noWaitAfter: bool = None,
         strict: bool = None,
     ) -> None:
-        return await self._main_frame.press(**locals_to_params(locals()))
+        return await self._main_frame.press(
+            selector=selector,
+            key=key,
+            delay=delay,
+            timeout=timeout,
+            noWaitAfter=noWaitAfter,
+            strict=strict,
+        )
 
     async def check(
         self,
@@ -919,7 +1074,15 @@ class Page(ChannelOwner):
         strict: bool = None,
         trial: bool = None,
     ) -> None:
-        return await self._main_frame.check(**locals_to_params(locals()))
+        return await self._main_frame.check(
+            selector=selector,
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=noWaitAfter,
+            strict=strict,
+            trial=trial,
+        )
 
     async def uncheck(
         self,
@@ -931,7 +1094,15 @@ class Page(ChannelOwner):
         strict: bool = None,
         trial: bool = None,
     ) -> None:
-        return await self._main_frame.uncheck(**locals_to_params(locals()))
+        return await self._main_frame.uncheck(
+            selector=selector,
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=noWaitAfter,
+            strict=strict,
+            trial=trial,
+        )
 
     async def wait_for_timeout(self, timeout: float) -> None:
         await self._main_frame.wait_for_timeout(timeout)
@@ -943,11 +1114,15 @@ class Page(ChannelOwner):
         timeout: float = None,
         polling: Union[float, Literal["raf"]] = None,
     ) -> JSHandle:
-        return await self._main_frame.wait_for_function(**locals_to_params(locals()))
+        return await self._main_frame.wait_for_function(
+            expression=expression, arg=arg, timeout=timeout, polling=polling
+        )
 
     @property
     def workers(self) -> List["Worker"]:
-        return self._workers.copy()
+        if self._workers_snapshot is None:
+            self._workers_snapshot = self._workers.copy()
+        return self._workers_snapshot
 
     @property
     def request(self) -> "APIRequestContext":
@@ -976,7 +1151,7 @@ class Page(ChannelOwner):
         if "path" in params:
             del params["path"]
         encoded_binary = await self._channel.send("pdf", params)
-        decoded_binary = base64.b64decode(encoded_binary)
+        decoded_binary = binascii.a2b_base64(encoded_binary)
         if path:
             make_dirs_for_file(path)
             await async_writefile(path, decoded_binary)
@@ -1015,10 +1190,9 @@ class Page(ChannelOwner):
         )
         if log_line:
             wait_helper.log(log_line)
-        if event != Page.Events.Crash:
-            wait_helper.reject_on_event(self, Page.Events.Crash, Error("Page crashed"))
-        if event != Page.Events.Close:
-            wait_helper.reject_on_event(self, Page.Events.Close, Error("Page closed"))
+        for fatal_event, message in self._fatal_events:
+            if event != fatal_event:
+                wait_helper.reject_on_event(self, fatal_event, Error(message))
         wait_helper.wait_for_event(self, event, predicate)
         return EventContextManagerImpl(wait_helper.result())
 
@@ -1058,17 +1232,24 @@ class Page(ChannelOwner):
     ) -> EventContextManagerImpl["Page"]:
         return self.expect_event(Page.Events.Popup, predicate, timeout)
 
+    def _url_matcher(self, url: Union[str, Pattern[str]]) -> URLMatcher:
+        # expect_request/expect_response are often called in a loop with the same
+        # pattern; reuse the compiled matcher (and its match cache) between calls.
+        matcher = self._url_matchers.get(url)
+        if matcher is None:
+            if len(self._url_matchers) >= 64:
+                self._url_matchers.clear()
+            matcher = URLMatcher(self._browser_context._options.get("baseURL"), url)
+            self._url_matchers[url] = matcher
+        return matcher
+
     def expect_request(
         self,
         url_or_predicate: URLMatchRequest,
         timeout: float = None,
     ) -> EventContextManagerImpl[Request]:
         matcher = (
-            None
-            if callable(url_or_predicate)
-            else URLMatcher(
-                self._browser_context._options.get("baseURL"), url_or_predicate
-            )
+            None if callable(url_or_predicate) else self._url_matcher(url_or_predicate)
         )
         predicate = url_or_predicate if callable(url_or_predicate) else None
 
@@ -1103,11 +1284,7 @@ class Page(ChannelOwner):
         timeout: float = None,
     ) -> EventContextManagerImpl[Response]:
         matcher = (
-            None
-            if callable(url_or_predicate)
-            else URLMatcher(
-                self._browser_context._options.get("baseURL"), url_or_predicate
-            )
+            None if callable(url_or_predicate) else self._url_matcher(url_or_predicate)
         )
         predicate = url_or_predicate if callable(url_or_predicate) else None
 
@@ -1175,38 +1352,43 @@ class Page(ChannelOwner):
 
 
 class Worker(ChannelOwner):
-    Events = SimpleNamespace(Close="close")
+    class Events:
+        Close = "close"
 
     def __init__(
         self, parent: ChannelOwner, type: str, guid: str, initializer: Dict
     ) -> None:
         super().__init__(parent, type, guid, initializer)
-        self._channel.on("close", lambda _: self._on_close())
+        self._channel.on("close", self._on_close_event)
         self._page: Optional[Page] = None
         self._context: Optional["BrowserContext"] = None
+        self._url: str = initializer["url"]
 
     def __repr__(self) -> str:
         return f"<Worker url={self.url!r}>"
 
+    def _on_close_event(self, params: Any) -> None:
+        self._on_close()
+
     def _on_close(self) -> None:
-        if self._page:
-            self._page._workers.remove(self)
-        if self._context:
-            self._context._service_workers.remove(self)
+        # A worker belongs either to a page (dedicated) or to a context (service).
+        page = self._page
+        if page:
+            page._workers.remove(self)
+            page._workers_snapshot = None
+        elif self._context:
+            self._context._service_workers.discard(self)
         self.emit(Worker.Events.Close, self)
 
     @property
     def url(self) -> str:
-        return self._initializer["url"]
+        return self._url
 
     async def evaluate(self, expression: str, arg: Serializable = None) -> Any:
         return parse_result(
             await self._channel.send(
                 "evaluateExpression",
-                dict(
-                    expression=expression,
-                    arg=serialize_argument(arg),
-                ),
+                {"expression": expression, "arg": serialize_argument(arg)},
             )
         )
 
@@ -1216,10 +1398,7 @@ class Worker(ChannelOwner):
         return from_channel(
             await self._channel.send(
                 "evaluateExpressionHandle",
-                dict(
-                    expression=expression,
-                    arg=serialize_argument(arg),
-                ),
+                {"expression": expression, "arg": serialize_argument(arg)},
             )
         )
 
@@ -1232,23 +1411,24 @@ class BindingCall(ChannelOwner):
 
     async def call(self, func: Callable) -> None:
         try:
-            frame = from_channel(self._initializer["frame"])
-            source = dict(context=frame._page.context, page=frame._page, frame=frame)
-            if self._initializer.get("handle"):
-                result = func(source, from_channel(self._initializer["handle"]))
+            initializer = self._initializer
+            frame = from_channel(initializer["frame"])
+            page = frame._page
+            source = {"context": page.context, "page": page, "frame": frame}
+            if initializer.get("handle"):
+                result = func(source, from_channel(initializer["handle"]))
             else:
-                func_args = list(map(parse_result, self._initializer["args"]))
+                func_args = [parse_result(arg) for arg in initializer["args"]]
                 result = func(source, *func_args)
             if inspect.iscoroutine(result):
                 result = await result
-            await self._channel.send("resolve", dict(result=serialize_argument(result)))
+            await self._channel.send("resolve", {"result": serialize_argument(result)})
+            return
         except Exception as e:
-            tb = sys.exc_info()[2]
-            asyncio.create_task(
-                self._channel.send(
-                    "reject", dict(error=dict(error=serialize_error(e, tb)))
-                )
-            )
+            error = serialize_error(e, e.__traceback__)
+        # Reject outside of the except block so that the exception and the frames
+        # of its traceback are not kept alive while waiting for the reply.
+        await self._channel.send("reject", {"error": {"error": error}})
 
 
 def trim_url(param: Union[URLMatchRequest, URLMatchResponse]) -> Optional[str]:
@@ -45,15 +45,26 @@ async def convert_input_files(
             "Cannot set buffer larger than 50Mb, please write it to a file and pass its path instead."
         )
 
-    has_large_file = any(
-        [
-            os.stat(f).st_size > SIZE_LIMIT_IN_BYTES
-            for f in file_list
-            if isinstance(f, (str, Path))
-        ]
-    )
+    # Also raises for missing files before anything is sent to the driver.
+    file_sizes = [os.stat(f).st_size for f in file_list if isinstance(f, (str, Path))]
+    is_remote = context._channel._connection.is_remote
+    browser = context._browser
+    # A driver that launched the browser itself can read the files directly, so
+    # skip reading and base64-encoding them into the protocol message. A browser
+    # attached over CDP may run on another host and needs the contents.
+    if (
+        not is_remote
+        and not (browser and browser._is_connected_over_cdp)
+        and file_list
+        and len(file_sizes) == len(file_list)
+    ):
+        return InputFilesList(
+            streams=None, localPaths=_to_local_paths(file_list), files=None
+        )
+
+    has_large_file = any([size > SIZE_LIMIT_IN_BYTES for size in file_sizes])
     if has_large_file:
-        if context._channel._connection.is_remote:
+        if is_remote:
             streams = []
             for file in file_list:
                 assert isinstance(file, (str, Path))
@@ -65,17 +76,23 @@ async def convert_input_files(
                 await stream.copy(file)
                 streams.append(stream._channel)
             return InputFilesList(streams=streams, localPaths=None, files=None)
-        local_paths = []
-        for p in file_list:
-            assert isinstance(p, (str, Path))
-            local_paths.append(str(Path(p).absolute().resolve()))
-        return InputFilesList(streams=None, localPaths=local_paths, files=None)
+        return InputFilesList(
+            streams=None, localPaths=_to_local_paths(file_list), files=None
+        )
 
     return InputFilesList(
         streams=None, localPaths=None, files=await _normalize_file_payloads(files)
     )
 
 
+def _to_local_paths(file_list: List) -> List[str]:
+    local_paths = []
+    for p in file_list:
+        assert isinstance(p, (str, Path))
+        local_paths.append(str(Path(p).absolute().resolve()))
+    return local_paths
+
+
 async def _normalize_file_payloads(
     files: Union[str, Path, FilePayload, List[Union[str, Path]], List[FilePayload]]
 ) -> List:
@@ -94,7 +94,7 @@ class SyncBase(ImplWrapper):
         __tracebackhide__ = True
         g_self = greenlet.getcurrent()
         task: asyncio.tasks.Task[Any] = self._loop.create_task(coro)
-        setattr(task, "__pw_stack__", inspect.stack())
+        setattr(task, "__pw_stack__", inspect.stack(0))
         setattr(task, "__pw_stack_trace__", traceback.extract_stack())
 
         task.add_done_callback(lambda _: g_self.switch())
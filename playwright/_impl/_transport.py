@@ -20,11 +20,16 @@ import subprocess
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Callable, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
 from playwright._impl._driver import get_driver_env
 from playwright._impl._helper import ParsedMessagePayload
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
 
 # Sourced from: https://github.com/pytest-dev/pytest/blob/da01ee0a4bb0af780167ecd228ab3ad249511302/src/_pytest/faulthandler.py#L69-L77
 def _get_stderr_fileno() -> Optional[int]:
@@ -76,19 +81,36 @@ class Transport(ABC):
         pass
 
     def serialize_message(self, message: Dict) -> bytes:
-        msg = json.dumps(message)
         if "DEBUGP" in os.environ:  # pragma: no cover
             print("\x1b[32mSEND>\x1b[0m", json.dumps(message, indent=2))
-        return msg.encode()
+        if orjson:
+            try:
+                return orjson.dumps(message)
+            except orjson.JSONEncodeError:
+                # e.g. integers beyond 64 bits or lone surrogates, which the
+                # stdlib encoder still accepts.
+                pass
+        return json.dumps(message).encode()
 
     def deserialize_message(self, data: Union[str, bytes]) -> ParsedMessagePayload:
-        obj = json.loads(data)
+        obj = _loads(data)
 
         if "DEBUGP" in os.environ:  # pragma: no cover
             print("\x1b[33mRECV>\x1b[0m", json.dumps(obj, indent=2))
         return obj
 
 
+def _loads(data: Union[str, bytes]) -> Any:
+    if orjson:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects escaped lone surrogates, which JavaScript strings
+            # can legitimately contain.
+            pass
+    return json.loads(data)
+
+
 class PipeTransport(Transport):
     def __init__(
         self, loop: asyncio.AbstractEventLoop, driver_executable: Path
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
 
 import pathlib
 import sys
@@ -96,7 +97,7 @@ class Request(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     @property
     def resource_type(self) -> str:
@@ -110,7 +111,7 @@ class Request(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.resource_type)
+        return self._impl_obj.resource_type
 
     @property
     def method(self) -> str:
@@ -122,7 +123,7 @@ class Request(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.method)
+        return self._impl_obj.method
 
     @property
     def post_data(self) -> typing.Optional[str]:
@@ -134,7 +135,7 @@ class Request(AsyncBase):
         -------
         Union[str, None]
         """
-        return mapping.from_maybe_impl(self._impl_obj.post_data)
+        return self._impl_obj.post_data
 
     @property
     def post_data_json(self) -> typing.Optional[typing.Any]:
@@ -161,7 +162,7 @@ class Request(AsyncBase):
         -------
         Union[bytes, None]
         """
-        return mapping.from_maybe_impl(self._impl_obj.post_data_buffer)
+        return self._impl_obj.post_data_buffer
 
     @property
     def frame(self) -> "Frame":
@@ -239,7 +240,7 @@ class Request(AsyncBase):
         -------
         Union[str, None]
         """
-        return mapping.from_maybe_impl(self._impl_obj.failure)
+        return self._impl_obj.failure
 
     @property
     def timing(self) -> ResourceTiming:
@@ -369,7 +370,7 @@ class Response(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     @property
     def ok(self) -> bool:
@@ -381,7 +382,7 @@ class Response(AsyncBase):
         -------
         bool
         """
-        return mapping.from_maybe_impl(self._impl_obj.ok)
+        return self._impl_obj.ok
 
     @property
     def status(self) -> int:
@@ -393,7 +394,7 @@ class Response(AsyncBase):
         -------
         int
         """
-        return mapping.from_maybe_impl(self._impl_obj.status)
+        return self._impl_obj.status
 
     @property
     def status_text(self) -> str:
@@ -405,7 +406,7 @@ class Response(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.status_text)
+        return self._impl_obj.status_text
 
     @property
     def headers(self) -> typing.Dict[str, str]:
@@ -432,7 +433,7 @@ class Response(AsyncBase):
         -------
         bool
         """
-        return mapping.from_maybe_impl(self._impl_obj.from_service_worker)
+        return self._impl_obj.from_service_worker
 
     @property
     def request(self) -> "Request":
@@ -549,7 +550,7 @@ class Response(AsyncBase):
         Waits for this response to finish, returns always `null`.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.finished())
+        return await self._impl_obj.finished()
 
     async def body(self) -> bytes:
         """Response.body
@@ -633,7 +634,7 @@ class Route(AsyncBase):
             - `'failed'` - A generic failure occurred.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.abort(errorCode=error_code))
+        return await self._impl_obj.abort(errorCode=error_code)
 
     async def fulfill(
         self,
@@ -643,7 +644,7 @@ class Route(AsyncBase):
         body: typing.Optional[typing.Union[str, bytes]] = None,
         path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
         content_type: typing.Optional[str] = None,
-        response: typing.Optional["APIResponse"] = None
+        response: typing.Optional["APIResponse"] = None,
     ) -> None:
         """Route.fulfill
 
@@ -682,15 +683,13 @@ class Route(AsyncBase):
             using fulfill options.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.fulfill(
-                status=status,
-                headers=mapping.to_impl(headers),
-                body=body,
-                path=path,
-                contentType=content_type,
-                response=response._impl_obj if response else None,
-            )
+        return await self._impl_obj.fulfill(
+            status=status,
+            headers=mapping.to_impl(headers),
+            body=body,
+            path=path,
+            contentType=content_type,
+            response=response._impl_obj if response else None,
         )
 
     async def fallback(
@@ -699,7 +698,7 @@ class Route(AsyncBase):
         url: typing.Optional[str] = None,
         method: typing.Optional[str] = None,
         headers: typing.Optional[typing.Dict[str, str]] = None,
-        post_data: typing.Optional[typing.Union[str, bytes]] = None
+        post_data: typing.Optional[typing.Union[str, bytes]] = None,
     ) -> None:
         """Route.fallback
 
@@ -767,13 +766,8 @@ class Route(AsyncBase):
             If set changes the post data of request
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.fallback(
-                url=url,
-                method=method,
-                headers=mapping.to_impl(headers),
-                postData=post_data,
-            )
+        return await self._impl_obj.fallback(
+            url=url, method=method, headers=mapping.to_impl(headers), postData=post_data
         )
 
     async def continue_(
@@ -782,7 +776,7 @@ class Route(AsyncBase):
         url: typing.Optional[str] = None,
         method: typing.Optional[str] = None,
         headers: typing.Optional[typing.Dict[str, str]] = None,
-        post_data: typing.Optional[typing.Union[str, bytes]] = None
+        post_data: typing.Optional[typing.Union[str, bytes]] = None,
     ) -> None:
         """Route.continue_
 
@@ -813,13 +807,8 @@ class Route(AsyncBase):
             If set changes the post data of request
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.continue_(
-                url=url,
-                method=method,
-                headers=mapping.to_impl(headers),
-                postData=post_data,
-            )
+        return await self._impl_obj.continue_(
+            url=url, method=method, headers=mapping.to_impl(headers), postData=post_data
         )
 
 
@@ -931,14 +920,14 @@ class WebSocket(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     def expect_event(
         self,
         event: str,
         predicate: typing.Optional[typing.Callable] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> AsyncEventContextManager:
         """WebSocket.expect_event
 
@@ -971,7 +960,7 @@ class WebSocket(AsyncBase):
         event: str,
         predicate: typing.Optional[typing.Callable] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Any:
         """WebSocket.wait_for_event
 
@@ -1053,7 +1042,7 @@ class Keyboard(AsyncBase):
             Name of the key to press or a character to generate, such as `ArrowLeft` or `a`.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.down(key=key))
+        return await self._impl_obj.down(key=key)
 
     async def up(self, key: str) -> None:
         """Keyboard.up
@@ -1066,7 +1055,7 @@ class Keyboard(AsyncBase):
             Name of the key to press or a character to generate, such as `ArrowLeft` or `a`.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.up(key=key))
+        return await self._impl_obj.up(key=key)
 
     async def insert_text(self, text: str) -> None:
         """Keyboard.insert_text
@@ -1085,7 +1074,7 @@ class Keyboard(AsyncBase):
             Sets input to the specified text value.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.insert_text(text=text))
+        return await self._impl_obj.insert_text(text=text)
 
     async def type(self, text: str, *, delay: typing.Optional[float] = None) -> None:
         """Keyboard.type
@@ -1110,9 +1099,7 @@ class Keyboard(AsyncBase):
             Time to wait between key presses in milliseconds. Defaults to 0.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.type(text=text, delay=delay)
-        )
+        return await self._impl_obj.type(text=text, delay=delay)
 
     async def press(self, key: str, *, delay: typing.Optional[float] = None) -> None:
         """Keyboard.press
@@ -1156,7 +1143,7 @@ class Keyboard(AsyncBase):
             Time to wait between `keydown` and `keyup` in milliseconds. Defaults to 0.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.press(key=key, delay=delay))
+        return await self._impl_obj.press(key=key, delay=delay)
 
 
 mapping.register(KeyboardImpl, Keyboard)
@@ -1178,13 +1165,13 @@ class Mouse(AsyncBase):
             Defaults to 1. Sends intermediate `mousemove` events.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.move(x=x, y=y, steps=steps))
+        return await self._impl_obj.move(x=x, y=y, steps=steps)
 
     async def down(
         self,
         *,
         button: typing.Optional[Literal["left", "middle", "right"]] = None,
-        click_count: typing.Optional[int] = None
+        click_count: typing.Optional[int] = None,
     ) -> None:
         """Mouse.down
 
@@ -1198,15 +1185,13 @@ class Mouse(AsyncBase):
             defaults to 1. See [UIEvent.detail].
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.down(button=button, clickCount=click_count)
-        )
+        return await self._impl_obj.down(button=button, clickCount=click_count)
 
     async def up(
         self,
         *,
         button: typing.Optional[Literal["left", "middle", "right"]] = None,
-        click_count: typing.Optional[int] = None
+        click_count: typing.Optional[int] = None,
     ) -> None:
         """Mouse.up
 
@@ -1220,9 +1205,7 @@ class Mouse(AsyncBase):
             defaults to 1. See [UIEvent.detail].
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.up(button=button, clickCount=click_count)
-        )
+        return await self._impl_obj.up(button=button, clickCount=click_count)
 
     async def click(
         self,
@@ -1231,7 +1214,7 @@ class Mouse(AsyncBase):
         *,
         delay: typing.Optional[float] = None,
         button: typing.Optional[Literal["left", "middle", "right"]] = None,
-        click_count: typing.Optional[int] = None
+        click_count: typing.Optional[int] = None,
     ) -> None:
         """Mouse.click
 
@@ -1249,10 +1232,8 @@ class Mouse(AsyncBase):
             defaults to 1. See [UIEvent.detail].
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.click(
-                x=x, y=y, delay=delay, button=button, clickCount=click_count
-            )
+        return await self._impl_obj.click(
+            x=x, y=y, delay=delay, button=button, clickCount=click_count
         )
 
     async def dblclick(
@@ -1261,7 +1242,7 @@ class Mouse(AsyncBase):
         y: float,
         *,
         delay: typing.Optional[float] = None,
-        button: typing.Optional[Literal["left", "middle", "right"]] = None
+        button: typing.Optional[Literal["left", "middle", "right"]] = None,
     ) -> None:
         """Mouse.dblclick
 
@@ -1278,9 +1259,7 @@ class Mouse(AsyncBase):
             Defaults to `left`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.dblclick(x=x, y=y, delay=delay, button=button)
-        )
+        return await self._impl_obj.dblclick(x=x, y=y, delay=delay, button=button)
 
     async def wheel(self, delta_x: float, delta_y: float) -> None:
         """Mouse.wheel
@@ -1298,9 +1277,7 @@ class Mouse(AsyncBase):
             Pixels to scroll vertically.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.wheel(deltaX=delta_x, deltaY=delta_y)
-        )
+        return await self._impl_obj.wheel(deltaX=delta_x, deltaY=delta_y)
 
 
 mapping.register(MouseImpl, Mouse)
@@ -1318,7 +1295,7 @@ class Touchscreen(AsyncBase):
         y : float
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.tap(x=x, y=y))
+        return await self._impl_obj.tap(x=x, y=y)
 
 
 mapping.register(TouchscreenImpl, Touchscreen)
@@ -1455,7 +1432,7 @@ class JSHandle(AsyncBase):
         The `jsHandle.dispose` method stops referencing the element handle.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.dispose())
+        return await self._impl_obj.dispose()
 
     async def json_value(self) -> typing.Any:
         """JSHandle.json_value
@@ -1679,10 +1656,8 @@ class ElementHandle(JSHandle):
             Optional event-specific initialization properties.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.dispatch_event(
-                type=type, eventInit=mapping.to_impl(event_init)
-            )
+        return await self._impl_obj.dispatch_event(
+            type=type, eventInit=mapping.to_impl(event_init)
         )
 
     async def scroll_into_view_if_needed(
@@ -1704,9 +1679,7 @@ class ElementHandle(JSHandle):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.scroll_into_view_if_needed(timeout=timeout)
-        )
+        return await self._impl_obj.scroll_into_view_if_needed(timeout=timeout)
 
     async def hover(
         self,
@@ -1718,7 +1691,7 @@ class ElementHandle(JSHandle):
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
         force: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.hover
 
@@ -1755,15 +1728,13 @@ class ElementHandle(JSHandle):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.hover(
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                timeout=timeout,
-                noWaitAfter=no_wait_after,
-                force=force,
-                trial=trial,
-            )
+        return await self._impl_obj.hover(
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            timeout=timeout,
+            noWaitAfter=no_wait_after,
+            force=force,
+            trial=trial,
         )
 
     async def click(
@@ -1779,7 +1750,7 @@ class ElementHandle(JSHandle):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.click
 
@@ -1822,18 +1793,16 @@ class ElementHandle(JSHandle):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.click(
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                delay=delay,
-                button=button,
-                clickCount=click_count,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                trial=trial,
-            )
+        return await self._impl_obj.click(
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            delay=delay,
+            button=button,
+            clickCount=click_count,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            trial=trial,
         )
 
     async def dblclick(
@@ -1848,7 +1817,7 @@ class ElementHandle(JSHandle):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.dblclick
 
@@ -1892,17 +1861,15 @@ class ElementHandle(JSHandle):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.dblclick(
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                delay=delay,
-                button=button,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                trial=trial,
-            )
+        return await self._impl_obj.dblclick(
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            delay=delay,
+            button=button,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            trial=trial,
         )
 
     async def select_option(
@@ -1916,7 +1883,7 @@ class ElementHandle(JSHandle):
         ] = None,
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> typing.List[str]:
         """ElementHandle.select_option
 
@@ -1989,7 +1956,7 @@ class ElementHandle(JSHandle):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.tap
 
@@ -2028,15 +1995,13 @@ class ElementHandle(JSHandle):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.tap(
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                trial=trial,
-            )
+        return await self._impl_obj.tap(
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            trial=trial,
         )
 
     async def fill(
@@ -2045,7 +2010,7 @@ class ElementHandle(JSHandle):
         *,
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
-        force: typing.Optional[bool] = None
+        force: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.fill
 
@@ -2074,17 +2039,15 @@ class ElementHandle(JSHandle):
             Whether to bypass the [actionability](../actionability.md) checks. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.fill(
-                value=value, timeout=timeout, noWaitAfter=no_wait_after, force=force
-            )
+        return await self._impl_obj.fill(
+            value=value, timeout=timeout, noWaitAfter=no_wait_after, force=force
         )
 
     async def select_text(
         self,
         *,
         force: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """ElementHandle.select_text
 
@@ -2104,9 +2067,7 @@ class ElementHandle(JSHandle):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.select_text(force=force, timeout=timeout)
-        )
+        return await self._impl_obj.select_text(force=force, timeout=timeout)
 
     async def input_value(self, *, timeout: typing.Optional[float] = None) -> str:
         """ElementHandle.input_value
@@ -2142,7 +2103,7 @@ class ElementHandle(JSHandle):
         ],
         *,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.set_input_files
 
@@ -2166,10 +2127,8 @@ class ElementHandle(JSHandle):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_input_files(
-                files=mapping.to_impl(files), timeout=timeout, noWaitAfter=no_wait_after
-            )
+        return await self._impl_obj.set_input_files(
+            files=mapping.to_impl(files), timeout=timeout, noWaitAfter=no_wait_after
         )
 
     async def focus(self) -> None:
@@ -2178,7 +2137,7 @@ class ElementHandle(JSHandle):
         Calls [focus](https://developer.mozilla.org/en-US/docs/Web/API/HTMLElement/focus) on the element.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.focus())
+        return await self._impl_obj.focus()
 
     async def type(
         self,
@@ -2186,7 +2145,7 @@ class ElementHandle(JSHandle):
         *,
         delay: typing.Optional[float] = None,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.type
 
@@ -2222,10 +2181,8 @@ class ElementHandle(JSHandle):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.type(
-                text=text, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
-            )
+        return await self._impl_obj.type(
+            text=text, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
         )
 
     async def press(
@@ -2234,7 +2191,7 @@ class ElementHandle(JSHandle):
         *,
         delay: typing.Optional[float] = None,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.press
 
@@ -2272,10 +2229,8 @@ class ElementHandle(JSHandle):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.press(
-                key=key, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
-            )
+        return await self._impl_obj.press(
+            key=key, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
         )
 
     async def set_checked(
@@ -2286,7 +2241,7 @@ class ElementHandle(JSHandle):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.set_checked
 
@@ -2324,15 +2279,13 @@ class ElementHandle(JSHandle):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_checked(
-                checked=checked,
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                trial=trial,
-            )
+        return await self._impl_obj.set_checked(
+            checked=checked,
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            trial=trial,
         )
 
     async def check(
@@ -2342,7 +2295,7 @@ class ElementHandle(JSHandle):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.check
 
@@ -2379,14 +2332,12 @@ class ElementHandle(JSHandle):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.check(
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                trial=trial,
-            )
+        return await self._impl_obj.check(
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            trial=trial,
         )
 
     async def uncheck(
@@ -2396,7 +2347,7 @@ class ElementHandle(JSHandle):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.uncheck
 
@@ -2433,14 +2384,12 @@ class ElementHandle(JSHandle):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.uncheck(
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                trial=trial,
-            )
+        return await self._impl_obj.uncheck(
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            trial=trial,
         )
 
     async def bounding_box(self) -> typing.Optional[FloatRect]:
@@ -2482,7 +2431,7 @@ class ElementHandle(JSHandle):
         animations: typing.Optional[Literal["allow", "disabled"]] = None,
         caret: typing.Optional[Literal["hide", "initial"]] = None,
         scale: typing.Optional[Literal["css", "device"]] = None,
-        mask: typing.Optional[typing.List["Locator"]] = None
+        mask: typing.Optional[typing.List["Locator"]] = None,
     ) -> bytes:
         """ElementHandle.screenshot
 
@@ -2687,7 +2636,7 @@ class ElementHandle(JSHandle):
             "disabled", "editable", "enabled", "hidden", "stable", "visible"
         ],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """ElementHandle.wait_for_element_state
 
@@ -2715,9 +2664,7 @@ class ElementHandle(JSHandle):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.wait_for_element_state(state=state, timeout=timeout)
-        )
+        return await self._impl_obj.wait_for_element_state(state=state, timeout=timeout)
 
     async def wait_for_selector(
         self,
@@ -2727,7 +2674,7 @@ class ElementHandle(JSHandle):
             Literal["attached", "detached", "hidden", "visible"]
         ] = None,
         timeout: typing.Optional[float] = None,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> typing.Optional["ElementHandle"]:
         """ElementHandle.wait_for_selector
 
@@ -2787,7 +2734,7 @@ class Accessibility(AsyncBase):
         self,
         *,
         interesting_only: typing.Optional[bool] = None,
-        root: typing.Optional["ElementHandle"] = None
+        root: typing.Optional["ElementHandle"] = None,
     ) -> typing.Optional[typing.Dict]:
         """Accessibility.snapshot
 
@@ -2896,7 +2843,7 @@ class FileChooser(AsyncBase):
         ],
         *,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """FileChooser.set_files
 
@@ -2915,10 +2862,8 @@ class FileChooser(AsyncBase):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_files(
-                files=mapping.to_impl(files), timeout=timeout, noWaitAfter=no_wait_after
-            )
+        return await self._impl_obj.set_files(
+            files=mapping.to_impl(files), timeout=timeout, noWaitAfter=no_wait_after
         )
 
 
@@ -2952,7 +2897,7 @@ class Frame(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.name)
+        return self._impl_obj.name
 
     @property
     def url(self) -> str:
@@ -2964,7 +2909,7 @@ class Frame(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     @property
     def parent_frame(self) -> typing.Optional["Frame"]:
@@ -2996,7 +2941,7 @@ class Frame(AsyncBase):
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
         ] = None,
-        referer: typing.Optional[str] = None
+        referer: typing.Optional[str] = None,
     ) -> typing.Optional["Response"]:
         """Frame.goto
 
@@ -3058,7 +3003,7 @@ class Frame(AsyncBase):
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
         ] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> AsyncEventContextManager["Response"]:
         """Frame.expect_navigation
 
@@ -3114,7 +3059,7 @@ class Frame(AsyncBase):
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
         ] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Frame.wait_for_url
 
@@ -3144,10 +3089,8 @@ class Frame(AsyncBase):
             `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.wait_for_url(
-                url=self._wrap_handler(url), wait_until=wait_until, timeout=timeout
-            )
+        return await self._impl_obj.wait_for_url(
+            url=self._wrap_handler(url), wait_until=wait_until, timeout=timeout
         )
 
     async def wait_for_load_state(
@@ -3156,7 +3099,7 @@ class Frame(AsyncBase):
             Literal["domcontentloaded", "load", "networkidle"]
         ] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Frame.wait_for_load_state
 
@@ -3185,9 +3128,7 @@ class Frame(AsyncBase):
             `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.wait_for_load_state(state=state, timeout=timeout)
-        )
+        return await self._impl_obj.wait_for_load_state(state=state, timeout=timeout)
 
     async def frame_element(self) -> "ElementHandle":
         """Frame.frame_element
@@ -3379,7 +3320,7 @@ class Frame(AsyncBase):
         timeout: typing.Optional[float] = None,
         state: typing.Optional[
             Literal["attached", "detached", "hidden", "visible"]
-        ] = None
+        ] = None,
     ) -> typing.Optional["ElementHandle"]:
         """Frame.wait_for_selector
 
@@ -3450,7 +3391,7 @@ class Frame(AsyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Frame.is_checked
 
@@ -3484,7 +3425,7 @@ class Frame(AsyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Frame.is_disabled
 
@@ -3518,7 +3459,7 @@ class Frame(AsyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Frame.is_editable
 
@@ -3552,7 +3493,7 @@ class Frame(AsyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Frame.is_enabled
 
@@ -3586,7 +3527,7 @@ class Frame(AsyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Frame.is_hidden
 
@@ -3621,7 +3562,7 @@ class Frame(AsyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Frame.is_visible
 
@@ -3658,7 +3599,7 @@ class Frame(AsyncBase):
         event_init: typing.Optional[typing.Dict] = None,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Frame.dispatch_event
 
@@ -3707,14 +3648,12 @@ class Frame(AsyncBase):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.dispatch_event(
-                selector=selector,
-                type=type,
-                eventInit=mapping.to_impl(event_init),
-                strict=strict,
-                timeout=timeout,
-            )
+        return await self._impl_obj.dispatch_event(
+            selector=selector,
+            type=type,
+            eventInit=mapping.to_impl(event_init),
+            strict=strict,
+            timeout=timeout,
         )
 
     async def eval_on_selector(
@@ -3723,7 +3662,7 @@ class Frame(AsyncBase):
         expression: str,
         arg: typing.Optional[typing.Any] = None,
         *,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> typing.Any:
         """Frame.eval_on_selector
 
@@ -3836,7 +3775,7 @@ class Frame(AsyncBase):
         timeout: typing.Optional[float] = None,
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
-        ] = None
+        ] = None,
     ) -> None:
         """Frame.set_content
 
@@ -3857,10 +3796,8 @@ class Frame(AsyncBase):
             - `'commit'` - consider operation to be finished when network response is received and the document started loading.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_content(
-                html=html, timeout=timeout, waitUntil=wait_until
-            )
+        return await self._impl_obj.set_content(
+            html=html, timeout=timeout, waitUntil=wait_until
         )
 
     def is_detached(self) -> bool:
@@ -3881,7 +3818,7 @@ class Frame(AsyncBase):
         url: typing.Optional[str] = None,
         path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
         content: typing.Optional[str] = None,
-        type: typing.Optional[str] = None
+        type: typing.Optional[str] = None,
     ) -> "ElementHandle":
         """Frame.add_script_tag
 
@@ -3918,7 +3855,7 @@ class Frame(AsyncBase):
         *,
         url: typing.Optional[str] = None,
         path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
-        content: typing.Optional[str] = None
+        content: typing.Optional[str] = None,
     ) -> "ElementHandle":
         """Frame.add_style_tag
 
@@ -3961,7 +3898,7 @@ class Frame(AsyncBase):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.click
 
@@ -4010,20 +3947,18 @@ class Frame(AsyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.click(
-                selector=selector,
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                delay=delay,
-                button=button,
-                clickCount=click_count,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-                trial=trial,
-            )
+        return await self._impl_obj.click(
+            selector=selector,
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            delay=delay,
+            button=button,
+            clickCount=click_count,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            strict=strict,
+            trial=trial,
         )
 
     async def dblclick(
@@ -4040,7 +3975,7 @@ class Frame(AsyncBase):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.dblclick
 
@@ -4090,19 +4025,17 @@ class Frame(AsyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.dblclick(
-                selector=selector,
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                delay=delay,
-                button=button,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-                trial=trial,
-            )
+        return await self._impl_obj.dblclick(
+            selector=selector,
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            delay=delay,
+            button=button,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            strict=strict,
+            trial=trial,
         )
 
     async def tap(
@@ -4117,7 +4050,7 @@ class Frame(AsyncBase):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.tap
 
@@ -4162,17 +4095,15 @@ class Frame(AsyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.tap(
-                selector=selector,
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-                trial=trial,
-            )
+        return await self._impl_obj.tap(
+            selector=selector,
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            strict=strict,
+            trial=trial,
         )
 
     async def fill(
@@ -4183,7 +4114,7 @@ class Frame(AsyncBase):
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        force: typing.Optional[bool] = None
+        force: typing.Optional[bool] = None,
     ) -> None:
         """Frame.fill
 
@@ -4219,15 +4150,13 @@ class Frame(AsyncBase):
             Whether to bypass the [actionability](../actionability.md) checks. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.fill(
-                selector=selector,
-                value=value,
-                timeout=timeout,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-                force=force,
-            )
+        return await self._impl_obj.fill(
+            selector=selector,
+            value=value,
+            timeout=timeout,
+            noWaitAfter=no_wait_after,
+            strict=strict,
+            force=force,
         )
 
     def locator(
@@ -4235,7 +4164,7 @@ class Frame(AsyncBase):
         selector: str,
         *,
         has_text: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
-        has: typing.Optional["Locator"] = None
+        has: typing.Optional["Locator"] = None,
     ) -> "Locator":
         """Frame.locator
 
@@ -4276,7 +4205,7 @@ class Frame(AsyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Frame.get_by_alt_text
 
@@ -4305,7 +4234,7 @@ class Frame(AsyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Frame.get_by_label
 
@@ -4336,7 +4265,7 @@ class Frame(AsyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Frame.get_by_placeholder
 
@@ -4459,7 +4388,7 @@ class Frame(AsyncBase):
         name: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
         pressed: typing.Optional[bool] = None,
         selected: typing.Optional[bool] = None,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Frame.get_by_role
 
@@ -4559,7 +4488,7 @@ class Frame(AsyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Frame.get_by_text
 
@@ -4616,7 +4545,7 @@ class Frame(AsyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Frame.get_by_title
 
@@ -4670,7 +4599,7 @@ class Frame(AsyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Frame.focus
 
@@ -4690,10 +4619,8 @@ class Frame(AsyncBase):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.focus(
-                selector=selector, strict=strict, timeout=timeout
-            )
+        return await self._impl_obj.focus(
+            selector=selector, strict=strict, timeout=timeout
         )
 
     async def text_content(
@@ -4701,7 +4628,7 @@ class Frame(AsyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Optional[str]:
         """Frame.text_content
 
@@ -4735,7 +4662,7 @@ class Frame(AsyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> str:
         """Frame.inner_text
 
@@ -4769,7 +4696,7 @@ class Frame(AsyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> str:
         """Frame.inner_html
 
@@ -4804,7 +4731,7 @@ class Frame(AsyncBase):
         name: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Optional[str]:
         """Frame.get_attribute
 
@@ -4847,7 +4774,7 @@ class Frame(AsyncBase):
         no_wait_after: typing.Optional[bool] = None,
         force: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.hover
 
@@ -4890,17 +4817,15 @@ class Frame(AsyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.hover(
-                selector=selector,
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                timeout=timeout,
-                noWaitAfter=no_wait_after,
-                force=force,
-                strict=strict,
-                trial=trial,
-            )
+        return await self._impl_obj.hover(
+            selector=selector,
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            timeout=timeout,
+            noWaitAfter=no_wait_after,
+            force=force,
+            strict=strict,
+            trial=trial,
         )
 
     async def drag_and_drop(
@@ -4914,7 +4839,7 @@ class Frame(AsyncBase):
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.drag_and_drop
 
@@ -4949,18 +4874,16 @@ class Frame(AsyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.drag_and_drop(
-                source=source,
-                target=target,
-                sourcePosition=source_position,
-                targetPosition=target_position,
-                force=force,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-                timeout=timeout,
-                trial=trial,
-            )
+        return await self._impl_obj.drag_and_drop(
+            source=source,
+            target=target,
+            sourcePosition=source_position,
+            targetPosition=target_position,
+            force=force,
+            noWaitAfter=no_wait_after,
+            strict=strict,
+            timeout=timeout,
+            trial=trial,
         )
 
     async def select_option(
@@ -4976,7 +4899,7 @@ class Frame(AsyncBase):
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        force: typing.Optional[bool] = None
+        force: typing.Optional[bool] = None,
     ) -> typing.List[str]:
         """Frame.select_option
 
@@ -5051,7 +4974,7 @@ class Frame(AsyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> str:
         """Frame.input_value
 
@@ -5096,7 +5019,7 @@ class Frame(AsyncBase):
         *,
         strict: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """Frame.set_input_files
 
@@ -5126,14 +5049,12 @@ class Frame(AsyncBase):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_input_files(
-                selector=selector,
-                files=mapping.to_impl(files),
-                strict=strict,
-                timeout=timeout,
-                noWaitAfter=no_wait_after,
-            )
+        return await self._impl_obj.set_input_files(
+            selector=selector,
+            files=mapping.to_impl(files),
+            strict=strict,
+            timeout=timeout,
+            noWaitAfter=no_wait_after,
         )
 
     async def type(
@@ -5144,7 +5065,7 @@ class Frame(AsyncBase):
         delay: typing.Optional[float] = None,
         strict: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """Frame.type
 
@@ -5179,15 +5100,13 @@ class Frame(AsyncBase):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.type(
-                selector=selector,
-                text=text,
-                delay=delay,
-                strict=strict,
-                timeout=timeout,
-                noWaitAfter=no_wait_after,
-            )
+        return await self._impl_obj.type(
+            selector=selector,
+            text=text,
+            delay=delay,
+            strict=strict,
+            timeout=timeout,
+            noWaitAfter=no_wait_after,
         )
 
     async def press(
@@ -5198,7 +5117,7 @@ class Frame(AsyncBase):
         delay: typing.Optional[float] = None,
         strict: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """Frame.press
 
@@ -5240,15 +5159,13 @@ class Frame(AsyncBase):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.press(
-                selector=selector,
-                key=key,
-                delay=delay,
-                strict=strict,
-                timeout=timeout,
-                noWaitAfter=no_wait_after,
-            )
+        return await self._impl_obj.press(
+            selector=selector,
+            key=key,
+            delay=delay,
+            strict=strict,
+            timeout=timeout,
+            noWaitAfter=no_wait_after,
         )
 
     async def check(
@@ -5260,7 +5177,7 @@ class Frame(AsyncBase):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.check
 
@@ -5303,16 +5220,14 @@ class Frame(AsyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.check(
-                selector=selector,
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-                trial=trial,
-            )
+        return await self._impl_obj.check(
+            selector=selector,
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            strict=strict,
+            trial=trial,
         )
 
     async def uncheck(
@@ -5324,7 +5239,7 @@ class Frame(AsyncBase):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.uncheck
 
@@ -5367,16 +5282,14 @@ class Frame(AsyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.uncheck(
-                selector=selector,
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-                trial=trial,
-            )
+        return await self._impl_obj.uncheck(
+            selector=selector,
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            strict=strict,
+            trial=trial,
         )
 
     async def wait_for_timeout(self, timeout: float) -> None:
@@ -5393,9 +5306,7 @@ class Frame(AsyncBase):
             A timeout to wait for
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.wait_for_timeout(timeout=timeout)
-        )
+        return await self._impl_obj.wait_for_timeout(timeout=timeout)
 
     async def wait_for_function(
         self,
@@ -5403,7 +5314,7 @@ class Frame(AsyncBase):
         *,
         arg: typing.Optional[typing.Any] = None,
         timeout: typing.Optional[float] = None,
-        polling: typing.Optional[typing.Union[float, Literal["raf"]]] = None
+        polling: typing.Optional[typing.Union[float, Literal["raf"]]] = None,
     ) -> "JSHandle":
         """Frame.wait_for_function
 
@@ -5486,7 +5397,7 @@ class Frame(AsyncBase):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.set_checked
 
@@ -5531,17 +5442,15 @@ class Frame(AsyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_checked(
-                selector=selector,
-                checked=checked,
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-                trial=trial,
-            )
+        return await self._impl_obj.set_checked(
+            selector=selector,
+            checked=checked,
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            strict=strict,
+            trial=trial,
         )
 
 
@@ -5578,7 +5487,7 @@ class FrameLocator(AsyncBase):
         selector: str,
         *,
         has_text: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
-        has: typing.Optional["Locator"] = None
+        has: typing.Optional["Locator"] = None,
     ) -> "Locator":
         """FrameLocator.locator
 
@@ -5616,7 +5525,7 @@ class FrameLocator(AsyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """FrameLocator.get_by_alt_text
 
@@ -5645,7 +5554,7 @@ class FrameLocator(AsyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """FrameLocator.get_by_label
 
@@ -5676,7 +5585,7 @@ class FrameLocator(AsyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """FrameLocator.get_by_placeholder
 
@@ -5799,7 +5708,7 @@ class FrameLocator(AsyncBase):
         name: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
         pressed: typing.Optional[bool] = None,
         selected: typing.Optional[bool] = None,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """FrameLocator.get_by_role
 
@@ -5899,7 +5808,7 @@ class FrameLocator(AsyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """FrameLocator.get_by_text
 
@@ -5956,7 +5865,7 @@ class FrameLocator(AsyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """FrameLocator.get_by_title
 
@@ -6046,7 +5955,7 @@ class Worker(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     async def evaluate(
         self, expression: str, arg: typing.Optional[typing.Any] = None
@@ -6124,7 +6033,7 @@ class Selectors(AsyncBase):
         script: typing.Optional[str] = None,
         *,
         path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
-        content_script: typing.Optional[bool] = None
+        content_script: typing.Optional[bool] = None,
     ) -> None:
         """Selectors.register
 
@@ -6185,10 +6094,8 @@ class Selectors(AsyncBase):
             guaranteed when this engine is used together with other registered engines.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.register(
-                name=name, script=script, path=path, contentScript=content_script
-            )
+        return await self._impl_obj.register(
+            name=name, script=script, path=path, contentScript=content_script
         )
 
     def set_test_id_attribute(self, attribute_name: str) -> None:
@@ -6202,9 +6109,7 @@ class Selectors(AsyncBase):
             Test id attribute name.
         """
 
-        return mapping.from_maybe_impl(
-            self._impl_obj.set_test_id_attribute(attribute_name=attribute_name)
-        )
+        return self._impl_obj.set_test_id_attribute(attribute_name=attribute_name)
 
 
 mapping.register(SelectorsImpl, Selectors)
@@ -6223,7 +6128,7 @@ class ConsoleMessage(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.type)
+        return self._impl_obj.type
 
     @property
     def text(self) -> str:
@@ -6235,7 +6140,7 @@ class ConsoleMessage(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.text)
+        return self._impl_obj.text
 
     @property
     def args(self) -> typing.List["JSHandle"]:
@@ -6274,7 +6179,7 @@ class Dialog(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.type)
+        return self._impl_obj.type
 
     @property
     def message(self) -> str:
@@ -6286,7 +6191,7 @@ class Dialog(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.message)
+        return self._impl_obj.message
 
     @property
     def default_value(self) -> str:
@@ -6298,7 +6203,7 @@ class Dialog(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.default_value)
+        return self._impl_obj.default_value
 
     async def accept(self, prompt_text: typing.Optional[str] = None) -> None:
         """Dialog.accept
@@ -6311,9 +6216,7 @@ class Dialog(AsyncBase):
             A text to enter in prompt. Does not cause any effects if the dialog's `type` is not prompt. Optional.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.accept(promptText=prompt_text)
-        )
+        return await self._impl_obj.accept(promptText=prompt_text)
 
     async def dismiss(self) -> None:
         """Dialog.dismiss
@@ -6321,7 +6224,7 @@ class Dialog(AsyncBase):
         Returns when the dialog has been dismissed.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.dismiss())
+        return await self._impl_obj.dismiss()
 
 
 mapping.register(DialogImpl, Dialog)
@@ -6350,7 +6253,7 @@ class Download(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     @property
     def suggested_filename(self) -> str:
@@ -6365,7 +6268,7 @@ class Download(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.suggested_filename)
+        return self._impl_obj.suggested_filename
 
     async def delete(self) -> None:
         """Download.delete
@@ -6373,7 +6276,7 @@ class Download(AsyncBase):
         Deletes the downloaded file. Will wait for the download to finish if necessary.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.delete())
+        return await self._impl_obj.delete()
 
     async def failure(self) -> typing.Optional[str]:
         """Download.failure
@@ -6415,7 +6318,7 @@ class Download(AsyncBase):
             Path where the download should be copied.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.save_as(path=path))
+        return await self._impl_obj.save_as(path=path)
 
     async def cancel(self) -> None:
         """Download.cancel
@@ -6424,7 +6327,7 @@ class Download(AsyncBase):
         `download.failure()` would resolve to `'canceled'`.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.cancel())
+        return await self._impl_obj.cancel()
 
 
 mapping.register(DownloadImpl, Download)
@@ -6456,7 +6359,7 @@ class Video(AsyncBase):
             Path where the video should be saved.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.save_as(path=path))
+        return await self._impl_obj.save_as(path=path)
 
     async def delete(self) -> None:
         """Video.delete
@@ -6464,7 +6367,7 @@ class Video(AsyncBase):
         Deletes the video file. Will wait for the video to finish if necessary.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.delete())
+        return await self._impl_obj.delete()
 
 
 mapping.register(VideoImpl, Video)
@@ -7087,7 +6990,7 @@ class Page(AsyncContextManager):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     @property
     def viewport_size(self) -> typing.Optional[ViewportSize]:
@@ -7157,7 +7060,7 @@ class Page(AsyncContextManager):
         *,
         url: typing.Optional[
             typing.Union[str, typing.Pattern[str], typing.Callable[[str], bool]]
-        ] = None
+        ] = None,
     ) -> typing.Optional["Frame"]:
         """Page.frame
 
@@ -7208,9 +7111,7 @@ class Page(AsyncContextManager):
             Maximum navigation time in milliseconds
         """
 
-        return mapping.from_maybe_impl(
-            self._impl_obj.set_default_navigation_timeout(timeout=timeout)
-        )
+        return self._impl_obj.set_default_navigation_timeout(timeout=timeout)
 
     def set_default_timeout(self, timeout: float) -> None:
         """Page.set_default_timeout
@@ -7225,9 +7126,7 @@ class Page(AsyncContextManager):
             Maximum time in milliseconds
         """
 
-        return mapping.from_maybe_impl(
-            self._impl_obj.set_default_timeout(timeout=timeout)
-        )
+        return self._impl_obj.set_default_timeout(timeout=timeout)
 
     async def query_selector(
         self, selector: str, *, strict: typing.Optional[bool] = None
@@ -7290,7 +7189,7 @@ class Page(AsyncContextManager):
         state: typing.Optional[
             Literal["attached", "detached", "hidden", "visible"]
         ] = None,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> typing.Optional["ElementHandle"]:
         """Page.wait_for_selector
 
@@ -7361,7 +7260,7 @@ class Page(AsyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Page.is_checked
 
@@ -7395,7 +7294,7 @@ class Page(AsyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Page.is_disabled
 
@@ -7429,7 +7328,7 @@ class Page(AsyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Page.is_editable
 
@@ -7463,7 +7362,7 @@ class Page(AsyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Page.is_enabled
 
@@ -7497,7 +7396,7 @@ class Page(AsyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Page.is_hidden
 
@@ -7532,7 +7431,7 @@ class Page(AsyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Page.is_visible
 
@@ -7569,7 +7468,7 @@ class Page(AsyncContextManager):
         event_init: typing.Optional[typing.Dict] = None,
         *,
         timeout: typing.Optional[float] = None,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> None:
         """Page.dispatch_event
 
@@ -7618,14 +7517,12 @@ class Page(AsyncContextManager):
             element, the call throws an exception.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.dispatch_event(
-                selector=selector,
-                type=type,
-                eventInit=mapping.to_impl(event_init),
-                timeout=timeout,
-                strict=strict,
-            )
+        return await self._impl_obj.dispatch_event(
+            selector=selector,
+            type=type,
+            eventInit=mapping.to_impl(event_init),
+            timeout=timeout,
+            strict=strict,
         )
 
     async def evaluate(
@@ -7744,7 +7641,7 @@ class Page(AsyncContextManager):
         expression: str,
         arg: typing.Optional[typing.Any] = None,
         *,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> typing.Any:
         """Page.eval_on_selector
 
@@ -7841,7 +7738,7 @@ class Page(AsyncContextManager):
         url: typing.Optional[str] = None,
         path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
         content: typing.Optional[str] = None,
-        type: typing.Optional[str] = None
+        type: typing.Optional[str] = None,
     ) -> "ElementHandle":
         """Page.add_script_tag
 
@@ -7879,7 +7776,7 @@ class Page(AsyncContextManager):
         *,
         url: typing.Optional[str] = None,
         path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
-        content: typing.Optional[str] = None
+        content: typing.Optional[str] = None,
     ) -> "ElementHandle":
         """Page.add_style_tag
 
@@ -7961,10 +7858,8 @@ class Page(AsyncContextManager):
             Callback function which will be called in Playwright's context.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.expose_function(
-                name=name, callback=self._wrap_handler(callback)
-            )
+        return await self._impl_obj.expose_function(
+            name=name, callback=self._wrap_handler(callback)
         )
 
     async def expose_binding(
@@ -7972,7 +7867,7 @@ class Page(AsyncContextManager):
         name: str,
         callback: typing.Callable,
         *,
-        handle: typing.Optional[bool] = None
+        handle: typing.Optional[bool] = None,
     ) -> None:
         """Page.expose_binding
 
@@ -8043,10 +7938,8 @@ class Page(AsyncContextManager):
             supported. When passing by value, multiple arguments are supported.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.expose_binding(
-                name=name, callback=self._wrap_handler(callback), handle=handle
-            )
+        return await self._impl_obj.expose_binding(
+            name=name, callback=self._wrap_handler(callback), handle=handle
         )
 
     async def set_extra_http_headers(self, headers: typing.Dict[str, str]) -> None:
@@ -8062,10 +7955,8 @@ class Page(AsyncContextManager):
             An object containing additional HTTP headers to be sent with every request. All header values must be strings.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_extra_http_headers(
-                headers=mapping.to_impl(headers)
-            )
+        return await self._impl_obj.set_extra_http_headers(
+            headers=mapping.to_impl(headers)
         )
 
     async def content(self) -> str:
@@ -8087,7 +7978,7 @@ class Page(AsyncContextManager):
         timeout: typing.Optional[float] = None,
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
-        ] = None
+        ] = None,
     ) -> None:
         """Page.set_content
 
@@ -8108,10 +7999,8 @@ class Page(AsyncContextManager):
             - `'commit'` - consider operation to be finished when network response is received and the document started loading.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_content(
-                html=html, timeout=timeout, waitUntil=wait_until
-            )
+        return await self._impl_obj.set_content(
+            html=html, timeout=timeout, waitUntil=wait_until
         )
 
     async def goto(
@@ -8122,7 +8011,7 @@ class Page(AsyncContextManager):
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
         ] = None,
-        referer: typing.Optional[str] = None
+        referer: typing.Optional[str] = None,
     ) -> typing.Optional["Response"]:
         """Page.goto
 
@@ -8185,7 +8074,7 @@ class Page(AsyncContextManager):
         timeout: typing.Optional[float] = None,
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
-        ] = None
+        ] = None,
     ) -> typing.Optional["Response"]:
         """Page.reload
 
@@ -8221,7 +8110,7 @@ class Page(AsyncContextManager):
             Literal["domcontentloaded", "load", "networkidle"]
         ] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Page.wait_for_load_state
 
@@ -8261,9 +8150,7 @@ class Page(AsyncContextManager):
             `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.wait_for_load_state(state=state, timeout=timeout)
-        )
+        return await self._impl_obj.wait_for_load_state(state=state, timeout=timeout)
 
     async def wait_for_url(
         self,
@@ -8272,7 +8159,7 @@ class Page(AsyncContextManager):
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
         ] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Page.wait_for_url
 
@@ -8304,10 +8191,8 @@ class Page(AsyncContextManager):
             `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.wait_for_url(
-                url=self._wrap_handler(url), wait_until=wait_until, timeout=timeout
-            )
+        return await self._impl_obj.wait_for_url(
+            url=self._wrap_handler(url), wait_until=wait_until, timeout=timeout
         )
 
     async def wait_for_event(
@@ -8315,7 +8200,7 @@ class Page(AsyncContextManager):
         event: str,
         predicate: typing.Optional[typing.Callable] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Any:
         """Page.wait_for_event
 
@@ -8352,7 +8237,7 @@ class Page(AsyncContextManager):
         timeout: typing.Optional[float] = None,
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
-        ] = None
+        ] = None,
     ) -> typing.Optional["Response"]:
         """Page.go_back
 
@@ -8390,7 +8275,7 @@ class Page(AsyncContextManager):
         timeout: typing.Optional[float] = None,
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
-        ] = None
+        ] = None,
     ) -> typing.Optional["Response"]:
         """Page.go_forward
 
@@ -8432,7 +8317,7 @@ class Page(AsyncContextManager):
         reduced_motion: typing.Optional[
             Literal["no-preference", "null", "reduce"]
         ] = None,
-        forced_colors: typing.Optional[Literal["active", "none", "null"]] = None
+        forced_colors: typing.Optional[Literal["active", "none", "null"]] = None,
     ) -> None:
         """Page.emulate_media
 
@@ -8482,13 +8367,11 @@ class Page(AsyncContextManager):
         forced_colors : Union["active", "none", "null", None]
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.emulate_media(
-                media=media,
-                colorScheme=color_scheme,
-                reducedMotion=reduced_motion,
-                forcedColors=forced_colors,
-            )
+        return await self._impl_obj.emulate_media(
+            media=media,
+            colorScheme=color_scheme,
+            reducedMotion=reduced_motion,
+            forcedColors=forced_colors,
         )
 
     async def set_viewport_size(self, viewport_size: ViewportSize) -> None:
@@ -8513,9 +8396,7 @@ class Page(AsyncContextManager):
         viewport_size : {width: int, height: int}
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_viewport_size(viewportSize=viewport_size)
-        )
+        return await self._impl_obj.set_viewport_size(viewportSize=viewport_size)
 
     async def bring_to_front(self) -> None:
         """Page.bring_to_front
@@ -8523,13 +8404,13 @@ class Page(AsyncContextManager):
         Brings page to front (activates tab).
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.bring_to_front())
+        return await self._impl_obj.bring_to_front()
 
     async def add_init_script(
         self,
         script: typing.Optional[str] = None,
         *,
-        path: typing.Optional[typing.Union[str, pathlib.Path]] = None
+        path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
     ) -> None:
         """Page.add_init_script
 
@@ -8560,9 +8441,7 @@ class Page(AsyncContextManager):
             directory. Optional.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.add_init_script(script=script, path=path)
-        )
+        return await self._impl_obj.add_init_script(script=script, path=path)
 
     async def route(
         self,
@@ -8572,7 +8451,7 @@ class Page(AsyncContextManager):
             typing.Callable[["Route", "Request"], typing.Any],
         ],
         *,
-        times: typing.Optional[int] = None
+        times: typing.Optional[int] = None,
     ) -> None:
         """Page.route
 
@@ -8634,12 +8513,10 @@ class Page(AsyncContextManager):
             How often a route should be used. By default it will be used every time.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.route(
-                url=self._wrap_handler(url),
-                handler=self._wrap_handler(handler),
-                times=times,
-            )
+        return await self._impl_obj.route(
+            url=self._wrap_handler(url),
+            handler=self._wrap_handler(handler),
+            times=times,
         )
 
     async def unroute(
@@ -8664,10 +8541,8 @@ class Page(AsyncContextManager):
             Optional handler function to route the request.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.unroute(
-                url=self._wrap_handler(url), handler=self._wrap_handler(handler)
-            )
+        return await self._impl_obj.unroute(
+            url=self._wrap_handler(url), handler=self._wrap_handler(handler)
         )
 
     async def route_from_har(
@@ -8676,7 +8551,7 @@ class Page(AsyncContextManager):
         *,
         url: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
         not_found: typing.Optional[Literal["abort", "fallback"]] = None,
-        update: typing.Optional[bool] = None
+        update: typing.Optional[bool] = None,
     ) -> None:
         """Page.route_from_har
 
@@ -8705,10 +8580,8 @@ class Page(AsyncContextManager):
             written to disk when `browser_context.close()` is called.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.route_from_har(
-                har=har, url=url, not_found=not_found, update=update
-            )
+        return await self._impl_obj.route_from_har(
+            har=har, url=url, not_found=not_found, update=update
         )
 
     async def screenshot(
@@ -8724,7 +8597,7 @@ class Page(AsyncContextManager):
         animations: typing.Optional[Literal["allow", "disabled"]] = None,
         caret: typing.Optional[Literal["hide", "initial"]] = None,
         scale: typing.Optional[Literal["css", "device"]] = None,
-        mask: typing.Optional[typing.List["Locator"]] = None
+        mask: typing.Optional[typing.List["Locator"]] = None,
     ) -> bytes:
         """Page.screenshot
 
@@ -8822,9 +8695,7 @@ class Page(AsyncContextManager):
             [before unload](https://developer.mozilla.org/en-US/docs/Web/Events/beforeunload) page handlers.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.close(runBeforeUnload=run_before_unload)
-        )
+        return await self._impl_obj.close(runBeforeUnload=run_before_unload)
 
     def is_closed(self) -> bool:
         """Page.is_closed
@@ -8853,7 +8724,7 @@ class Page(AsyncContextManager):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         trial: typing.Optional[bool] = None,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> None:
         """Page.click
 
@@ -8904,20 +8775,18 @@ class Page(AsyncContextManager):
             element, the call throws an exception.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.click(
-                selector=selector,
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                delay=delay,
-                button=button,
-                clickCount=click_count,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                trial=trial,
-                strict=strict,
-            )
+        return await self._impl_obj.click(
+            selector=selector,
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            delay=delay,
+            button=button,
+            clickCount=click_count,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            trial=trial,
+            strict=strict,
         )
 
     async def dblclick(
@@ -8934,7 +8803,7 @@ class Page(AsyncContextManager):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Page.dblclick
 
@@ -8986,19 +8855,17 @@ class Page(AsyncContextManager):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.dblclick(
-                selector=selector,
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                delay=delay,
-                button=button,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-                trial=trial,
-            )
+        return await self._impl_obj.dblclick(
+            selector=selector,
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            delay=delay,
+            button=button,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            strict=strict,
+            trial=trial,
         )
 
     async def tap(
@@ -9013,7 +8880,7 @@ class Page(AsyncContextManager):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Page.tap
 
@@ -9060,17 +8927,15 @@ class Page(AsyncContextManager):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.tap(
-                selector=selector,
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-                trial=trial,
-            )
+        return await self._impl_obj.tap(
+            selector=selector,
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            strict=strict,
+            trial=trial,
         )
 
     async def fill(
@@ -9081,7 +8946,7 @@ class Page(AsyncContextManager):
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        force: typing.Optional[bool] = None
+        force: typing.Optional[bool] = None,
     ) -> None:
         """Page.fill
 
@@ -9119,15 +8984,13 @@ class Page(AsyncContextManager):
             Whether to bypass the [actionability](../actionability.md) checks. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.fill(
-                selector=selector,
-                value=value,
-                timeout=timeout,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-                force=force,
-            )
+        return await self._impl_obj.fill(
+            selector=selector,
+            value=value,
+            timeout=timeout,
+            noWaitAfter=no_wait_after,
+            strict=strict,
+            force=force,
         )
 
     def locator(
@@ -9135,7 +8998,7 @@ class Page(AsyncContextManager):
         selector: str,
         *,
         has_text: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
-        has: typing.Optional["Locator"] = None
+        has: typing.Optional["Locator"] = None,
     ) -> "Locator":
         """Page.locator
 
@@ -9174,7 +9037,7 @@ class Page(AsyncContextManager):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Page.get_by_alt_text
 
@@ -9203,7 +9066,7 @@ class Page(AsyncContextManager):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Page.get_by_label
 
@@ -9234,7 +9097,7 @@ class Page(AsyncContextManager):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Page.get_by_placeholder
 
@@ -9357,7 +9220,7 @@ class Page(AsyncContextManager):
         name: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
         pressed: typing.Optional[bool] = None,
         selected: typing.Optional[bool] = None,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Page.get_by_role
 
@@ -9457,7 +9320,7 @@ class Page(AsyncContextManager):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Page.get_by_text
 
@@ -9514,7 +9377,7 @@ class Page(AsyncContextManager):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Page.get_by_title
 
@@ -9568,7 +9431,7 @@ class Page(AsyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Page.focus
 
@@ -9590,10 +9453,8 @@ class Page(AsyncContextManager):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.focus(
-                selector=selector, strict=strict, timeout=timeout
-            )
+        return await self._impl_obj.focus(
+            selector=selector, strict=strict, timeout=timeout
         )
 
     async def text_content(
@@ -9601,7 +9462,7 @@ class Page(AsyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Optional[str]:
         """Page.text_content
 
@@ -9635,7 +9496,7 @@ class Page(AsyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> str:
         """Page.inner_text
 
@@ -9669,7 +9530,7 @@ class Page(AsyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> str:
         """Page.inner_html
 
@@ -9704,7 +9565,7 @@ class Page(AsyncContextManager):
         name: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Optional[str]:
         """Page.get_attribute
 
@@ -9747,7 +9608,7 @@ class Page(AsyncContextManager):
         no_wait_after: typing.Optional[bool] = None,
         force: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Page.hover
 
@@ -9792,17 +9653,15 @@ class Page(AsyncContextManager):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.hover(
-                selector=selector,
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                timeout=timeout,
-                noWaitAfter=no_wait_after,
-                force=force,
-                strict=strict,
-                trial=trial,
-            )
+        return await self._impl_obj.hover(
+            selector=selector,
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            timeout=timeout,
+            noWaitAfter=no_wait_after,
+            force=force,
+            strict=strict,
+            trial=trial,
         )
 
     async def drag_and_drop(
@@ -9816,7 +9675,7 @@ class Page(AsyncContextManager):
         no_wait_after: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Page.drag_and_drop
 
@@ -9865,18 +9724,16 @@ class Page(AsyncContextManager):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.drag_and_drop(
-                source=source,
-                target=target,
-                sourcePosition=source_position,
-                targetPosition=target_position,
-                force=force,
-                noWaitAfter=no_wait_after,
-                timeout=timeout,
-                strict=strict,
-                trial=trial,
-            )
+        return await self._impl_obj.drag_and_drop(
+            source=source,
+            target=target,
+            sourcePosition=source_position,
+            targetPosition=target_position,
+            force=force,
+            noWaitAfter=no_wait_after,
+            timeout=timeout,
+            strict=strict,
+            trial=trial,
         )
 
     async def select_option(
@@ -9892,7 +9749,7 @@ class Page(AsyncContextManager):
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
         force: typing.Optional[bool] = None,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> typing.List[str]:
         """Page.select_option
 
@@ -9970,7 +9827,7 @@ class Page(AsyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> str:
         """Page.input_value
 
@@ -10015,7 +9872,7 @@ class Page(AsyncContextManager):
         *,
         timeout: typing.Optional[float] = None,
         strict: typing.Optional[bool] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """Page.set_input_files
 
@@ -10045,14 +9902,12 @@ class Page(AsyncContextManager):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_input_files(
-                selector=selector,
-                files=mapping.to_impl(files),
-                timeout=timeout,
-                strict=strict,
-                noWaitAfter=no_wait_after,
-            )
+        return await self._impl_obj.set_input_files(
+            selector=selector,
+            files=mapping.to_impl(files),
+            timeout=timeout,
+            strict=strict,
+            noWaitAfter=no_wait_after,
         )
 
     async def type(
@@ -10063,7 +9918,7 @@ class Page(AsyncContextManager):
         delay: typing.Optional[float] = None,
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> None:
         """Page.type
 
@@ -10100,15 +9955,13 @@ class Page(AsyncContextManager):
             element, the call throws an exception.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.type(
-                selector=selector,
-                text=text,
-                delay=delay,
-                timeout=timeout,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-            )
+        return await self._impl_obj.type(
+            selector=selector,
+            text=text,
+            delay=delay,
+            timeout=timeout,
+            noWaitAfter=no_wait_after,
+            strict=strict,
         )
 
     async def press(
@@ -10119,7 +9972,7 @@ class Page(AsyncContextManager):
         delay: typing.Optional[float] = None,
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> None:
         """Page.press
 
@@ -10175,15 +10028,13 @@ class Page(AsyncContextManager):
             element, the call throws an exception.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.press(
-                selector=selector,
-                key=key,
-                delay=delay,
-                timeout=timeout,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-            )
+        return await self._impl_obj.press(
+            selector=selector,
+            key=key,
+            delay=delay,
+            timeout=timeout,
+            noWaitAfter=no_wait_after,
+            strict=strict,
         )
 
     async def check(
@@ -10195,7 +10046,7 @@ class Page(AsyncContextManager):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Page.check
 
@@ -10239,17 +10090,15 @@ class Page(AsyncContextManager):
             When set, this method only performs the [actionability](../actionability.md) checks and skips the action. Defaults to
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
-
-        return mapping.from_maybe_impl(
-            await self._impl_obj.check(
-                selector=selector,
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-                trial=trial,
-            )
+
+        return await self._impl_obj.check(
+            selector=selector,
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            strict=strict,
+            trial=trial,
         )
 
     async def uncheck(
@@ -10261,7 +10110,7 @@ class Page(AsyncContextManager):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Page.uncheck
 
@@ -10306,16 +10155,14 @@ class Page(AsyncContextManager):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.uncheck(
-                selector=selector,
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-                trial=trial,
-            )
+        return await self._impl_obj.uncheck(
+            selector=selector,
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            strict=strict,
+            trial=trial,
         )
 
     async def wait_for_timeout(self, timeout: float) -> None:
@@ -10339,9 +10186,7 @@ class Page(AsyncContextManager):
             A timeout to wait for
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.wait_for_timeout(timeout=timeout)
-        )
+        return await self._impl_obj.wait_for_timeout(timeout=timeout)
 
     async def wait_for_function(
         self,
@@ -10349,7 +10194,7 @@ class Page(AsyncContextManager):
         *,
         arg: typing.Optional[typing.Any] = None,
         timeout: typing.Optional[float] = None,
-        polling: typing.Optional[typing.Union[float, Literal["raf"]]] = None
+        polling: typing.Optional[typing.Union[float, Literal["raf"]]] = None,
     ) -> "JSHandle":
         """Page.wait_for_function
 
@@ -10425,7 +10270,7 @@ class Page(AsyncContextManager):
         `browser_type.launch()`.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.pause())
+        return await self._impl_obj.pause()
 
     async def pdf(
         self,
@@ -10442,7 +10287,7 @@ class Page(AsyncContextManager):
         height: typing.Optional[typing.Union[str, float]] = None,
         prefer_css_page_size: typing.Optional[bool] = None,
         margin: typing.Optional[PdfMargins] = None,
-        path: typing.Optional[typing.Union[str, pathlib.Path]] = None
+        path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
     ) -> bytes:
         """Page.pdf
 
@@ -10557,7 +10402,7 @@ class Page(AsyncContextManager):
         event: str,
         predicate: typing.Optional[typing.Callable] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> AsyncEventContextManager:
         """Page.expect_event
 
@@ -10595,7 +10440,7 @@ class Page(AsyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["ConsoleMessage"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> AsyncEventContextManager["ConsoleMessage"]:
         """Page.expect_console_message
 
@@ -10626,7 +10471,7 @@ class Page(AsyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["Download"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> AsyncEventContextManager["Download"]:
         """Page.expect_download
 
@@ -10657,7 +10502,7 @@ class Page(AsyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["FileChooser"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> AsyncEventContextManager["FileChooser"]:
         """Page.expect_file_chooser
 
@@ -10693,7 +10538,7 @@ class Page(AsyncContextManager):
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
         ] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> AsyncEventContextManager["Response"]:
         """Page.expect_navigation
 
@@ -10749,7 +10594,7 @@ class Page(AsyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["Page"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> AsyncEventContextManager["Page"]:
         """Page.expect_popup
 
@@ -10782,7 +10627,7 @@ class Page(AsyncContextManager):
             str, typing.Pattern[str], typing.Callable[["Request"], bool]
         ],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> AsyncEventContextManager["Request"]:
         """Page.expect_request
 
@@ -10825,7 +10670,7 @@ class Page(AsyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["Request"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> AsyncEventContextManager["Request"]:
         """Page.expect_request_finished
 
@@ -10858,7 +10703,7 @@ class Page(AsyncContextManager):
             str, typing.Pattern[str], typing.Callable[["Response"], bool]
         ],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> AsyncEventContextManager["Response"]:
         """Page.expect_response
 
@@ -10902,7 +10747,7 @@ class Page(AsyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["WebSocket"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> AsyncEventContextManager["WebSocket"]:
         """Page.expect_websocket
 
@@ -10933,7 +10778,7 @@ class Page(AsyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["Worker"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> AsyncEventContextManager["Worker"]:
         """Page.expect_worker
 
@@ -10970,7 +10815,7 @@ class Page(AsyncContextManager):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Page.set_checked
 
@@ -11017,17 +10862,15 @@ class Page(AsyncContextManager):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_checked(
-                selector=selector,
-                checked=checked,
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                strict=strict,
-                trial=trial,
-            )
+        return await self._impl_obj.set_checked(
+            selector=selector,
+            checked=checked,
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            strict=strict,
+            trial=trial,
         )
 
 
@@ -11365,9 +11208,7 @@ class BrowserContext(AsyncContextManager):
             Maximum navigation time in milliseconds
         """
 
-        return mapping.from_maybe_impl(
-            self._impl_obj.set_default_navigation_timeout(timeout=timeout)
-        )
+        return self._impl_obj.set_default_navigation_timeout(timeout=timeout)
 
     def set_default_timeout(self, timeout: float) -> None:
         """BrowserContext.set_default_timeout
@@ -11383,9 +11224,7 @@ class BrowserContext(AsyncContextManager):
             Maximum time in milliseconds
         """
 
-        return mapping.from_maybe_impl(
-            self._impl_obj.set_default_timeout(timeout=timeout)
-        )
+        return self._impl_obj.set_default_timeout(timeout=timeout)
 
     async def new_page(self) -> "Page":
         """BrowserContext.new_page
@@ -11436,9 +11275,7 @@ class BrowserContext(AsyncContextManager):
         cookies : List[{name: str, value: str, url: Union[str, None], domain: Union[str, None], path: Union[str, None], expires: Union[float, None], httpOnly: Union[bool, None], secure: Union[bool, None], sameSite: Union["Lax", "None", "Strict", None]}]
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.add_cookies(cookies=mapping.to_impl(cookies))
-        )
+        return await self._impl_obj.add_cookies(cookies=mapping.to_impl(cookies))
 
     async def clear_cookies(self) -> None:
         """BrowserContext.clear_cookies
@@ -11446,7 +11283,7 @@ class BrowserContext(AsyncContextManager):
         Clears context cookies.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.clear_cookies())
+        return await self._impl_obj.clear_cookies()
 
     async def grant_permissions(
         self, permissions: typing.List[str], *, origin: typing.Optional[str] = None
@@ -11479,10 +11316,8 @@ class BrowserContext(AsyncContextManager):
             The [origin] to grant permissions to, e.g. "https://example.com".
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.grant_permissions(
-                permissions=mapping.to_impl(permissions), origin=origin
-            )
+        return await self._impl_obj.grant_permissions(
+            permissions=mapping.to_impl(permissions), origin=origin
         )
 
     async def clear_permissions(self) -> None:
@@ -11498,7 +11333,7 @@ class BrowserContext(AsyncContextManager):
         ```
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.clear_permissions())
+        return await self._impl_obj.clear_permissions()
 
     async def set_geolocation(
         self, geolocation: typing.Optional[Geolocation] = None
@@ -11519,9 +11354,7 @@ class BrowserContext(AsyncContextManager):
         geolocation : Union[{latitude: float, longitude: float, accuracy: Union[float, None]}, None]
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_geolocation(geolocation=geolocation)
-        )
+        return await self._impl_obj.set_geolocation(geolocation=geolocation)
 
     async def set_extra_http_headers(self, headers: typing.Dict[str, str]) -> None:
         """BrowserContext.set_extra_http_headers
@@ -11538,10 +11371,8 @@ class BrowserContext(AsyncContextManager):
             An object containing additional HTTP headers to be sent with every request. All header values must be strings.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_extra_http_headers(
-                headers=mapping.to_impl(headers)
-            )
+        return await self._impl_obj.set_extra_http_headers(
+            headers=mapping.to_impl(headers)
         )
 
     async def set_offline(self, offline: bool) -> None:
@@ -11553,15 +11384,13 @@ class BrowserContext(AsyncContextManager):
             Whether to emulate network being offline for the browser context.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_offline(offline=offline)
-        )
+        return await self._impl_obj.set_offline(offline=offline)
 
     async def add_init_script(
         self,
         script: typing.Optional[str] = None,
         *,
-        path: typing.Optional[typing.Union[str, pathlib.Path]] = None
+        path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
     ) -> None:
         """BrowserContext.add_init_script
 
@@ -11592,16 +11421,14 @@ class BrowserContext(AsyncContextManager):
             directory. Optional.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.add_init_script(script=script, path=path)
-        )
+        return await self._impl_obj.add_init_script(script=script, path=path)
 
     async def expose_binding(
         self,
         name: str,
         callback: typing.Callable,
         *,
-        handle: typing.Optional[bool] = None
+        handle: typing.Optional[bool] = None,
     ) -> None:
         """BrowserContext.expose_binding
 
@@ -11670,10 +11497,8 @@ class BrowserContext(AsyncContextManager):
             supported. When passing by value, multiple arguments are supported.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.expose_binding(
-                name=name, callback=self._wrap_handler(callback), handle=handle
-            )
+        return await self._impl_obj.expose_binding(
+            name=name, callback=self._wrap_handler(callback), handle=handle
         )
 
     async def expose_function(self, name: str, callback: typing.Callable) -> None:
@@ -11729,10 +11554,8 @@ class BrowserContext(AsyncContextManager):
             Callback function that will be called in the Playwright's context.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.expose_function(
-                name=name, callback=self._wrap_handler(callback)
-            )
+        return await self._impl_obj.expose_function(
+            name=name, callback=self._wrap_handler(callback)
         )
 
     async def route(
@@ -11743,7 +11566,7 @@ class BrowserContext(AsyncContextManager):
             typing.Callable[["Route", "Request"], typing.Any],
         ],
         *,
-        times: typing.Optional[int] = None
+        times: typing.Optional[int] = None,
     ) -> None:
         """BrowserContext.route
 
@@ -11806,12 +11629,10 @@ class BrowserContext(AsyncContextManager):
             How often a route should be used. By default it will be used every time.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.route(
-                url=self._wrap_handler(url),
-                handler=self._wrap_handler(handler),
-                times=times,
-            )
+        return await self._impl_obj.route(
+            url=self._wrap_handler(url),
+            handler=self._wrap_handler(handler),
+            times=times,
         )
 
     async def unroute(
@@ -11838,10 +11659,8 @@ class BrowserContext(AsyncContextManager):
             Optional handler function used to register a routing with `browser_context.route()`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.unroute(
-                url=self._wrap_handler(url), handler=self._wrap_handler(handler)
-            )
+        return await self._impl_obj.unroute(
+            url=self._wrap_handler(url), handler=self._wrap_handler(handler)
         )
 
     async def route_from_har(
@@ -11850,7 +11669,7 @@ class BrowserContext(AsyncContextManager):
         *,
         url: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
         not_found: typing.Optional[Literal["abort", "fallback"]] = None,
-        update: typing.Optional[bool] = None
+        update: typing.Optional[bool] = None,
     ) -> None:
         """BrowserContext.route_from_har
 
@@ -11879,10 +11698,8 @@ class BrowserContext(AsyncContextManager):
             written to disk when `browser_context.close()` is called.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.route_from_har(
-                har=har, url=url, not_found=not_found, update=update
-            )
+        return await self._impl_obj.route_from_har(
+            har=har, url=url, not_found=not_found, update=update
         )
 
     def expect_event(
@@ -11890,7 +11707,7 @@ class BrowserContext(AsyncContextManager):
         event: str,
         predicate: typing.Optional[typing.Callable] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> AsyncEventContextManager:
         """BrowserContext.expect_event
 
@@ -11932,7 +11749,7 @@ class BrowserContext(AsyncContextManager):
         > NOTE: The default browser context cannot be closed.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.close())
+        return await self._impl_obj.close()
 
     async def storage_state(
         self, *, path: typing.Optional[typing.Union[str, pathlib.Path]] = None
@@ -11959,7 +11776,7 @@ class BrowserContext(AsyncContextManager):
         event: str,
         predicate: typing.Optional[typing.Callable] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Any:
         """BrowserContext.wait_for_event
 
@@ -11994,7 +11811,7 @@ class BrowserContext(AsyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["Page"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> AsyncEventContextManager["Page"]:
         """BrowserContext.expect_page
 
@@ -12076,7 +11893,7 @@ class CDPSession(AsyncBase):
         send messages.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.detach())
+        return await self._impl_obj.detach()
 
 
 mapping.register(CDPSessionImpl, CDPSession)
@@ -12146,7 +11963,7 @@ class Browser(AsyncContextManager):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.version)
+        return self._impl_obj.version
 
     def is_connected(self) -> bool:
         """Browser.is_connected
@@ -12204,7 +12021,7 @@ class Browser(AsyncContextManager):
             typing.Union[str, typing.Pattern[str]]
         ] = None,
         record_har_mode: typing.Optional[Literal["full", "minimal"]] = None,
-        record_har_content: typing.Optional[Literal["attach", "embed", "omit"]] = None
+        record_har_content: typing.Optional[Literal["attach", "embed", "omit"]] = None,
     ) -> "BrowserContext":
         """Browser.new_context
 
@@ -12419,7 +12236,7 @@ class Browser(AsyncContextManager):
             typing.Union[str, typing.Pattern[str]]
         ] = None,
         record_har_mode: typing.Optional[Literal["full", "minimal"]] = None,
-        record_har_content: typing.Optional[Literal["attach", "embed", "omit"]] = None
+        record_har_content: typing.Optional[Literal["attach", "embed", "omit"]] = None,
     ) -> "Page":
         """Browser.new_page
 
@@ -12592,7 +12409,7 @@ class Browser(AsyncContextManager):
         The `Browser` object itself is considered to be disposed and cannot be used anymore.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.close())
+        return await self._impl_obj.close()
 
     async def new_browser_cdp_session(self) -> "CDPSession":
         """Browser.new_browser_cdp_session
@@ -12614,7 +12431,7 @@ class Browser(AsyncContextManager):
         page: typing.Optional["Page"] = None,
         path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
         screenshots: typing.Optional[bool] = None,
-        categories: typing.Optional[typing.List[str]] = None
+        categories: typing.Optional[typing.List[str]] = None,
     ) -> None:
         """Browser.start_tracing
 
@@ -12643,13 +12460,11 @@ class Browser(AsyncContextManager):
             specify custom categories to use instead of default.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.start_tracing(
-                page=page._impl_obj if page else None,
-                path=path,
-                screenshots=screenshots,
-                categories=mapping.to_impl(categories),
-            )
+        return await self._impl_obj.start_tracing(
+            page=page._impl_obj if page else None,
+            path=path,
+            screenshots=screenshots,
+            categories=mapping.to_impl(categories),
         )
 
     async def stop_tracing(self) -> bytes:
@@ -12683,7 +12498,7 @@ class BrowserType(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.name)
+        return self._impl_obj.name
 
     @property
     def executable_path(self) -> str:
@@ -12695,7 +12510,7 @@ class BrowserType(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.executable_path)
+        return self._impl_obj.executable_path
 
     async def launch(
         self,
@@ -12720,7 +12535,7 @@ class BrowserType(AsyncBase):
         chromium_sandbox: typing.Optional[bool] = None,
         firefox_user_prefs: typing.Optional[
             typing.Dict[str, typing.Union[str, float, bool]]
-        ] = None
+        ] = None,
     ) -> "Browser":
         """BrowserType.launch
 
@@ -12885,7 +12700,7 @@ class BrowserType(AsyncBase):
             typing.Union[str, typing.Pattern[str]]
         ] = None,
         record_har_mode: typing.Optional[Literal["full", "minimal"]] = None,
-        record_har_content: typing.Optional[Literal["attach", "embed", "omit"]] = None
+        record_har_content: typing.Optional[Literal["attach", "embed", "omit"]] = None,
     ) -> "BrowserContext":
         """BrowserType.launch_persistent_context
 
@@ -13102,7 +12917,7 @@ class BrowserType(AsyncBase):
         *,
         timeout: typing.Optional[float] = None,
         slow_mo: typing.Optional[float] = None,
-        headers: typing.Optional[typing.Dict[str, str]] = None
+        headers: typing.Optional[typing.Dict[str, str]] = None,
     ) -> "Browser":
         """BrowserType.connect_over_cdp
 
@@ -13152,7 +12967,7 @@ class BrowserType(AsyncBase):
         *,
         timeout: typing.Optional[float] = None,
         slow_mo: typing.Optional[float] = None,
-        headers: typing.Optional[typing.Dict[str, str]] = None
+        headers: typing.Optional[typing.Dict[str, str]] = None,
     ) -> "Browser":
         """BrowserType.connect
 
@@ -13309,7 +13124,7 @@ class Playwright(AsyncBase):
         ```
         """
 
-        return mapping.from_maybe_impl(self._impl_obj.stop())
+        return self._impl_obj.stop()
 
 
 mapping.register(PlaywrightImpl, Playwright)
@@ -13323,7 +13138,7 @@ class Tracing(AsyncBase):
         title: typing.Optional[str] = None,
         snapshots: typing.Optional[bool] = None,
         screenshots: typing.Optional[bool] = None,
-        sources: typing.Optional[bool] = None
+        sources: typing.Optional[bool] = None,
     ) -> None:
         """Tracing.start
 
@@ -13353,14 +13168,12 @@ class Tracing(AsyncBase):
             Whether to include source files for trace actions.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.start(
-                name=name,
-                title=title,
-                snapshots=snapshots,
-                screenshots=screenshots,
-                sources=sources,
-            )
+        return await self._impl_obj.start(
+            name=name,
+            title=title,
+            snapshots=snapshots,
+            screenshots=screenshots,
+            sources=sources,
         )
 
     async def start_chunk(self, *, title: typing.Optional[str] = None) -> None:
@@ -13392,7 +13205,7 @@ class Tracing(AsyncBase):
             Trace name to be shown in the Trace Viewer.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.start_chunk(title=title))
+        return await self._impl_obj.start_chunk(title=title)
 
     async def stop_chunk(
         self, *, path: typing.Optional[typing.Union[str, pathlib.Path]] = None
@@ -13407,7 +13220,7 @@ class Tracing(AsyncBase):
             Export trace collected since the last `tracing.start_chunk()` call into the file with the given path.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.stop_chunk(path=path))
+        return await self._impl_obj.stop_chunk(path=path)
 
     async def stop(
         self, *, path: typing.Optional[typing.Union[str, pathlib.Path]] = None
@@ -13422,7 +13235,7 @@ class Tracing(AsyncBase):
             Export trace into the file with the given path.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.stop(path=path))
+        return await self._impl_obj.stop(path=path)
 
 
 mapping.register(TracingImpl, Tracing)
@@ -13510,7 +13323,7 @@ class Locator(AsyncBase):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Locator.check
 
@@ -13547,14 +13360,12 @@ class Locator(AsyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.check(
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                trial=trial,
-            )
+        return await self._impl_obj.check(
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            trial=trial,
         )
 
     async def click(
@@ -13570,7 +13381,7 @@ class Locator(AsyncBase):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Locator.click
 
@@ -13613,18 +13424,16 @@ class Locator(AsyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.click(
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                delay=delay,
-                button=button,
-                clickCount=click_count,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                trial=trial,
-            )
+        return await self._impl_obj.click(
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            delay=delay,
+            button=button,
+            clickCount=click_count,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            trial=trial,
         )
 
     async def dblclick(
@@ -13639,7 +13448,7 @@ class Locator(AsyncBase):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Locator.dblclick
 
@@ -13683,17 +13492,15 @@ class Locator(AsyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.dblclick(
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                delay=delay,
-                button=button,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                trial=trial,
-            )
+        return await self._impl_obj.dblclick(
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            delay=delay,
+            button=button,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            trial=trial,
         )
 
     async def dispatch_event(
@@ -13701,7 +13508,7 @@ class Locator(AsyncBase):
         type: str,
         event_init: typing.Optional[typing.Dict] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Locator.dispatch_event
 
@@ -13744,10 +13551,8 @@ class Locator(AsyncBase):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.dispatch_event(
-                type=type, eventInit=mapping.to_impl(event_init), timeout=timeout
-            )
+        return await self._impl_obj.dispatch_event(
+            type=type, eventInit=mapping.to_impl(event_init), timeout=timeout
         )
 
     async def evaluate(
@@ -13755,7 +13560,7 @@ class Locator(AsyncBase):
         expression: str,
         arg: typing.Optional[typing.Any] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Any:
         """Locator.evaluate
 
@@ -13836,7 +13641,7 @@ class Locator(AsyncBase):
         expression: str,
         arg: typing.Optional[typing.Any] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> "JSHandle":
         """Locator.evaluate_handle
 
@@ -13880,7 +13685,7 @@ class Locator(AsyncBase):
         *,
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
-        force: typing.Optional[bool] = None
+        force: typing.Optional[bool] = None,
     ) -> None:
         """Locator.fill
 
@@ -13909,10 +13714,8 @@ class Locator(AsyncBase):
             Whether to bypass the [actionability](../actionability.md) checks. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.fill(
-                value=value, timeout=timeout, noWaitAfter=no_wait_after, force=force
-            )
+        return await self._impl_obj.fill(
+            value=value, timeout=timeout, noWaitAfter=no_wait_after, force=force
         )
 
     async def clear(
@@ -13920,7 +13723,7 @@ class Locator(AsyncBase):
         *,
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
-        force: typing.Optional[bool] = None
+        force: typing.Optional[bool] = None,
     ) -> None:
         """Locator.clear
 
@@ -13945,10 +13748,8 @@ class Locator(AsyncBase):
             Whether to bypass the [actionability](../actionability.md) checks. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.clear(
-                timeout=timeout, noWaitAfter=no_wait_after, force=force
-            )
+        return await self._impl_obj.clear(
+            timeout=timeout, noWaitAfter=no_wait_after, force=force
         )
 
     def locator(
@@ -13956,7 +13757,7 @@ class Locator(AsyncBase):
         selector: str,
         *,
         has_text: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
-        has: typing.Optional["Locator"] = None
+        has: typing.Optional["Locator"] = None,
     ) -> "Locator":
         """Locator.locator
 
@@ -13994,7 +13795,7 @@ class Locator(AsyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Locator.get_by_alt_text
 
@@ -14023,7 +13824,7 @@ class Locator(AsyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Locator.get_by_label
 
@@ -14054,7 +13855,7 @@ class Locator(AsyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Locator.get_by_placeholder
 
@@ -14177,7 +13978,7 @@ class Locator(AsyncBase):
         name: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
         pressed: typing.Optional[bool] = None,
         selected: typing.Optional[bool] = None,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Locator.get_by_role
 
@@ -14277,7 +14078,7 @@ class Locator(AsyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Locator.get_by_text
 
@@ -14334,7 +14135,7 @@ class Locator(AsyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Locator.get_by_title
 
@@ -14435,7 +14236,7 @@ class Locator(AsyncBase):
         self,
         *,
         has_text: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
-        has: typing.Optional["Locator"] = None
+        has: typing.Optional["Locator"] = None,
     ) -> "Locator":
         """Locator.filter
 
@@ -14484,7 +14285,7 @@ class Locator(AsyncBase):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.focus(timeout=timeout))
+        return await self._impl_obj.focus(timeout=timeout)
 
     async def blur(self, *, timeout: typing.Optional[float] = None) -> None:
         """Locator.blur
@@ -14498,7 +14299,7 @@ class Locator(AsyncBase):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.blur(timeout=timeout))
+        return await self._impl_obj.blur(timeout=timeout)
 
     async def count(self) -> int:
         """Locator.count
@@ -14521,7 +14322,7 @@ class Locator(AsyncBase):
         timeout: typing.Optional[float] = None,
         trial: typing.Optional[bool] = None,
         source_position: typing.Optional[Position] = None,
-        target_position: typing.Optional[Position] = None
+        target_position: typing.Optional[Position] = None,
     ) -> None:
         """Locator.drag_to
 
@@ -14565,16 +14366,14 @@ class Locator(AsyncBase):
             specified, some visible point of the element is used.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.drag_to(
-                target=target._impl_obj,
-                force=force,
-                noWaitAfter=no_wait_after,
-                timeout=timeout,
-                trial=trial,
-                sourcePosition=source_position,
-                targetPosition=target_position,
-            )
+        return await self._impl_obj.drag_to(
+            target=target._impl_obj,
+            force=force,
+            noWaitAfter=no_wait_after,
+            timeout=timeout,
+            trial=trial,
+            sourcePosition=source_position,
+            targetPosition=target_position,
         )
 
     async def get_attribute(
@@ -14611,7 +14410,7 @@ class Locator(AsyncBase):
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
         force: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Locator.hover
 
@@ -14648,15 +14447,13 @@ class Locator(AsyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.hover(
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                timeout=timeout,
-                noWaitAfter=no_wait_after,
-                force=force,
-                trial=trial,
-            )
+        return await self._impl_obj.hover(
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            timeout=timeout,
+            noWaitAfter=no_wait_after,
+            force=force,
+            trial=trial,
         )
 
     async def inner_html(self, *, timeout: typing.Optional[float] = None) -> str:
@@ -14836,7 +14633,7 @@ class Locator(AsyncBase):
         *,
         delay: typing.Optional[float] = None,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """Locator.press
 
@@ -14874,10 +14671,8 @@ class Locator(AsyncBase):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.press(
-                key=key, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
-            )
+        return await self._impl_obj.press(
+            key=key, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
         )
 
     async def screenshot(
@@ -14891,7 +14686,7 @@ class Locator(AsyncBase):
         animations: typing.Optional[Literal["allow", "disabled"]] = None,
         caret: typing.Optional[Literal["hide", "initial"]] = None,
         scale: typing.Optional[Literal["css", "device"]] = None,
-        mask: typing.Optional[typing.List["Locator"]] = None
+        mask: typing.Optional[typing.List["Locator"]] = None,
     ) -> bytes:
         """Locator.screenshot
 
@@ -14975,9 +14770,7 @@ class Locator(AsyncBase):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.scroll_into_view_if_needed(timeout=timeout)
-        )
+        return await self._impl_obj.scroll_into_view_if_needed(timeout=timeout)
 
     async def select_option(
         self,
@@ -14990,7 +14783,7 @@ class Locator(AsyncBase):
         ] = None,
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
-        force: typing.Optional[bool] = None
+        force: typing.Optional[bool] = None,
     ) -> typing.List[str]:
         """Locator.select_option
 
@@ -15057,7 +14850,7 @@ class Locator(AsyncBase):
         self,
         *,
         force: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Locator.select_text
 
@@ -15077,9 +14870,7 @@ class Locator(AsyncBase):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.select_text(force=force, timeout=timeout)
-        )
+        return await self._impl_obj.select_text(force=force, timeout=timeout)
 
     async def set_input_files(
         self,
@@ -15092,7 +14883,7 @@ class Locator(AsyncBase):
         ],
         *,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """Locator.set_input_files
 
@@ -15116,10 +14907,8 @@ class Locator(AsyncBase):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_input_files(
-                files=mapping.to_impl(files), timeout=timeout, noWaitAfter=no_wait_after
-            )
+        return await self._impl_obj.set_input_files(
+            files=mapping.to_impl(files), timeout=timeout, noWaitAfter=no_wait_after
         )
 
     async def tap(
@@ -15132,7 +14921,7 @@ class Locator(AsyncBase):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Locator.tap
 
@@ -15171,15 +14960,13 @@ class Locator(AsyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.tap(
-                modifiers=mapping.to_impl(modifiers),
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                trial=trial,
-            )
+        return await self._impl_obj.tap(
+            modifiers=mapping.to_impl(modifiers),
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            trial=trial,
         )
 
     async def text_content(
@@ -15210,7 +14997,7 @@ class Locator(AsyncBase):
         *,
         delay: typing.Optional[float] = None,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """Locator.type
 
@@ -15246,10 +15033,8 @@ class Locator(AsyncBase):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.type(
-                text=text, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
-            )
+        return await self._impl_obj.type(
+            text=text, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
         )
 
     async def uncheck(
@@ -15259,7 +15044,7 @@ class Locator(AsyncBase):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Locator.uncheck
 
@@ -15296,14 +15081,12 @@ class Locator(AsyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.uncheck(
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                trial=trial,
-            )
+        return await self._impl_obj.uncheck(
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            trial=trial,
         )
 
     async def all_inner_texts(self) -> typing.List[str]:
@@ -15336,7 +15119,7 @@ class Locator(AsyncBase):
         timeout: typing.Optional[float] = None,
         state: typing.Optional[
             Literal["attached", "detached", "hidden", "visible"]
-        ] = None
+        ] = None,
     ) -> None:
         """Locator.wait_for
 
@@ -15365,9 +15148,7 @@ class Locator(AsyncBase):
               This is opposite to the `'visible'` option.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.wait_for(timeout=timeout, state=state)
-        )
+        return await self._impl_obj.wait_for(timeout=timeout, state=state)
 
     async def set_checked(
         self,
@@ -15377,7 +15158,7 @@ class Locator(AsyncBase):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Locator.set_checked
 
@@ -15415,15 +15196,13 @@ class Locator(AsyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.set_checked(
-                checked=checked,
-                position=position,
-                timeout=timeout,
-                force=force,
-                noWaitAfter=no_wait_after,
-                trial=trial,
-            )
+        return await self._impl_obj.set_checked(
+            checked=checked,
+            position=position,
+            timeout=timeout,
+            force=force,
+            noWaitAfter=no_wait_after,
+            trial=trial,
         )
 
     async def highlight(self) -> None:
@@ -15433,7 +15212,7 @@ class Locator(AsyncBase):
         `locator.highlight()`.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.highlight())
+        return await self._impl_obj.highlight()
 
 
 mapping.register(LocatorImpl, Locator)
@@ -15450,7 +15229,7 @@ class APIResponse(AsyncBase):
         -------
         bool
         """
-        return mapping.from_maybe_impl(self._impl_obj.ok)
+        return self._impl_obj.ok
 
     @property
     def url(self) -> str:
@@ -15462,7 +15241,7 @@ class APIResponse(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     @property
     def status(self) -> int:
@@ -15474,7 +15253,7 @@ class APIResponse(AsyncBase):
         -------
         int
         """
-        return mapping.from_maybe_impl(self._impl_obj.status)
+        return self._impl_obj.status
 
     @property
     def status_text(self) -> str:
@@ -15486,7 +15265,7 @@ class APIResponse(AsyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.status_text)
+        return self._impl_obj.status_text
 
     @property
     def headers(self) -> typing.Dict[str, str]:
@@ -15557,7 +15336,7 @@ class APIResponse(AsyncBase):
         Disposes the body of this response. If not called then the body will stay in memory until the context closes.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.dispose())
+        return await self._impl_obj.dispose()
 
 
 mapping.register(APIResponseImpl, APIResponse)
@@ -15572,7 +15351,7 @@ class APIRequestContext(AsyncBase):
         `a_pi_response.body()` throw \"Response disposed\" error.
         """
 
-        return mapping.from_maybe_impl(await self._impl_obj.dispose())
+        return await self._impl_obj.dispose()
 
     async def delete(
         self,
@@ -15590,7 +15369,7 @@ class APIRequestContext(AsyncBase):
         timeout: typing.Optional[float] = None,
         fail_on_status_code: typing.Optional[bool] = None,
         ignore_https_errors: typing.Optional[bool] = None,
-        max_redirects: typing.Optional[int] = None
+        max_redirects: typing.Optional[int] = None,
     ) -> "APIResponse":
         """APIRequestContext.delete
 
@@ -15665,7 +15444,7 @@ class APIRequestContext(AsyncBase):
         timeout: typing.Optional[float] = None,
         fail_on_status_code: typing.Optional[bool] = None,
         ignore_https_errors: typing.Optional[bool] = None,
-        max_redirects: typing.Optional[int] = None
+        max_redirects: typing.Optional[int] = None,
     ) -> "APIResponse":
         """APIRequestContext.head
 
@@ -15740,7 +15519,7 @@ class APIRequestContext(AsyncBase):
         timeout: typing.Optional[float] = None,
         fail_on_status_code: typing.Optional[bool] = None,
         ignore_https_errors: typing.Optional[bool] = None,
-        max_redirects: typing.Optional[int] = None
+        max_redirects: typing.Optional[int] = None,
     ) -> "APIResponse":
         """APIRequestContext.get
 
@@ -15825,7 +15604,7 @@ class APIRequestContext(AsyncBase):
         timeout: typing.Optional[float] = None,
         fail_on_status_code: typing.Optional[bool] = None,
         ignore_https_errors: typing.Optional[bool] = None,
-        max_redirects: typing.Optional[int] = None
+        max_redirects: typing.Optional[int] = None,
     ) -> "APIResponse":
         """APIRequestContext.patch
 
@@ -15900,7 +15679,7 @@ class APIRequestContext(AsyncBase):
         timeout: typing.Optional[float] = None,
         fail_on_status_code: typing.Optional[bool] = None,
         ignore_https_errors: typing.Optional[bool] = None,
-        max_redirects: typing.Optional[int] = None
+        max_redirects: typing.Optional[int] = None,
     ) -> "APIResponse":
         """APIRequestContext.put
 
@@ -15975,7 +15754,7 @@ class APIRequestContext(AsyncBase):
         timeout: typing.Optional[float] = None,
         fail_on_status_code: typing.Optional[bool] = None,
         ignore_https_errors: typing.Optional[bool] = None,
-        max_redirects: typing.Optional[int] = None
+        max_redirects: typing.Optional[int] = None,
     ) -> "APIResponse":
         """APIRequestContext.post
 
@@ -16087,7 +15866,7 @@ class APIRequestContext(AsyncBase):
         timeout: typing.Optional[float] = None,
         fail_on_status_code: typing.Optional[bool] = None,
         ignore_https_errors: typing.Optional[bool] = None,
-        max_redirects: typing.Optional[int] = None
+        max_redirects: typing.Optional[int] = None,
     ) -> "APIResponse":
         """APIRequestContext.fetch
 
@@ -16213,7 +15992,7 @@ class APIRequest(AsyncBase):
         timeout: typing.Optional[float] = None,
         storage_state: typing.Optional[
             typing.Union[StorageState, str, pathlib.Path]
-        ] = None
+        ] = None,
     ) -> "APIRequestContext":
         """APIRequest.new_context
 
@@ -16275,7 +16054,7 @@ class PageAssertions(AsyncBase):
         self,
         title_or_reg_exp: typing.Union[typing.Pattern[str], str],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """PageAssertions.to_have_title
 
@@ -16298,17 +16077,15 @@ class PageAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_have_title(
-                title_or_reg_exp=title_or_reg_exp, timeout=timeout
-            )
+        return await self._impl_obj.to_have_title(
+            title_or_reg_exp=title_or_reg_exp, timeout=timeout
         )
 
     async def not_to_have_title(
         self,
         title_or_reg_exp: typing.Union[typing.Pattern[str], str],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """PageAssertions.not_to_have_title
 
@@ -16323,17 +16100,15 @@ class PageAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_have_title(
-                title_or_reg_exp=title_or_reg_exp, timeout=timeout
-            )
+        return await self._impl_obj.not_to_have_title(
+            title_or_reg_exp=title_or_reg_exp, timeout=timeout
         )
 
     async def to_have_url(
         self,
         url_or_reg_exp: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """PageAssertions.to_have_url
 
@@ -16356,17 +16131,15 @@ class PageAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_have_url(
-                url_or_reg_exp=url_or_reg_exp, timeout=timeout
-            )
+        return await self._impl_obj.to_have_url(
+            url_or_reg_exp=url_or_reg_exp, timeout=timeout
         )
 
     async def not_to_have_url(
         self,
         url_or_reg_exp: typing.Union[typing.Pattern[str], str],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """PageAssertions.not_to_have_url
 
@@ -16381,10 +16154,8 @@ class PageAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_have_url(
-                url_or_reg_exp=url_or_reg_exp, timeout=timeout
-            )
+        return await self._impl_obj.not_to_have_url(
+            url_or_reg_exp=url_or_reg_exp, timeout=timeout
         )
 
 
@@ -16402,7 +16173,7 @@ class LocatorAssertions(AsyncBase):
         *,
         use_inner_text: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        ignore_case: typing.Optional[bool] = None
+        ignore_case: typing.Optional[bool] = None,
     ) -> None:
         """LocatorAssertions.to_contain_text
 
@@ -16466,13 +16237,11 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_contain_text(
-                expected=mapping.to_impl(expected),
-                use_inner_text=use_inner_text,
-                timeout=timeout,
-                ignore_case=ignore_case,
-            )
+        return await self._impl_obj.to_contain_text(
+            expected=mapping.to_impl(expected),
+            use_inner_text=use_inner_text,
+            timeout=timeout,
+            ignore_case=ignore_case,
         )
 
     async def not_to_contain_text(
@@ -16485,7 +16254,7 @@ class LocatorAssertions(AsyncBase):
         *,
         use_inner_text: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        ignore_case: typing.Optional[bool] = None
+        ignore_case: typing.Optional[bool] = None,
     ) -> None:
         """LocatorAssertions.not_to_contain_text
 
@@ -16505,13 +16274,11 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_contain_text(
-                expected=mapping.to_impl(expected),
-                use_inner_text=use_inner_text,
-                timeout=timeout,
-                ignore_case=ignore_case,
-            )
+        return await self._impl_obj.not_to_contain_text(
+            expected=mapping.to_impl(expected),
+            use_inner_text=use_inner_text,
+            timeout=timeout,
+            ignore_case=ignore_case,
         )
 
     async def to_have_attribute(
@@ -16519,7 +16286,7 @@ class LocatorAssertions(AsyncBase):
         name: str,
         value: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_have_attribute
 
@@ -16543,10 +16310,8 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_have_attribute(
-                name=name, value=value, timeout=timeout
-            )
+        return await self._impl_obj.to_have_attribute(
+            name=name, value=value, timeout=timeout
         )
 
     async def not_to_have_attribute(
@@ -16554,7 +16319,7 @@ class LocatorAssertions(AsyncBase):
         name: str,
         value: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_have_attribute
 
@@ -16571,10 +16336,8 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_have_attribute(
-                name=name, value=value, timeout=timeout
-            )
+        return await self._impl_obj.not_to_have_attribute(
+            name=name, value=value, timeout=timeout
         )
 
     async def to_have_class(
@@ -16585,7 +16348,7 @@ class LocatorAssertions(AsyncBase):
             str,
         ],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_have_class
 
@@ -16622,10 +16385,8 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_have_class(
-                expected=mapping.to_impl(expected), timeout=timeout
-            )
+        return await self._impl_obj.to_have_class(
+            expected=mapping.to_impl(expected), timeout=timeout
         )
 
     async def not_to_have_class(
@@ -16636,7 +16397,7 @@ class LocatorAssertions(AsyncBase):
             str,
         ],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_have_class
 
@@ -16651,10 +16412,8 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_have_class(
-                expected=mapping.to_impl(expected), timeout=timeout
-            )
+        return await self._impl_obj.not_to_have_class(
+            expected=mapping.to_impl(expected), timeout=timeout
         )
 
     async def to_have_count(
@@ -16680,9 +16439,7 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_have_count(count=count, timeout=timeout)
-        )
+        return await self._impl_obj.to_have_count(count=count, timeout=timeout)
 
     async def not_to_have_count(
         self, count: int, *, timeout: typing.Optional[float] = None
@@ -16700,16 +16457,14 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_have_count(count=count, timeout=timeout)
-        )
+        return await self._impl_obj.not_to_have_count(count=count, timeout=timeout)
 
     async def to_have_css(
         self,
         name: str,
         value: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_have_css
 
@@ -16733,16 +16488,14 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_have_css(name=name, value=value, timeout=timeout)
-        )
+        return await self._impl_obj.to_have_css(name=name, value=value, timeout=timeout)
 
     async def not_to_have_css(
         self,
         name: str,
         value: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_have_css
 
@@ -16759,17 +16512,15 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_have_css(
-                name=name, value=value, timeout=timeout
-            )
+        return await self._impl_obj.not_to_have_css(
+            name=name, value=value, timeout=timeout
         )
 
     async def to_have_id(
         self,
         id: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_have_id
 
@@ -16791,15 +16542,13 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_have_id(id=id, timeout=timeout)
-        )
+        return await self._impl_obj.to_have_id(id=id, timeout=timeout)
 
     async def not_to_have_id(
         self,
         id: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_have_id
 
@@ -16814,9 +16563,7 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_have_id(id=id, timeout=timeout)
-        )
+        return await self._impl_obj.not_to_have_id(id=id, timeout=timeout)
 
     async def to_have_js_property(
         self, name: str, value: typing.Any, *, timeout: typing.Optional[float] = None
@@ -16844,10 +16591,8 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_have_js_property(
-                name=name, value=mapping.to_impl(value), timeout=timeout
-            )
+        return await self._impl_obj.to_have_js_property(
+            name=name, value=mapping.to_impl(value), timeout=timeout
         )
 
     async def not_to_have_js_property(
@@ -16868,17 +16613,15 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_have_js_property(
-                name=name, value=mapping.to_impl(value), timeout=timeout
-            )
+        return await self._impl_obj.not_to_have_js_property(
+            name=name, value=mapping.to_impl(value), timeout=timeout
         )
 
     async def to_have_value(
         self,
         value: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_have_value
 
@@ -16902,15 +16645,13 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_have_value(value=value, timeout=timeout)
-        )
+        return await self._impl_obj.to_have_value(value=value, timeout=timeout)
 
     async def not_to_have_value(
         self,
         value: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_have_value
 
@@ -16925,15 +16666,13 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_have_value(value=value, timeout=timeout)
-        )
+        return await self._impl_obj.not_to_have_value(value=value, timeout=timeout)
 
     async def to_have_values(
         self,
         values: typing.List[typing.Union[typing.Pattern[str], str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_have_values
 
@@ -16968,17 +16707,15 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_have_values(
-                values=mapping.to_impl(values), timeout=timeout
-            )
+        return await self._impl_obj.to_have_values(
+            values=mapping.to_impl(values), timeout=timeout
         )
 
     async def not_to_have_values(
         self,
         values: typing.List[typing.Union[typing.Pattern[str], str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_have_values
 
@@ -16993,10 +16730,8 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_have_values(
-                values=mapping.to_impl(values), timeout=timeout
-            )
+        return await self._impl_obj.not_to_have_values(
+            values=mapping.to_impl(values), timeout=timeout
         )
 
     async def to_have_text(
@@ -17009,7 +16744,7 @@ class LocatorAssertions(AsyncBase):
         *,
         use_inner_text: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        ignore_case: typing.Optional[bool] = None
+        ignore_case: typing.Optional[bool] = None,
     ) -> None:
         """LocatorAssertions.to_have_text
 
@@ -17071,13 +16806,11 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_have_text(
-                expected=mapping.to_impl(expected),
-                use_inner_text=use_inner_text,
-                timeout=timeout,
-                ignore_case=ignore_case,
-            )
+        return await self._impl_obj.to_have_text(
+            expected=mapping.to_impl(expected),
+            use_inner_text=use_inner_text,
+            timeout=timeout,
+            ignore_case=ignore_case,
         )
 
     async def not_to_have_text(
@@ -17090,7 +16823,7 @@ class LocatorAssertions(AsyncBase):
         *,
         use_inner_text: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        ignore_case: typing.Optional[bool] = None
+        ignore_case: typing.Optional[bool] = None,
     ) -> None:
         """LocatorAssertions.not_to_have_text
 
@@ -17110,20 +16843,18 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_have_text(
-                expected=mapping.to_impl(expected),
-                use_inner_text=use_inner_text,
-                timeout=timeout,
-                ignore_case=ignore_case,
-            )
+        return await self._impl_obj.not_to_have_text(
+            expected=mapping.to_impl(expected),
+            use_inner_text=use_inner_text,
+            timeout=timeout,
+            ignore_case=ignore_case,
         )
 
     async def to_be_checked(
         self,
         *,
         timeout: typing.Optional[float] = None,
-        checked: typing.Optional[bool] = None
+        checked: typing.Optional[bool] = None,
     ) -> None:
         """LocatorAssertions.to_be_checked
 
@@ -17144,9 +16875,7 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_be_checked(timeout=timeout, checked=checked)
-        )
+        return await self._impl_obj.to_be_checked(timeout=timeout, checked=checked)
 
     async def not_to_be_checked(
         self, *, timeout: typing.Optional[float] = None
@@ -17162,9 +16891,7 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_be_checked(timeout=timeout)
-        )
+        return await self._impl_obj.not_to_be_checked(timeout=timeout)
 
     async def to_be_disabled(self, *, timeout: typing.Optional[float] = None) -> None:
         """LocatorAssertions.to_be_disabled
@@ -17188,9 +16915,7 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_be_disabled(timeout=timeout)
-        )
+        return await self._impl_obj.to_be_disabled(timeout=timeout)
 
     async def not_to_be_disabled(
         self, *, timeout: typing.Optional[float] = None
@@ -17206,15 +16931,13 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_be_disabled(timeout=timeout)
-        )
+        return await self._impl_obj.not_to_be_disabled(timeout=timeout)
 
     async def to_be_editable(
         self,
         *,
         editable: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_be_editable
 
@@ -17235,15 +16958,13 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_be_editable(editable=editable, timeout=timeout)
-        )
+        return await self._impl_obj.to_be_editable(editable=editable, timeout=timeout)
 
     async def not_to_be_editable(
         self,
         *,
         editable: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_be_editable
 
@@ -17257,8 +16978,8 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_be_editable(editable=editable, timeout=timeout)
+        return await self._impl_obj.not_to_be_editable(
+            editable=editable, timeout=timeout
         )
 
     async def to_be_empty(self, *, timeout: typing.Optional[float] = None) -> None:
@@ -17280,9 +17001,7 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_be_empty(timeout=timeout)
-        )
+        return await self._impl_obj.to_be_empty(timeout=timeout)
 
     async def not_to_be_empty(self, *, timeout: typing.Optional[float] = None) -> None:
         """LocatorAssertions.not_to_be_empty
@@ -17296,15 +17015,13 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_be_empty(timeout=timeout)
-        )
+        return await self._impl_obj.not_to_be_empty(timeout=timeout)
 
     async def to_be_enabled(
         self,
         *,
         enabled: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_be_enabled
 
@@ -17325,15 +17042,13 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_be_enabled(enabled=enabled, timeout=timeout)
-        )
+        return await self._impl_obj.to_be_enabled(enabled=enabled, timeout=timeout)
 
     async def not_to_be_enabled(
         self,
         *,
         enabled: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_be_enabled
 
@@ -17347,9 +17062,7 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_be_enabled(enabled=enabled, timeout=timeout)
-        )
+        return await self._impl_obj.not_to_be_enabled(enabled=enabled, timeout=timeout)
 
     async def to_be_hidden(self, *, timeout: typing.Optional[float] = None) -> None:
         """LocatorAssertions.to_be_hidden
@@ -17371,9 +17084,7 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_be_hidden(timeout=timeout)
-        )
+        return await self._impl_obj.to_be_hidden(timeout=timeout)
 
     async def not_to_be_hidden(self, *, timeout: typing.Optional[float] = None) -> None:
         """LocatorAssertions.not_to_be_hidden
@@ -17387,15 +17098,13 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_be_hidden(timeout=timeout)
-        )
+        return await self._impl_obj.not_to_be_hidden(timeout=timeout)
 
     async def to_be_visible(
         self,
         *,
         visible: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_be_visible
 
@@ -17417,15 +17126,13 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_be_visible(visible=visible, timeout=timeout)
-        )
+        return await self._impl_obj.to_be_visible(visible=visible, timeout=timeout)
 
     async def not_to_be_visible(
         self,
         *,
         visible: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_be_visible
 
@@ -17439,9 +17146,7 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_be_visible(visible=visible, timeout=timeout)
-        )
+        return await self._impl_obj.not_to_be_visible(visible=visible, timeout=timeout)
 
     async def to_be_focused(self, *, timeout: typing.Optional[float] = None) -> None:
         """LocatorAssertions.to_be_focused
@@ -17462,9 +17167,7 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.to_be_focused(timeout=timeout)
-        )
+        return await self._impl_obj.to_be_focused(timeout=timeout)
 
     async def not_to_be_focused(
         self, *, timeout: typing.Optional[float] = None
@@ -17480,9 +17183,7 @@ class LocatorAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            await self._impl_obj.not_to_be_focused(timeout=timeout)
-        )
+        return await self._impl_obj.not_to_be_focused(timeout=timeout)
 
 
 mapping.register(LocatorAssertionsImpl, LocatorAssertions)
@@ -17503,7 +17204,7 @@ class APIResponseAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(await self._impl_obj.to_be_ok())
+        return await self._impl_obj.to_be_ok()
 
     async def not_to_be_ok(self) -> None:
         """APIResponseAssertions.not_to_be_ok
@@ -17512,7 +17213,7 @@ class APIResponseAssertions(AsyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(await self._impl_obj.not_to_be_ok())
+        return await self._impl_obj.not_to_be_ok()
 
 
 mapping.register(APIResponseAssertionsImpl, APIResponseAssertions)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
 
 import pathlib
 import sys
@@ -96,7 +97,7 @@ class Request(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     @property
     def resource_type(self) -> str:
@@ -110,7 +111,7 @@ class Request(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.resource_type)
+        return self._impl_obj.resource_type
 
     @property
     def method(self) -> str:
@@ -122,7 +123,7 @@ class Request(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.method)
+        return self._impl_obj.method
 
     @property
     def post_data(self) -> typing.Optional[str]:
@@ -134,7 +135,7 @@ class Request(SyncBase):
         -------
         Union[str, None]
         """
-        return mapping.from_maybe_impl(self._impl_obj.post_data)
+        return self._impl_obj.post_data
 
     @property
     def post_data_json(self) -> typing.Optional[typing.Any]:
@@ -161,7 +162,7 @@ class Request(SyncBase):
         -------
         Union[bytes, None]
         """
-        return mapping.from_maybe_impl(self._impl_obj.post_data_buffer)
+        return self._impl_obj.post_data_buffer
 
     @property
     def frame(self) -> "Frame":
@@ -239,7 +240,7 @@ class Request(SyncBase):
         -------
         Union[str, None]
         """
-        return mapping.from_maybe_impl(self._impl_obj.failure)
+        return self._impl_obj.failure
 
     @property
     def timing(self) -> ResourceTiming:
@@ -371,7 +372,7 @@ class Response(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     @property
     def ok(self) -> bool:
@@ -383,7 +384,7 @@ class Response(SyncBase):
         -------
         bool
         """
-        return mapping.from_maybe_impl(self._impl_obj.ok)
+        return self._impl_obj.ok
 
     @property
     def status(self) -> int:
@@ -395,7 +396,7 @@ class Response(SyncBase):
         -------
         int
         """
-        return mapping.from_maybe_impl(self._impl_obj.status)
+        return self._impl_obj.status
 
     @property
     def status_text(self) -> str:
@@ -407,7 +408,7 @@ class Response(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.status_text)
+        return self._impl_obj.status_text
 
     @property
     def headers(self) -> typing.Dict[str, str]:
@@ -434,7 +435,7 @@ class Response(SyncBase):
         -------
         bool
         """
-        return mapping.from_maybe_impl(self._impl_obj.from_service_worker)
+        return self._impl_obj.from_service_worker
 
     @property
     def request(self) -> "Request":
@@ -555,7 +556,7 @@ class Response(SyncBase):
         Waits for this response to finish, returns always `null`.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.finished()))
+        return self._sync(self._impl_obj.finished())
 
     def body(self) -> bytes:
         """Response.body
@@ -639,9 +640,7 @@ class Route(SyncBase):
             - `'failed'` - A generic failure occurred.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.abort(errorCode=error_code))
-        )
+        return self._sync(self._impl_obj.abort(errorCode=error_code))
 
     def fulfill(
         self,
@@ -651,7 +650,7 @@ class Route(SyncBase):
         body: typing.Optional[typing.Union[str, bytes]] = None,
         path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
         content_type: typing.Optional[str] = None,
-        response: typing.Optional["APIResponse"] = None
+        response: typing.Optional["APIResponse"] = None,
     ) -> None:
         """Route.fulfill
 
@@ -690,16 +689,14 @@ class Route(SyncBase):
             using fulfill options.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.fulfill(
-                    status=status,
-                    headers=mapping.to_impl(headers),
-                    body=body,
-                    path=path,
-                    contentType=content_type,
-                    response=response._impl_obj if response else None,
-                )
+        return self._sync(
+            self._impl_obj.fulfill(
+                status=status,
+                headers=mapping.to_impl(headers),
+                body=body,
+                path=path,
+                contentType=content_type,
+                response=response._impl_obj if response else None,
             )
         )
 
@@ -709,7 +706,7 @@ class Route(SyncBase):
         url: typing.Optional[str] = None,
         method: typing.Optional[str] = None,
         headers: typing.Optional[typing.Dict[str, str]] = None,
-        post_data: typing.Optional[typing.Union[str, bytes]] = None
+        post_data: typing.Optional[typing.Union[str, bytes]] = None,
     ) -> None:
         """Route.fallback
 
@@ -777,14 +774,12 @@ class Route(SyncBase):
             If set changes the post data of request
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.fallback(
-                    url=url,
-                    method=method,
-                    headers=mapping.to_impl(headers),
-                    postData=post_data,
-                )
+        return self._sync(
+            self._impl_obj.fallback(
+                url=url,
+                method=method,
+                headers=mapping.to_impl(headers),
+                postData=post_data,
             )
         )
 
@@ -794,7 +789,7 @@ class Route(SyncBase):
         url: typing.Optional[str] = None,
         method: typing.Optional[str] = None,
         headers: typing.Optional[typing.Dict[str, str]] = None,
-        post_data: typing.Optional[typing.Union[str, bytes]] = None
+        post_data: typing.Optional[typing.Union[str, bytes]] = None,
     ) -> None:
         """Route.continue_
 
@@ -825,14 +820,12 @@ class Route(SyncBase):
             If set changes the post data of request
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.continue_(
-                    url=url,
-                    method=method,
-                    headers=mapping.to_impl(headers),
-                    postData=post_data,
-                )
+        return self._sync(
+            self._impl_obj.continue_(
+                url=url,
+                method=method,
+                headers=mapping.to_impl(headers),
+                postData=post_data,
             )
         )
 
@@ -917,14 +910,14 @@ class WebSocket(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     def expect_event(
         self,
         event: str,
         predicate: typing.Optional[typing.Callable] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> EventContextManager:
         """WebSocket.expect_event
 
@@ -957,7 +950,7 @@ class WebSocket(SyncBase):
         event: str,
         predicate: typing.Optional[typing.Callable] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Any:
         """WebSocket.wait_for_event
 
@@ -1043,7 +1036,7 @@ class Keyboard(SyncBase):
             Name of the key to press or a character to generate, such as `ArrowLeft` or `a`.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.down(key=key)))
+        return self._sync(self._impl_obj.down(key=key))
 
     def up(self, key: str) -> None:
         """Keyboard.up
@@ -1056,7 +1049,7 @@ class Keyboard(SyncBase):
             Name of the key to press or a character to generate, such as `ArrowLeft` or `a`.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.up(key=key)))
+        return self._sync(self._impl_obj.up(key=key))
 
     def insert_text(self, text: str) -> None:
         """Keyboard.insert_text
@@ -1075,9 +1068,7 @@ class Keyboard(SyncBase):
             Sets input to the specified text value.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.insert_text(text=text))
-        )
+        return self._sync(self._impl_obj.insert_text(text=text))
 
     def type(self, text: str, *, delay: typing.Optional[float] = None) -> None:
         """Keyboard.type
@@ -1102,9 +1093,7 @@ class Keyboard(SyncBase):
             Time to wait between key presses in milliseconds. Defaults to 0.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.type(text=text, delay=delay))
-        )
+        return self._sync(self._impl_obj.type(text=text, delay=delay))
 
     def press(self, key: str, *, delay: typing.Optional[float] = None) -> None:
         """Keyboard.press
@@ -1148,9 +1137,7 @@ class Keyboard(SyncBase):
             Time to wait between `keydown` and `keyup` in milliseconds. Defaults to 0.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.press(key=key, delay=delay))
-        )
+        return self._sync(self._impl_obj.press(key=key, delay=delay))
 
 
 mapping.register(KeyboardImpl, Keyboard)
@@ -1170,15 +1157,13 @@ class Mouse(SyncBase):
             Defaults to 1. Sends intermediate `mousemove` events.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.move(x=x, y=y, steps=steps))
-        )
+        return self._sync(self._impl_obj.move(x=x, y=y, steps=steps))
 
     def down(
         self,
         *,
         button: typing.Optional[Literal["left", "middle", "right"]] = None,
-        click_count: typing.Optional[int] = None
+        click_count: typing.Optional[int] = None,
     ) -> None:
         """Mouse.down
 
@@ -1192,15 +1177,13 @@ class Mouse(SyncBase):
             defaults to 1. See [UIEvent.detail].
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.down(button=button, clickCount=click_count))
-        )
+        return self._sync(self._impl_obj.down(button=button, clickCount=click_count))
 
     def up(
         self,
         *,
         button: typing.Optional[Literal["left", "middle", "right"]] = None,
-        click_count: typing.Optional[int] = None
+        click_count: typing.Optional[int] = None,
     ) -> None:
         """Mouse.up
 
@@ -1214,9 +1197,7 @@ class Mouse(SyncBase):
             defaults to 1. See [UIEvent.detail].
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.up(button=button, clickCount=click_count))
-        )
+        return self._sync(self._impl_obj.up(button=button, clickCount=click_count))
 
     def click(
         self,
@@ -1225,7 +1206,7 @@ class Mouse(SyncBase):
         *,
         delay: typing.Optional[float] = None,
         button: typing.Optional[Literal["left", "middle", "right"]] = None,
-        click_count: typing.Optional[int] = None
+        click_count: typing.Optional[int] = None,
     ) -> None:
         """Mouse.click
 
@@ -1243,11 +1224,9 @@ class Mouse(SyncBase):
             defaults to 1. See [UIEvent.detail].
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.click(
-                    x=x, y=y, delay=delay, button=button, clickCount=click_count
-                )
+        return self._sync(
+            self._impl_obj.click(
+                x=x, y=y, delay=delay, button=button, clickCount=click_count
             )
         )
 
@@ -1257,7 +1236,7 @@ class Mouse(SyncBase):
         y: float,
         *,
         delay: typing.Optional[float] = None,
-        button: typing.Optional[Literal["left", "middle", "right"]] = None
+        button: typing.Optional[Literal["left", "middle", "right"]] = None,
     ) -> None:
         """Mouse.dblclick
 
@@ -1274,9 +1253,7 @@ class Mouse(SyncBase):
             Defaults to `left`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.dblclick(x=x, y=y, delay=delay, button=button))
-        )
+        return self._sync(self._impl_obj.dblclick(x=x, y=y, delay=delay, button=button))
 
     def wheel(self, delta_x: float, delta_y: float) -> None:
         """Mouse.wheel
@@ -1294,9 +1271,7 @@ class Mouse(SyncBase):
             Pixels to scroll vertically.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.wheel(deltaX=delta_x, deltaY=delta_y))
-        )
+        return self._sync(self._impl_obj.wheel(deltaX=delta_x, deltaY=delta_y))
 
 
 mapping.register(MouseImpl, Mouse)
@@ -1314,7 +1289,7 @@ class Touchscreen(SyncBase):
         y : float
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.tap(x=x, y=y)))
+        return self._sync(self._impl_obj.tap(x=x, y=y))
 
 
 mapping.register(TouchscreenImpl, Touchscreen)
@@ -1453,7 +1428,7 @@ class JSHandle(SyncBase):
         The `jsHandle.dispose` method stops referencing the element handle.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.dispose()))
+        return self._sync(self._impl_obj.dispose())
 
     def json_value(self) -> typing.Any:
         """JSHandle.json_value
@@ -1679,11 +1654,9 @@ class ElementHandle(JSHandle):
             Optional event-specific initialization properties.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.dispatch_event(
-                    type=type, eventInit=mapping.to_impl(event_init)
-                )
+        return self._sync(
+            self._impl_obj.dispatch_event(
+                type=type, eventInit=mapping.to_impl(event_init)
             )
         )
 
@@ -1706,9 +1679,7 @@ class ElementHandle(JSHandle):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.scroll_into_view_if_needed(timeout=timeout))
-        )
+        return self._sync(self._impl_obj.scroll_into_view_if_needed(timeout=timeout))
 
     def hover(
         self,
@@ -1720,7 +1691,7 @@ class ElementHandle(JSHandle):
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
         force: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.hover
 
@@ -1757,16 +1728,14 @@ class ElementHandle(JSHandle):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.hover(
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                    force=force,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.hover(
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+                force=force,
+                trial=trial,
             )
         )
 
@@ -1783,7 +1752,7 @@ class ElementHandle(JSHandle):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.click
 
@@ -1826,19 +1795,17 @@ class ElementHandle(JSHandle):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.click(
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    delay=delay,
-                    button=button,
-                    clickCount=click_count,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.click(
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                delay=delay,
+                button=button,
+                clickCount=click_count,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                trial=trial,
             )
         )
 
@@ -1854,7 +1821,7 @@ class ElementHandle(JSHandle):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.dblclick
 
@@ -1898,18 +1865,16 @@ class ElementHandle(JSHandle):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.dblclick(
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    delay=delay,
-                    button=button,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.dblclick(
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                delay=delay,
+                button=button,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                trial=trial,
             )
         )
 
@@ -1924,7 +1889,7 @@ class ElementHandle(JSHandle):
         ] = None,
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> typing.List[str]:
         """ElementHandle.select_option
 
@@ -1999,7 +1964,7 @@ class ElementHandle(JSHandle):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.tap
 
@@ -2038,16 +2003,14 @@ class ElementHandle(JSHandle):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.tap(
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.tap(
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                trial=trial,
             )
         )
 
@@ -2057,7 +2020,7 @@ class ElementHandle(JSHandle):
         *,
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
-        force: typing.Optional[bool] = None
+        force: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.fill
 
@@ -2086,11 +2049,9 @@ class ElementHandle(JSHandle):
             Whether to bypass the [actionability](../actionability.md) checks. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.fill(
-                    value=value, timeout=timeout, noWaitAfter=no_wait_after, force=force
-                )
+        return self._sync(
+            self._impl_obj.fill(
+                value=value, timeout=timeout, noWaitAfter=no_wait_after, force=force
             )
         )
 
@@ -2098,7 +2059,7 @@ class ElementHandle(JSHandle):
         self,
         *,
         force: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """ElementHandle.select_text
 
@@ -2118,9 +2079,7 @@ class ElementHandle(JSHandle):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.select_text(force=force, timeout=timeout))
-        )
+        return self._sync(self._impl_obj.select_text(force=force, timeout=timeout))
 
     def input_value(self, *, timeout: typing.Optional[float] = None) -> str:
         """ElementHandle.input_value
@@ -2156,7 +2115,7 @@ class ElementHandle(JSHandle):
         ],
         *,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.set_input_files
 
@@ -2180,13 +2139,9 @@ class ElementHandle(JSHandle):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.set_input_files(
-                    files=mapping.to_impl(files),
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
+        return self._sync(
+            self._impl_obj.set_input_files(
+                files=mapping.to_impl(files), timeout=timeout, noWaitAfter=no_wait_after
             )
         )
 
@@ -2196,7 +2151,7 @@ class ElementHandle(JSHandle):
         Calls [focus](https://developer.mozilla.org/en-US/docs/Web/API/HTMLElement/focus) on the element.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.focus()))
+        return self._sync(self._impl_obj.focus())
 
     def type(
         self,
@@ -2204,7 +2159,7 @@ class ElementHandle(JSHandle):
         *,
         delay: typing.Optional[float] = None,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.type
 
@@ -2240,11 +2195,9 @@ class ElementHandle(JSHandle):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.type(
-                    text=text, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
-                )
+        return self._sync(
+            self._impl_obj.type(
+                text=text, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
             )
         )
 
@@ -2254,7 +2207,7 @@ class ElementHandle(JSHandle):
         *,
         delay: typing.Optional[float] = None,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.press
 
@@ -2292,11 +2245,9 @@ class ElementHandle(JSHandle):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.press(
-                    key=key, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
-                )
+        return self._sync(
+            self._impl_obj.press(
+                key=key, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
             )
         )
 
@@ -2308,7 +2259,7 @@ class ElementHandle(JSHandle):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.set_checked
 
@@ -2346,16 +2297,14 @@ class ElementHandle(JSHandle):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.set_checked(
-                    checked=checked,
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.set_checked(
+                checked=checked,
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                trial=trial,
             )
         )
 
@@ -2366,7 +2315,7 @@ class ElementHandle(JSHandle):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.check
 
@@ -2403,15 +2352,13 @@ class ElementHandle(JSHandle):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.check(
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.check(
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                trial=trial,
             )
         )
 
@@ -2422,7 +2369,7 @@ class ElementHandle(JSHandle):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """ElementHandle.uncheck
 
@@ -2459,15 +2406,13 @@ class ElementHandle(JSHandle):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.uncheck(
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.uncheck(
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                trial=trial,
             )
         )
 
@@ -2510,7 +2455,7 @@ class ElementHandle(JSHandle):
         animations: typing.Optional[Literal["allow", "disabled"]] = None,
         caret: typing.Optional[Literal["hide", "initial"]] = None,
         scale: typing.Optional[Literal["css", "device"]] = None,
-        mask: typing.Optional[typing.List["Locator"]] = None
+        mask: typing.Optional[typing.List["Locator"]] = None,
     ) -> bytes:
         """ElementHandle.screenshot
 
@@ -2721,7 +2666,7 @@ class ElementHandle(JSHandle):
             "disabled", "editable", "enabled", "hidden", "stable", "visible"
         ],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """ElementHandle.wait_for_element_state
 
@@ -2749,10 +2694,8 @@ class ElementHandle(JSHandle):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.wait_for_element_state(state=state, timeout=timeout)
-            )
+        return self._sync(
+            self._impl_obj.wait_for_element_state(state=state, timeout=timeout)
         )
 
     def wait_for_selector(
@@ -2763,7 +2706,7 @@ class ElementHandle(JSHandle):
             Literal["attached", "detached", "hidden", "visible"]
         ] = None,
         timeout: typing.Optional[float] = None,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> typing.Optional["ElementHandle"]:
         """ElementHandle.wait_for_selector
 
@@ -2825,7 +2768,7 @@ class Accessibility(SyncBase):
         self,
         *,
         interesting_only: typing.Optional[bool] = None,
-        root: typing.Optional["ElementHandle"] = None
+        root: typing.Optional["ElementHandle"] = None,
     ) -> typing.Optional[typing.Dict]:
         """Accessibility.snapshot
 
@@ -2936,7 +2879,7 @@ class FileChooser(SyncBase):
         ],
         *,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """FileChooser.set_files
 
@@ -2955,13 +2898,9 @@ class FileChooser(SyncBase):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.set_files(
-                    files=mapping.to_impl(files),
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
+        return self._sync(
+            self._impl_obj.set_files(
+                files=mapping.to_impl(files), timeout=timeout, noWaitAfter=no_wait_after
             )
         )
 
@@ -2996,7 +2935,7 @@ class Frame(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.name)
+        return self._impl_obj.name
 
     @property
     def url(self) -> str:
@@ -3008,7 +2947,7 @@ class Frame(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     @property
     def parent_frame(self) -> typing.Optional["Frame"]:
@@ -3040,7 +2979,7 @@ class Frame(SyncBase):
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
         ] = None,
-        referer: typing.Optional[str] = None
+        referer: typing.Optional[str] = None,
     ) -> typing.Optional["Response"]:
         """Frame.goto
 
@@ -3104,7 +3043,7 @@ class Frame(SyncBase):
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
         ] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> EventContextManager["Response"]:
         """Frame.expect_navigation
 
@@ -3160,7 +3099,7 @@ class Frame(SyncBase):
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
         ] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Frame.wait_for_url
 
@@ -3190,11 +3129,9 @@ class Frame(SyncBase):
             `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.wait_for_url(
-                    url=self._wrap_handler(url), wait_until=wait_until, timeout=timeout
-                )
+        return self._sync(
+            self._impl_obj.wait_for_url(
+                url=self._wrap_handler(url), wait_until=wait_until, timeout=timeout
             )
         )
 
@@ -3204,7 +3141,7 @@ class Frame(SyncBase):
             Literal["domcontentloaded", "load", "networkidle"]
         ] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Frame.wait_for_load_state
 
@@ -3233,8 +3170,8 @@ class Frame(SyncBase):
             `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.wait_for_load_state(state=state, timeout=timeout))
+        return self._sync(
+            self._impl_obj.wait_for_load_state(state=state, timeout=timeout)
         )
 
     def frame_element(self) -> "ElementHandle":
@@ -3429,7 +3366,7 @@ class Frame(SyncBase):
         timeout: typing.Optional[float] = None,
         state: typing.Optional[
             Literal["attached", "detached", "hidden", "visible"]
-        ] = None
+        ] = None,
     ) -> typing.Optional["ElementHandle"]:
         """Frame.wait_for_selector
 
@@ -3499,7 +3436,7 @@ class Frame(SyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Frame.is_checked
 
@@ -3535,7 +3472,7 @@ class Frame(SyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Frame.is_disabled
 
@@ -3571,7 +3508,7 @@ class Frame(SyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Frame.is_editable
 
@@ -3607,7 +3544,7 @@ class Frame(SyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Frame.is_enabled
 
@@ -3643,7 +3580,7 @@ class Frame(SyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Frame.is_hidden
 
@@ -3680,7 +3617,7 @@ class Frame(SyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Frame.is_visible
 
@@ -3719,7 +3656,7 @@ class Frame(SyncBase):
         event_init: typing.Optional[typing.Dict] = None,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Frame.dispatch_event
 
@@ -3768,15 +3705,13 @@ class Frame(SyncBase):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.dispatch_event(
-                    selector=selector,
-                    type=type,
-                    eventInit=mapping.to_impl(event_init),
-                    strict=strict,
-                    timeout=timeout,
-                )
+        return self._sync(
+            self._impl_obj.dispatch_event(
+                selector=selector,
+                type=type,
+                eventInit=mapping.to_impl(event_init),
+                strict=strict,
+                timeout=timeout,
             )
         )
 
@@ -3786,7 +3721,7 @@ class Frame(SyncBase):
         expression: str,
         arg: typing.Optional[typing.Any] = None,
         *,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> typing.Any:
         """Frame.eval_on_selector
 
@@ -3903,7 +3838,7 @@ class Frame(SyncBase):
         timeout: typing.Optional[float] = None,
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
-        ] = None
+        ] = None,
     ) -> None:
         """Frame.set_content
 
@@ -3924,12 +3859,8 @@ class Frame(SyncBase):
             - `'commit'` - consider operation to be finished when network response is received and the document started loading.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.set_content(
-                    html=html, timeout=timeout, waitUntil=wait_until
-                )
-            )
+        return self._sync(
+            self._impl_obj.set_content(html=html, timeout=timeout, waitUntil=wait_until)
         )
 
     def is_detached(self) -> bool:
@@ -3950,7 +3881,7 @@ class Frame(SyncBase):
         url: typing.Optional[str] = None,
         path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
         content: typing.Optional[str] = None,
-        type: typing.Optional[str] = None
+        type: typing.Optional[str] = None,
     ) -> "ElementHandle":
         """Frame.add_script_tag
 
@@ -3989,7 +3920,7 @@ class Frame(SyncBase):
         *,
         url: typing.Optional[str] = None,
         path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
-        content: typing.Optional[str] = None
+        content: typing.Optional[str] = None,
     ) -> "ElementHandle":
         """Frame.add_style_tag
 
@@ -4034,7 +3965,7 @@ class Frame(SyncBase):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.click
 
@@ -4083,21 +4014,19 @@ class Frame(SyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.click(
-                    selector=selector,
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    delay=delay,
-                    button=button,
-                    clickCount=click_count,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.click(
+                selector=selector,
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                delay=delay,
+                button=button,
+                clickCount=click_count,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                strict=strict,
+                trial=trial,
             )
         )
 
@@ -4115,7 +4044,7 @@ class Frame(SyncBase):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.dblclick
 
@@ -4165,20 +4094,18 @@ class Frame(SyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.dblclick(
-                    selector=selector,
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    delay=delay,
-                    button=button,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.dblclick(
+                selector=selector,
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                delay=delay,
+                button=button,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                strict=strict,
+                trial=trial,
             )
         )
 
@@ -4194,7 +4121,7 @@ class Frame(SyncBase):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.tap
 
@@ -4239,18 +4166,16 @@ class Frame(SyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.tap(
-                    selector=selector,
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.tap(
+                selector=selector,
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                strict=strict,
+                trial=trial,
             )
         )
 
@@ -4262,7 +4187,7 @@ class Frame(SyncBase):
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        force: typing.Optional[bool] = None
+        force: typing.Optional[bool] = None,
     ) -> None:
         """Frame.fill
 
@@ -4298,16 +4223,14 @@ class Frame(SyncBase):
             Whether to bypass the [actionability](../actionability.md) checks. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.fill(
-                    selector=selector,
-                    value=value,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                    force=force,
-                )
+        return self._sync(
+            self._impl_obj.fill(
+                selector=selector,
+                value=value,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+                strict=strict,
+                force=force,
             )
         )
 
@@ -4316,7 +4239,7 @@ class Frame(SyncBase):
         selector: str,
         *,
         has_text: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
-        has: typing.Optional["Locator"] = None
+        has: typing.Optional["Locator"] = None,
     ) -> "Locator":
         """Frame.locator
 
@@ -4357,7 +4280,7 @@ class Frame(SyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Frame.get_by_alt_text
 
@@ -4386,7 +4309,7 @@ class Frame(SyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Frame.get_by_label
 
@@ -4417,7 +4340,7 @@ class Frame(SyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Frame.get_by_placeholder
 
@@ -4540,7 +4463,7 @@ class Frame(SyncBase):
         name: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
         pressed: typing.Optional[bool] = None,
         selected: typing.Optional[bool] = None,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Frame.get_by_role
 
@@ -4640,7 +4563,7 @@ class Frame(SyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Frame.get_by_text
 
@@ -4697,7 +4620,7 @@ class Frame(SyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Frame.get_by_title
 
@@ -4751,7 +4674,7 @@ class Frame(SyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Frame.focus
 
@@ -4771,10 +4694,8 @@ class Frame(SyncBase):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.focus(selector=selector, strict=strict, timeout=timeout)
-            )
+        return self._sync(
+            self._impl_obj.focus(selector=selector, strict=strict, timeout=timeout)
         )
 
     def text_content(
@@ -4782,7 +4703,7 @@ class Frame(SyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Optional[str]:
         """Frame.text_content
 
@@ -4818,7 +4739,7 @@ class Frame(SyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> str:
         """Frame.inner_text
 
@@ -4854,7 +4775,7 @@ class Frame(SyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> str:
         """Frame.inner_html
 
@@ -4891,7 +4812,7 @@ class Frame(SyncBase):
         name: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Optional[str]:
         """Frame.get_attribute
 
@@ -4936,7 +4857,7 @@ class Frame(SyncBase):
         no_wait_after: typing.Optional[bool] = None,
         force: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.hover
 
@@ -4979,18 +4900,16 @@ class Frame(SyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.hover(
-                    selector=selector,
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                    force=force,
-                    strict=strict,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.hover(
+                selector=selector,
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+                force=force,
+                strict=strict,
+                trial=trial,
             )
         )
 
@@ -5005,7 +4924,7 @@ class Frame(SyncBase):
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.drag_and_drop
 
@@ -5040,19 +4959,17 @@ class Frame(SyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.drag_and_drop(
-                    source=source,
-                    target=target,
-                    sourcePosition=source_position,
-                    targetPosition=target_position,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                    timeout=timeout,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.drag_and_drop(
+                source=source,
+                target=target,
+                sourcePosition=source_position,
+                targetPosition=target_position,
+                force=force,
+                noWaitAfter=no_wait_after,
+                strict=strict,
+                timeout=timeout,
+                trial=trial,
             )
         )
 
@@ -5069,7 +4986,7 @@ class Frame(SyncBase):
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        force: typing.Optional[bool] = None
+        force: typing.Optional[bool] = None,
     ) -> typing.List[str]:
         """Frame.select_option
 
@@ -5146,7 +5063,7 @@ class Frame(SyncBase):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> str:
         """Frame.input_value
 
@@ -5193,7 +5110,7 @@ class Frame(SyncBase):
         *,
         strict: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """Frame.set_input_files
 
@@ -5223,15 +5140,13 @@ class Frame(SyncBase):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.set_input_files(
-                    selector=selector,
-                    files=mapping.to_impl(files),
-                    strict=strict,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
+        return self._sync(
+            self._impl_obj.set_input_files(
+                selector=selector,
+                files=mapping.to_impl(files),
+                strict=strict,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
         )
 
@@ -5243,7 +5158,7 @@ class Frame(SyncBase):
         delay: typing.Optional[float] = None,
         strict: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """Frame.type
 
@@ -5278,16 +5193,14 @@ class Frame(SyncBase):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.type(
-                    selector=selector,
-                    text=text,
-                    delay=delay,
-                    strict=strict,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
+        return self._sync(
+            self._impl_obj.type(
+                selector=selector,
+                text=text,
+                delay=delay,
+                strict=strict,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
         )
 
@@ -5299,7 +5212,7 @@ class Frame(SyncBase):
         delay: typing.Optional[float] = None,
         strict: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """Frame.press
 
@@ -5341,16 +5254,14 @@ class Frame(SyncBase):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.press(
-                    selector=selector,
-                    key=key,
-                    delay=delay,
-                    strict=strict,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
+        return self._sync(
+            self._impl_obj.press(
+                selector=selector,
+                key=key,
+                delay=delay,
+                strict=strict,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
             )
         )
 
@@ -5363,7 +5274,7 @@ class Frame(SyncBase):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.check
 
@@ -5406,17 +5317,15 @@ class Frame(SyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.check(
-                    selector=selector,
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.check(
+                selector=selector,
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                strict=strict,
+                trial=trial,
             )
         )
 
@@ -5429,7 +5338,7 @@ class Frame(SyncBase):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.uncheck
 
@@ -5472,17 +5381,15 @@ class Frame(SyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.uncheck(
-                    selector=selector,
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.uncheck(
+                selector=selector,
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                strict=strict,
+                trial=trial,
             )
         )
 
@@ -5500,9 +5407,7 @@ class Frame(SyncBase):
             A timeout to wait for
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.wait_for_timeout(timeout=timeout))
-        )
+        return self._sync(self._impl_obj.wait_for_timeout(timeout=timeout))
 
     def wait_for_function(
         self,
@@ -5510,7 +5415,7 @@ class Frame(SyncBase):
         *,
         arg: typing.Optional[typing.Any] = None,
         timeout: typing.Optional[float] = None,
-        polling: typing.Optional[typing.Union[float, Literal["raf"]]] = None
+        polling: typing.Optional[typing.Union[float, Literal["raf"]]] = None,
     ) -> "JSHandle":
         """Frame.wait_for_function
 
@@ -5592,7 +5497,7 @@ class Frame(SyncBase):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Frame.set_checked
 
@@ -5637,18 +5542,16 @@ class Frame(SyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.set_checked(
-                    selector=selector,
-                    checked=checked,
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.set_checked(
+                selector=selector,
+                checked=checked,
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                strict=strict,
+                trial=trial,
             )
         )
 
@@ -5686,7 +5589,7 @@ class FrameLocator(SyncBase):
         selector: str,
         *,
         has_text: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
-        has: typing.Optional["Locator"] = None
+        has: typing.Optional["Locator"] = None,
     ) -> "Locator":
         """FrameLocator.locator
 
@@ -5724,7 +5627,7 @@ class FrameLocator(SyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """FrameLocator.get_by_alt_text
 
@@ -5753,7 +5656,7 @@ class FrameLocator(SyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """FrameLocator.get_by_label
 
@@ -5784,7 +5687,7 @@ class FrameLocator(SyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """FrameLocator.get_by_placeholder
 
@@ -5907,7 +5810,7 @@ class FrameLocator(SyncBase):
         name: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
         pressed: typing.Optional[bool] = None,
         selected: typing.Optional[bool] = None,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """FrameLocator.get_by_role
 
@@ -6007,7 +5910,7 @@ class FrameLocator(SyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """FrameLocator.get_by_text
 
@@ -6064,7 +5967,7 @@ class FrameLocator(SyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """FrameLocator.get_by_title
 
@@ -6150,7 +6053,7 @@ class Worker(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     def evaluate(
         self, expression: str, arg: typing.Optional[typing.Any] = None
@@ -6230,7 +6133,7 @@ class Selectors(SyncBase):
         script: typing.Optional[str] = None,
         *,
         path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
-        content_script: typing.Optional[bool] = None
+        content_script: typing.Optional[bool] = None,
     ) -> None:
         """Selectors.register
 
@@ -6287,11 +6190,9 @@ class Selectors(SyncBase):
             guaranteed when this engine is used together with other registered engines.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.register(
-                    name=name, script=script, path=path, contentScript=content_script
-                )
+        return self._sync(
+            self._impl_obj.register(
+                name=name, script=script, path=path, contentScript=content_script
             )
         )
 
@@ -6306,9 +6207,7 @@ class Selectors(SyncBase):
             Test id attribute name.
         """
 
-        return mapping.from_maybe_impl(
-            self._impl_obj.set_test_id_attribute(attribute_name=attribute_name)
-        )
+        return self._impl_obj.set_test_id_attribute(attribute_name=attribute_name)
 
 
 mapping.register(SelectorsImpl, Selectors)
@@ -6327,7 +6226,7 @@ class ConsoleMessage(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.type)
+        return self._impl_obj.type
 
     @property
     def text(self) -> str:
@@ -6339,7 +6238,7 @@ class ConsoleMessage(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.text)
+        return self._impl_obj.text
 
     @property
     def args(self) -> typing.List["JSHandle"]:
@@ -6378,7 +6277,7 @@ class Dialog(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.type)
+        return self._impl_obj.type
 
     @property
     def message(self) -> str:
@@ -6390,7 +6289,7 @@ class Dialog(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.message)
+        return self._impl_obj.message
 
     @property
     def default_value(self) -> str:
@@ -6402,7 +6301,7 @@ class Dialog(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.default_value)
+        return self._impl_obj.default_value
 
     def accept(self, prompt_text: typing.Optional[str] = None) -> None:
         """Dialog.accept
@@ -6415,9 +6314,7 @@ class Dialog(SyncBase):
             A text to enter in prompt. Does not cause any effects if the dialog's `type` is not prompt. Optional.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.accept(promptText=prompt_text))
-        )
+        return self._sync(self._impl_obj.accept(promptText=prompt_text))
 
     def dismiss(self) -> None:
         """Dialog.dismiss
@@ -6425,7 +6322,7 @@ class Dialog(SyncBase):
         Returns when the dialog has been dismissed.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.dismiss()))
+        return self._sync(self._impl_obj.dismiss())
 
 
 mapping.register(DialogImpl, Dialog)
@@ -6454,7 +6351,7 @@ class Download(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     @property
     def suggested_filename(self) -> str:
@@ -6469,7 +6366,7 @@ class Download(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.suggested_filename)
+        return self._impl_obj.suggested_filename
 
     def delete(self) -> None:
         """Download.delete
@@ -6477,7 +6374,7 @@ class Download(SyncBase):
         Deletes the downloaded file. Will wait for the download to finish if necessary.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.delete()))
+        return self._sync(self._impl_obj.delete())
 
     def failure(self) -> typing.Optional[str]:
         """Download.failure
@@ -6519,7 +6416,7 @@ class Download(SyncBase):
             Path where the download should be copied.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.save_as(path=path)))
+        return self._sync(self._impl_obj.save_as(path=path))
 
     def cancel(self) -> None:
         """Download.cancel
@@ -6528,7 +6425,7 @@ class Download(SyncBase):
         `download.failure()` would resolve to `'canceled'`.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.cancel()))
+        return self._sync(self._impl_obj.cancel())
 
 
 mapping.register(DownloadImpl, Download)
@@ -6560,7 +6457,7 @@ class Video(SyncBase):
             Path where the video should be saved.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.save_as(path=path)))
+        return self._sync(self._impl_obj.save_as(path=path))
 
     def delete(self) -> None:
         """Video.delete
@@ -6568,7 +6465,7 @@ class Video(SyncBase):
         Deletes the video file. Will wait for the video to finish if necessary.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.delete()))
+        return self._sync(self._impl_obj.delete())
 
 
 mapping.register(VideoImpl, Video)
@@ -7087,7 +6984,7 @@ class Page(SyncContextManager):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     @property
     def viewport_size(self) -> typing.Optional[ViewportSize]:
@@ -7157,7 +7054,7 @@ class Page(SyncContextManager):
         *,
         url: typing.Optional[
             typing.Union[str, typing.Pattern[str], typing.Callable[[str], bool]]
-        ] = None
+        ] = None,
     ) -> typing.Optional["Frame"]:
         """Page.frame
 
@@ -7208,9 +7105,7 @@ class Page(SyncContextManager):
             Maximum navigation time in milliseconds
         """
 
-        return mapping.from_maybe_impl(
-            self._impl_obj.set_default_navigation_timeout(timeout=timeout)
-        )
+        return self._impl_obj.set_default_navigation_timeout(timeout=timeout)
 
     def set_default_timeout(self, timeout: float) -> None:
         """Page.set_default_timeout
@@ -7225,9 +7120,7 @@ class Page(SyncContextManager):
             Maximum time in milliseconds
         """
 
-        return mapping.from_maybe_impl(
-            self._impl_obj.set_default_timeout(timeout=timeout)
-        )
+        return self._impl_obj.set_default_timeout(timeout=timeout)
 
     def query_selector(
         self, selector: str, *, strict: typing.Optional[bool] = None
@@ -7290,7 +7183,7 @@ class Page(SyncContextManager):
         state: typing.Optional[
             Literal["attached", "detached", "hidden", "visible"]
         ] = None,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> typing.Optional["ElementHandle"]:
         """Page.wait_for_selector
 
@@ -7360,7 +7253,7 @@ class Page(SyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Page.is_checked
 
@@ -7396,7 +7289,7 @@ class Page(SyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Page.is_disabled
 
@@ -7432,7 +7325,7 @@ class Page(SyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Page.is_editable
 
@@ -7468,7 +7361,7 @@ class Page(SyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Page.is_enabled
 
@@ -7504,7 +7397,7 @@ class Page(SyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Page.is_hidden
 
@@ -7541,7 +7434,7 @@ class Page(SyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> bool:
         """Page.is_visible
 
@@ -7580,7 +7473,7 @@ class Page(SyncContextManager):
         event_init: typing.Optional[typing.Dict] = None,
         *,
         timeout: typing.Optional[float] = None,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> None:
         """Page.dispatch_event
 
@@ -7629,15 +7522,13 @@ class Page(SyncContextManager):
             element, the call throws an exception.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.dispatch_event(
-                    selector=selector,
-                    type=type,
-                    eventInit=mapping.to_impl(event_init),
-                    timeout=timeout,
-                    strict=strict,
-                )
+        return self._sync(
+            self._impl_obj.dispatch_event(
+                selector=selector,
+                type=type,
+                eventInit=mapping.to_impl(event_init),
+                timeout=timeout,
+                strict=strict,
             )
         )
 
@@ -7759,7 +7650,7 @@ class Page(SyncContextManager):
         expression: str,
         arg: typing.Optional[typing.Any] = None,
         *,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> typing.Any:
         """Page.eval_on_selector
 
@@ -7860,7 +7751,7 @@ class Page(SyncContextManager):
         url: typing.Optional[str] = None,
         path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
         content: typing.Optional[str] = None,
-        type: typing.Optional[str] = None
+        type: typing.Optional[str] = None,
     ) -> "ElementHandle":
         """Page.add_script_tag
 
@@ -7900,7 +7791,7 @@ class Page(SyncContextManager):
         *,
         url: typing.Optional[str] = None,
         path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
-        content: typing.Optional[str] = None
+        content: typing.Optional[str] = None,
     ) -> "ElementHandle":
         """Page.add_style_tag
 
@@ -7981,11 +7872,9 @@ class Page(SyncContextManager):
             Callback function which will be called in Playwright's context.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.expose_function(
-                    name=name, callback=self._wrap_handler(callback)
-                )
+        return self._sync(
+            self._impl_obj.expose_function(
+                name=name, callback=self._wrap_handler(callback)
             )
         )
 
@@ -7994,7 +7883,7 @@ class Page(SyncContextManager):
         name: str,
         callback: typing.Callable,
         *,
-        handle: typing.Optional[bool] = None
+        handle: typing.Optional[bool] = None,
     ) -> None:
         """Page.expose_binding
 
@@ -8062,11 +7951,9 @@ class Page(SyncContextManager):
             supported. When passing by value, multiple arguments are supported.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.expose_binding(
-                    name=name, callback=self._wrap_handler(callback), handle=handle
-                )
+        return self._sync(
+            self._impl_obj.expose_binding(
+                name=name, callback=self._wrap_handler(callback), handle=handle
             )
         )
 
@@ -8083,10 +7970,8 @@ class Page(SyncContextManager):
             An object containing additional HTTP headers to be sent with every request. All header values must be strings.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.set_extra_http_headers(headers=mapping.to_impl(headers))
-            )
+        return self._sync(
+            self._impl_obj.set_extra_http_headers(headers=mapping.to_impl(headers))
         )
 
     def content(self) -> str:
@@ -8108,7 +7993,7 @@ class Page(SyncContextManager):
         timeout: typing.Optional[float] = None,
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
-        ] = None
+        ] = None,
     ) -> None:
         """Page.set_content
 
@@ -8129,12 +8014,8 @@ class Page(SyncContextManager):
             - `'commit'` - consider operation to be finished when network response is received and the document started loading.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.set_content(
-                    html=html, timeout=timeout, waitUntil=wait_until
-                )
-            )
+        return self._sync(
+            self._impl_obj.set_content(html=html, timeout=timeout, waitUntil=wait_until)
         )
 
     def goto(
@@ -8145,7 +8026,7 @@ class Page(SyncContextManager):
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
         ] = None,
-        referer: typing.Optional[str] = None
+        referer: typing.Optional[str] = None,
     ) -> typing.Optional["Response"]:
         """Page.goto
 
@@ -8210,7 +8091,7 @@ class Page(SyncContextManager):
         timeout: typing.Optional[float] = None,
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
-        ] = None
+        ] = None,
     ) -> typing.Optional["Response"]:
         """Page.reload
 
@@ -8246,7 +8127,7 @@ class Page(SyncContextManager):
             Literal["domcontentloaded", "load", "networkidle"]
         ] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Page.wait_for_load_state
 
@@ -8286,8 +8167,8 @@ class Page(SyncContextManager):
             `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.wait_for_load_state(state=state, timeout=timeout))
+        return self._sync(
+            self._impl_obj.wait_for_load_state(state=state, timeout=timeout)
         )
 
     def wait_for_url(
@@ -8297,7 +8178,7 @@ class Page(SyncContextManager):
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
         ] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Page.wait_for_url
 
@@ -8329,11 +8210,9 @@ class Page(SyncContextManager):
             `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.wait_for_url(
-                    url=self._wrap_handler(url), wait_until=wait_until, timeout=timeout
-                )
+        return self._sync(
+            self._impl_obj.wait_for_url(
+                url=self._wrap_handler(url), wait_until=wait_until, timeout=timeout
             )
         )
 
@@ -8342,7 +8221,7 @@ class Page(SyncContextManager):
         event: str,
         predicate: typing.Optional[typing.Callable] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Any:
         """Page.wait_for_event
 
@@ -8383,7 +8262,7 @@ class Page(SyncContextManager):
         timeout: typing.Optional[float] = None,
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
-        ] = None
+        ] = None,
     ) -> typing.Optional["Response"]:
         """Page.go_back
 
@@ -8421,7 +8300,7 @@ class Page(SyncContextManager):
         timeout: typing.Optional[float] = None,
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
-        ] = None
+        ] = None,
     ) -> typing.Optional["Response"]:
         """Page.go_forward
 
@@ -8463,7 +8342,7 @@ class Page(SyncContextManager):
         reduced_motion: typing.Optional[
             Literal["no-preference", "null", "reduce"]
         ] = None,
-        forced_colors: typing.Optional[Literal["active", "none", "null"]] = None
+        forced_colors: typing.Optional[Literal["active", "none", "null"]] = None,
     ) -> None:
         """Page.emulate_media
 
@@ -8512,14 +8391,12 @@ class Page(SyncContextManager):
         forced_colors : Union["active", "none", "null", None]
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.emulate_media(
-                    media=media,
-                    colorScheme=color_scheme,
-                    reducedMotion=reduced_motion,
-                    forcedColors=forced_colors,
-                )
+        return self._sync(
+            self._impl_obj.emulate_media(
+                media=media,
+                colorScheme=color_scheme,
+                reducedMotion=reduced_motion,
+                forcedColors=forced_colors,
             )
         )
 
@@ -8545,9 +8422,7 @@ class Page(SyncContextManager):
         viewport_size : {width: int, height: int}
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.set_viewport_size(viewportSize=viewport_size))
-        )
+        return self._sync(self._impl_obj.set_viewport_size(viewportSize=viewport_size))
 
     def bring_to_front(self) -> None:
         """Page.bring_to_front
@@ -8555,13 +8430,13 @@ class Page(SyncContextManager):
         Brings page to front (activates tab).
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.bring_to_front()))
+        return self._sync(self._impl_obj.bring_to_front())
 
     def add_init_script(
         self,
         script: typing.Optional[str] = None,
         *,
-        path: typing.Optional[typing.Union[str, pathlib.Path]] = None
+        path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
     ) -> None:
         """Page.add_init_script
 
@@ -8592,9 +8467,7 @@ class Page(SyncContextManager):
             directory. Optional.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.add_init_script(script=script, path=path))
-        )
+        return self._sync(self._impl_obj.add_init_script(script=script, path=path))
 
     def route(
         self,
@@ -8604,7 +8477,7 @@ class Page(SyncContextManager):
             typing.Callable[["Route", "Request"], typing.Any],
         ],
         *,
-        times: typing.Optional[int] = None
+        times: typing.Optional[int] = None,
     ) -> None:
         """Page.route
 
@@ -8666,13 +8539,11 @@ class Page(SyncContextManager):
             How often a route should be used. By default it will be used every time.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.route(
-                    url=self._wrap_handler(url),
-                    handler=self._wrap_handler(handler),
-                    times=times,
-                )
+        return self._sync(
+            self._impl_obj.route(
+                url=self._wrap_handler(url),
+                handler=self._wrap_handler(handler),
+                times=times,
             )
         )
 
@@ -8698,11 +8569,9 @@ class Page(SyncContextManager):
             Optional handler function to route the request.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.unroute(
-                    url=self._wrap_handler(url), handler=self._wrap_handler(handler)
-                )
+        return self._sync(
+            self._impl_obj.unroute(
+                url=self._wrap_handler(url), handler=self._wrap_handler(handler)
             )
         )
 
@@ -8712,7 +8581,7 @@ class Page(SyncContextManager):
         *,
         url: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
         not_found: typing.Optional[Literal["abort", "fallback"]] = None,
-        update: typing.Optional[bool] = None
+        update: typing.Optional[bool] = None,
     ) -> None:
         """Page.route_from_har
 
@@ -8741,11 +8610,9 @@ class Page(SyncContextManager):
             written to disk when `browser_context.close()` is called.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.route_from_har(
-                    har=har, url=url, not_found=not_found, update=update
-                )
+        return self._sync(
+            self._impl_obj.route_from_har(
+                har=har, url=url, not_found=not_found, update=update
             )
         )
 
@@ -8762,7 +8629,7 @@ class Page(SyncContextManager):
         animations: typing.Optional[Literal["allow", "disabled"]] = None,
         caret: typing.Optional[Literal["hide", "initial"]] = None,
         scale: typing.Optional[Literal["css", "device"]] = None,
-        mask: typing.Optional[typing.List["Locator"]] = None
+        mask: typing.Optional[typing.List["Locator"]] = None,
     ) -> bytes:
         """Page.screenshot
 
@@ -8862,9 +8729,7 @@ class Page(SyncContextManager):
             [before unload](https://developer.mozilla.org/en-US/docs/Web/Events/beforeunload) page handlers.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.close(runBeforeUnload=run_before_unload))
-        )
+        return self._sync(self._impl_obj.close(runBeforeUnload=run_before_unload))
 
     def is_closed(self) -> bool:
         """Page.is_closed
@@ -8893,7 +8758,7 @@ class Page(SyncContextManager):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         trial: typing.Optional[bool] = None,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> None:
         """Page.click
 
@@ -8944,21 +8809,19 @@ class Page(SyncContextManager):
             element, the call throws an exception.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.click(
-                    selector=selector,
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    delay=delay,
-                    button=button,
-                    clickCount=click_count,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    trial=trial,
-                    strict=strict,
-                )
+        return self._sync(
+            self._impl_obj.click(
+                selector=selector,
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                delay=delay,
+                button=button,
+                clickCount=click_count,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                trial=trial,
+                strict=strict,
             )
         )
 
@@ -8976,7 +8839,7 @@ class Page(SyncContextManager):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Page.dblclick
 
@@ -9028,20 +8891,18 @@ class Page(SyncContextManager):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.dblclick(
-                    selector=selector,
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    delay=delay,
-                    button=button,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.dblclick(
+                selector=selector,
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                delay=delay,
+                button=button,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                strict=strict,
+                trial=trial,
             )
         )
 
@@ -9057,7 +8918,7 @@ class Page(SyncContextManager):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Page.tap
 
@@ -9104,18 +8965,16 @@ class Page(SyncContextManager):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.tap(
-                    selector=selector,
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.tap(
+                selector=selector,
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                strict=strict,
+                trial=trial,
             )
         )
 
@@ -9127,7 +8986,7 @@ class Page(SyncContextManager):
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        force: typing.Optional[bool] = None
+        force: typing.Optional[bool] = None,
     ) -> None:
         """Page.fill
 
@@ -9165,16 +9024,14 @@ class Page(SyncContextManager):
             Whether to bypass the [actionability](../actionability.md) checks. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.fill(
-                    selector=selector,
-                    value=value,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                    force=force,
-                )
+        return self._sync(
+            self._impl_obj.fill(
+                selector=selector,
+                value=value,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+                strict=strict,
+                force=force,
             )
         )
 
@@ -9183,7 +9040,7 @@ class Page(SyncContextManager):
         selector: str,
         *,
         has_text: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
-        has: typing.Optional["Locator"] = None
+        has: typing.Optional["Locator"] = None,
     ) -> "Locator":
         """Page.locator
 
@@ -9222,7 +9079,7 @@ class Page(SyncContextManager):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Page.get_by_alt_text
 
@@ -9251,7 +9108,7 @@ class Page(SyncContextManager):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Page.get_by_label
 
@@ -9282,7 +9139,7 @@ class Page(SyncContextManager):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Page.get_by_placeholder
 
@@ -9405,7 +9262,7 @@ class Page(SyncContextManager):
         name: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
         pressed: typing.Optional[bool] = None,
         selected: typing.Optional[bool] = None,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Page.get_by_role
 
@@ -9505,7 +9362,7 @@ class Page(SyncContextManager):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Page.get_by_text
 
@@ -9562,7 +9419,7 @@ class Page(SyncContextManager):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Page.get_by_title
 
@@ -9616,7 +9473,7 @@ class Page(SyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Page.focus
 
@@ -9638,10 +9495,8 @@ class Page(SyncContextManager):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.focus(selector=selector, strict=strict, timeout=timeout)
-            )
+        return self._sync(
+            self._impl_obj.focus(selector=selector, strict=strict, timeout=timeout)
         )
 
     def text_content(
@@ -9649,7 +9504,7 @@ class Page(SyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Optional[str]:
         """Page.text_content
 
@@ -9685,7 +9540,7 @@ class Page(SyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> str:
         """Page.inner_text
 
@@ -9721,7 +9576,7 @@ class Page(SyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> str:
         """Page.inner_html
 
@@ -9758,7 +9613,7 @@ class Page(SyncContextManager):
         name: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Optional[str]:
         """Page.get_attribute
 
@@ -9803,7 +9658,7 @@ class Page(SyncContextManager):
         no_wait_after: typing.Optional[bool] = None,
         force: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Page.hover
 
@@ -9848,18 +9703,16 @@ class Page(SyncContextManager):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.hover(
-                    selector=selector,
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                    force=force,
-                    strict=strict,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.hover(
+                selector=selector,
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+                force=force,
+                strict=strict,
+                trial=trial,
             )
         )
 
@@ -9874,7 +9727,7 @@ class Page(SyncContextManager):
         no_wait_after: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Page.drag_and_drop
 
@@ -9923,19 +9776,17 @@ class Page(SyncContextManager):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.drag_and_drop(
-                    source=source,
-                    target=target,
-                    sourcePosition=source_position,
-                    targetPosition=target_position,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    timeout=timeout,
-                    strict=strict,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.drag_and_drop(
+                source=source,
+                target=target,
+                sourcePosition=source_position,
+                targetPosition=target_position,
+                force=force,
+                noWaitAfter=no_wait_after,
+                timeout=timeout,
+                strict=strict,
+                trial=trial,
             )
         )
 
@@ -9952,7 +9803,7 @@ class Page(SyncContextManager):
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
         force: typing.Optional[bool] = None,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> typing.List[str]:
         """Page.select_option
 
@@ -10032,7 +9883,7 @@ class Page(SyncContextManager):
         selector: str,
         *,
         strict: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> str:
         """Page.input_value
 
@@ -10079,7 +9930,7 @@ class Page(SyncContextManager):
         *,
         timeout: typing.Optional[float] = None,
         strict: typing.Optional[bool] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """Page.set_input_files
 
@@ -10109,15 +9960,13 @@ class Page(SyncContextManager):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.set_input_files(
-                    selector=selector,
-                    files=mapping.to_impl(files),
-                    timeout=timeout,
-                    strict=strict,
-                    noWaitAfter=no_wait_after,
-                )
+        return self._sync(
+            self._impl_obj.set_input_files(
+                selector=selector,
+                files=mapping.to_impl(files),
+                timeout=timeout,
+                strict=strict,
+                noWaitAfter=no_wait_after,
             )
         )
 
@@ -10129,7 +9978,7 @@ class Page(SyncContextManager):
         delay: typing.Optional[float] = None,
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> None:
         """Page.type
 
@@ -10166,16 +10015,14 @@ class Page(SyncContextManager):
             element, the call throws an exception.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.type(
-                    selector=selector,
-                    text=text,
-                    delay=delay,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                )
+        return self._sync(
+            self._impl_obj.type(
+                selector=selector,
+                text=text,
+                delay=delay,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+                strict=strict,
             )
         )
 
@@ -10187,7 +10034,7 @@ class Page(SyncContextManager):
         delay: typing.Optional[float] = None,
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
-        strict: typing.Optional[bool] = None
+        strict: typing.Optional[bool] = None,
     ) -> None:
         """Page.press
 
@@ -10243,16 +10090,14 @@ class Page(SyncContextManager):
             element, the call throws an exception.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.press(
-                    selector=selector,
-                    key=key,
-                    delay=delay,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                )
+        return self._sync(
+            self._impl_obj.press(
+                selector=selector,
+                key=key,
+                delay=delay,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+                strict=strict,
             )
         )
 
@@ -10265,7 +10110,7 @@ class Page(SyncContextManager):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Page.check
 
@@ -10310,17 +10155,15 @@ class Page(SyncContextManager):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.check(
-                    selector=selector,
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.check(
+                selector=selector,
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                strict=strict,
+                trial=trial,
             )
         )
 
@@ -10333,7 +10176,7 @@ class Page(SyncContextManager):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Page.uncheck
 
@@ -10378,17 +10221,15 @@ class Page(SyncContextManager):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.uncheck(
-                    selector=selector,
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.uncheck(
+                selector=selector,
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                strict=strict,
+                trial=trial,
             )
         )
 
@@ -10413,9 +10254,7 @@ class Page(SyncContextManager):
             A timeout to wait for
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.wait_for_timeout(timeout=timeout))
-        )
+        return self._sync(self._impl_obj.wait_for_timeout(timeout=timeout))
 
     def wait_for_function(
         self,
@@ -10423,7 +10262,7 @@ class Page(SyncContextManager):
         *,
         arg: typing.Optional[typing.Any] = None,
         timeout: typing.Optional[float] = None,
-        polling: typing.Optional[typing.Union[float, Literal["raf"]]] = None
+        polling: typing.Optional[typing.Union[float, Literal["raf"]]] = None,
     ) -> "JSHandle":
         """Page.wait_for_function
 
@@ -10498,7 +10337,7 @@ class Page(SyncContextManager):
         `browser_type.launch()`.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.pause()))
+        return self._sync(self._impl_obj.pause())
 
     def pdf(
         self,
@@ -10515,7 +10354,7 @@ class Page(SyncContextManager):
         height: typing.Optional[typing.Union[str, float]] = None,
         prefer_css_page_size: typing.Optional[bool] = None,
         margin: typing.Optional[PdfMargins] = None,
-        path: typing.Optional[typing.Union[str, pathlib.Path]] = None
+        path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
     ) -> bytes:
         """Page.pdf
 
@@ -10632,7 +10471,7 @@ class Page(SyncContextManager):
         event: str,
         predicate: typing.Optional[typing.Callable] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> EventContextManager:
         """Page.expect_event
 
@@ -10670,7 +10509,7 @@ class Page(SyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["ConsoleMessage"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> EventContextManager["ConsoleMessage"]:
         """Page.expect_console_message
 
@@ -10701,7 +10540,7 @@ class Page(SyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["Download"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> EventContextManager["Download"]:
         """Page.expect_download
 
@@ -10732,7 +10571,7 @@ class Page(SyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["FileChooser"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> EventContextManager["FileChooser"]:
         """Page.expect_file_chooser
 
@@ -10768,7 +10607,7 @@ class Page(SyncContextManager):
         wait_until: typing.Optional[
             Literal["commit", "domcontentloaded", "load", "networkidle"]
         ] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> EventContextManager["Response"]:
         """Page.expect_navigation
 
@@ -10824,7 +10663,7 @@ class Page(SyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["Page"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> EventContextManager["Page"]:
         """Page.expect_popup
 
@@ -10857,7 +10696,7 @@ class Page(SyncContextManager):
             str, typing.Pattern[str], typing.Callable[["Request"], bool]
         ],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> EventContextManager["Request"]:
         """Page.expect_request
 
@@ -10900,7 +10739,7 @@ class Page(SyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["Request"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> EventContextManager["Request"]:
         """Page.expect_request_finished
 
@@ -10933,7 +10772,7 @@ class Page(SyncContextManager):
             str, typing.Pattern[str], typing.Callable[["Response"], bool]
         ],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> EventContextManager["Response"]:
         """Page.expect_response
 
@@ -10977,7 +10816,7 @@ class Page(SyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["WebSocket"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> EventContextManager["WebSocket"]:
         """Page.expect_websocket
 
@@ -11008,7 +10847,7 @@ class Page(SyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["Worker"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> EventContextManager["Worker"]:
         """Page.expect_worker
 
@@ -11045,7 +10884,7 @@ class Page(SyncContextManager):
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
         strict: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Page.set_checked
 
@@ -11092,18 +10931,16 @@ class Page(SyncContextManager):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.set_checked(
-                    selector=selector,
-                    checked=checked,
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    strict=strict,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.set_checked(
+                selector=selector,
+                checked=checked,
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                strict=strict,
+                trial=trial,
             )
         )
 
@@ -11396,9 +11233,7 @@ class BrowserContext(SyncContextManager):
             Maximum navigation time in milliseconds
         """
 
-        return mapping.from_maybe_impl(
-            self._impl_obj.set_default_navigation_timeout(timeout=timeout)
-        )
+        return self._impl_obj.set_default_navigation_timeout(timeout=timeout)
 
     def set_default_timeout(self, timeout: float) -> None:
         """BrowserContext.set_default_timeout
@@ -11414,9 +11249,7 @@ class BrowserContext(SyncContextManager):
             Maximum time in milliseconds
         """
 
-        return mapping.from_maybe_impl(
-            self._impl_obj.set_default_timeout(timeout=timeout)
-        )
+        return self._impl_obj.set_default_timeout(timeout=timeout)
 
     def new_page(self) -> "Page":
         """BrowserContext.new_page
@@ -11467,9 +11300,7 @@ class BrowserContext(SyncContextManager):
         cookies : List[{name: str, value: str, url: Union[str, None], domain: Union[str, None], path: Union[str, None], expires: Union[float, None], httpOnly: Union[bool, None], secure: Union[bool, None], sameSite: Union["Lax", "None", "Strict", None]}]
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.add_cookies(cookies=mapping.to_impl(cookies)))
-        )
+        return self._sync(self._impl_obj.add_cookies(cookies=mapping.to_impl(cookies)))
 
     def clear_cookies(self) -> None:
         """BrowserContext.clear_cookies
@@ -11477,7 +11308,7 @@ class BrowserContext(SyncContextManager):
         Clears context cookies.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.clear_cookies()))
+        return self._sync(self._impl_obj.clear_cookies())
 
     def grant_permissions(
         self, permissions: typing.List[str], *, origin: typing.Optional[str] = None
@@ -11510,11 +11341,9 @@ class BrowserContext(SyncContextManager):
             The [origin] to grant permissions to, e.g. "https://example.com".
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.grant_permissions(
-                    permissions=mapping.to_impl(permissions), origin=origin
-                )
+        return self._sync(
+            self._impl_obj.grant_permissions(
+                permissions=mapping.to_impl(permissions), origin=origin
             )
         )
 
@@ -11531,7 +11360,7 @@ class BrowserContext(SyncContextManager):
         ```
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.clear_permissions()))
+        return self._sync(self._impl_obj.clear_permissions())
 
     def set_geolocation(self, geolocation: typing.Optional[Geolocation] = None) -> None:
         """BrowserContext.set_geolocation
@@ -11550,9 +11379,7 @@ class BrowserContext(SyncContextManager):
         geolocation : Union[{latitude: float, longitude: float, accuracy: Union[float, None]}, None]
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.set_geolocation(geolocation=geolocation))
-        )
+        return self._sync(self._impl_obj.set_geolocation(geolocation=geolocation))
 
     def set_extra_http_headers(self, headers: typing.Dict[str, str]) -> None:
         """BrowserContext.set_extra_http_headers
@@ -11569,10 +11396,8 @@ class BrowserContext(SyncContextManager):
             An object containing additional HTTP headers to be sent with every request. All header values must be strings.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.set_extra_http_headers(headers=mapping.to_impl(headers))
-            )
+        return self._sync(
+            self._impl_obj.set_extra_http_headers(headers=mapping.to_impl(headers))
         )
 
     def set_offline(self, offline: bool) -> None:
@@ -11584,15 +11409,13 @@ class BrowserContext(SyncContextManager):
             Whether to emulate network being offline for the browser context.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.set_offline(offline=offline))
-        )
+        return self._sync(self._impl_obj.set_offline(offline=offline))
 
     def add_init_script(
         self,
         script: typing.Optional[str] = None,
         *,
-        path: typing.Optional[typing.Union[str, pathlib.Path]] = None
+        path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
     ) -> None:
         """BrowserContext.add_init_script
 
@@ -11623,16 +11446,14 @@ class BrowserContext(SyncContextManager):
             directory. Optional.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.add_init_script(script=script, path=path))
-        )
+        return self._sync(self._impl_obj.add_init_script(script=script, path=path))
 
     def expose_binding(
         self,
         name: str,
         callback: typing.Callable,
         *,
-        handle: typing.Optional[bool] = None
+        handle: typing.Optional[bool] = None,
     ) -> None:
         """BrowserContext.expose_binding
 
@@ -11698,11 +11519,9 @@ class BrowserContext(SyncContextManager):
             supported. When passing by value, multiple arguments are supported.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.expose_binding(
-                    name=name, callback=self._wrap_handler(callback), handle=handle
-                )
+        return self._sync(
+            self._impl_obj.expose_binding(
+                name=name, callback=self._wrap_handler(callback), handle=handle
             )
         )
 
@@ -11756,11 +11575,9 @@ class BrowserContext(SyncContextManager):
             Callback function that will be called in the Playwright's context.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.expose_function(
-                    name=name, callback=self._wrap_handler(callback)
-                )
+        return self._sync(
+            self._impl_obj.expose_function(
+                name=name, callback=self._wrap_handler(callback)
             )
         )
 
@@ -11772,7 +11589,7 @@ class BrowserContext(SyncContextManager):
             typing.Callable[["Route", "Request"], typing.Any],
         ],
         *,
-        times: typing.Optional[int] = None
+        times: typing.Optional[int] = None,
     ) -> None:
         """BrowserContext.route
 
@@ -11836,13 +11653,11 @@ class BrowserContext(SyncContextManager):
             How often a route should be used. By default it will be used every time.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.route(
-                    url=self._wrap_handler(url),
-                    handler=self._wrap_handler(handler),
-                    times=times,
-                )
+        return self._sync(
+            self._impl_obj.route(
+                url=self._wrap_handler(url),
+                handler=self._wrap_handler(handler),
+                times=times,
             )
         )
 
@@ -11870,11 +11685,9 @@ class BrowserContext(SyncContextManager):
             Optional handler function used to register a routing with `browser_context.route()`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.unroute(
-                    url=self._wrap_handler(url), handler=self._wrap_handler(handler)
-                )
+        return self._sync(
+            self._impl_obj.unroute(
+                url=self._wrap_handler(url), handler=self._wrap_handler(handler)
             )
         )
 
@@ -11884,7 +11697,7 @@ class BrowserContext(SyncContextManager):
         *,
         url: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
         not_found: typing.Optional[Literal["abort", "fallback"]] = None,
-        update: typing.Optional[bool] = None
+        update: typing.Optional[bool] = None,
     ) -> None:
         """BrowserContext.route_from_har
 
@@ -11913,11 +11726,9 @@ class BrowserContext(SyncContextManager):
             written to disk when `browser_context.close()` is called.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.route_from_har(
-                    har=har, url=url, not_found=not_found, update=update
-                )
+        return self._sync(
+            self._impl_obj.route_from_har(
+                har=har, url=url, not_found=not_found, update=update
             )
         )
 
@@ -11926,7 +11737,7 @@ class BrowserContext(SyncContextManager):
         event: str,
         predicate: typing.Optional[typing.Callable] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> EventContextManager:
         """BrowserContext.expect_event
 
@@ -11968,7 +11779,7 @@ class BrowserContext(SyncContextManager):
         > NOTE: The default browser context cannot be closed.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.close()))
+        return self._sync(self._impl_obj.close())
 
     def storage_state(
         self, *, path: typing.Optional[typing.Union[str, pathlib.Path]] = None
@@ -11995,7 +11806,7 @@ class BrowserContext(SyncContextManager):
         event: str,
         predicate: typing.Optional[typing.Callable] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Any:
         """BrowserContext.wait_for_event
 
@@ -12034,7 +11845,7 @@ class BrowserContext(SyncContextManager):
         self,
         predicate: typing.Optional[typing.Callable[["Page"], bool]] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> EventContextManager["Page"]:
         """BrowserContext.expect_page
 
@@ -12116,7 +11927,7 @@ class CDPSession(SyncBase):
         send messages.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.detach()))
+        return self._sync(self._impl_obj.detach())
 
 
 mapping.register(CDPSessionImpl, CDPSession)
@@ -12182,7 +11993,7 @@ class Browser(SyncContextManager):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.version)
+        return self._impl_obj.version
 
     def is_connected(self) -> bool:
         """Browser.is_connected
@@ -12240,7 +12051,7 @@ class Browser(SyncContextManager):
             typing.Union[str, typing.Pattern[str]]
         ] = None,
         record_har_mode: typing.Optional[Literal["full", "minimal"]] = None,
-        record_har_content: typing.Optional[Literal["attach", "embed", "omit"]] = None
+        record_har_content: typing.Optional[Literal["attach", "embed", "omit"]] = None,
     ) -> "BrowserContext":
         """Browser.new_context
 
@@ -12457,7 +12268,7 @@ class Browser(SyncContextManager):
             typing.Union[str, typing.Pattern[str]]
         ] = None,
         record_har_mode: typing.Optional[Literal["full", "minimal"]] = None,
-        record_har_content: typing.Optional[Literal["attach", "embed", "omit"]] = None
+        record_har_content: typing.Optional[Literal["attach", "embed", "omit"]] = None,
     ) -> "Page":
         """Browser.new_page
 
@@ -12632,7 +12443,7 @@ class Browser(SyncContextManager):
         The `Browser` object itself is considered to be disposed and cannot be used anymore.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.close()))
+        return self._sync(self._impl_obj.close())
 
     def new_browser_cdp_session(self) -> "CDPSession":
         """Browser.new_browser_cdp_session
@@ -12654,7 +12465,7 @@ class Browser(SyncContextManager):
         page: typing.Optional["Page"] = None,
         path: typing.Optional[typing.Union[str, pathlib.Path]] = None,
         screenshots: typing.Optional[bool] = None,
-        categories: typing.Optional[typing.List[str]] = None
+        categories: typing.Optional[typing.List[str]] = None,
     ) -> None:
         """Browser.start_tracing
 
@@ -12683,14 +12494,12 @@ class Browser(SyncContextManager):
             specify custom categories to use instead of default.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.start_tracing(
-                    page=page._impl_obj if page else None,
-                    path=path,
-                    screenshots=screenshots,
-                    categories=mapping.to_impl(categories),
-                )
+        return self._sync(
+            self._impl_obj.start_tracing(
+                page=page._impl_obj if page else None,
+                path=path,
+                screenshots=screenshots,
+                categories=mapping.to_impl(categories),
             )
         )
 
@@ -12725,7 +12534,7 @@ class BrowserType(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.name)
+        return self._impl_obj.name
 
     @property
     def executable_path(self) -> str:
@@ -12737,7 +12546,7 @@ class BrowserType(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.executable_path)
+        return self._impl_obj.executable_path
 
     def launch(
         self,
@@ -12762,7 +12571,7 @@ class BrowserType(SyncBase):
         chromium_sandbox: typing.Optional[bool] = None,
         firefox_user_prefs: typing.Optional[
             typing.Dict[str, typing.Union[str, float, bool]]
-        ] = None
+        ] = None,
     ) -> "Browser":
         """BrowserType.launch
 
@@ -12929,7 +12738,7 @@ class BrowserType(SyncBase):
             typing.Union[str, typing.Pattern[str]]
         ] = None,
         record_har_mode: typing.Optional[Literal["full", "minimal"]] = None,
-        record_har_content: typing.Optional[Literal["attach", "embed", "omit"]] = None
+        record_har_content: typing.Optional[Literal["attach", "embed", "omit"]] = None,
     ) -> "BrowserContext":
         """BrowserType.launch_persistent_context
 
@@ -13148,7 +12957,7 @@ class BrowserType(SyncBase):
         *,
         timeout: typing.Optional[float] = None,
         slow_mo: typing.Optional[float] = None,
-        headers: typing.Optional[typing.Dict[str, str]] = None
+        headers: typing.Optional[typing.Dict[str, str]] = None,
     ) -> "Browser":
         """BrowserType.connect_over_cdp
 
@@ -13200,7 +13009,7 @@ class BrowserType(SyncBase):
         *,
         timeout: typing.Optional[float] = None,
         slow_mo: typing.Optional[float] = None,
-        headers: typing.Optional[typing.Dict[str, str]] = None
+        headers: typing.Optional[typing.Dict[str, str]] = None,
     ) -> "Browser":
         """BrowserType.connect
 
@@ -13356,7 +13165,7 @@ class Playwright(SyncBase):
         ```
         """
 
-        return mapping.from_maybe_impl(self._impl_obj.stop())
+        return self._impl_obj.stop()
 
 
 mapping.register(PlaywrightImpl, Playwright)
@@ -13370,7 +13179,7 @@ class Tracing(SyncBase):
         title: typing.Optional[str] = None,
         snapshots: typing.Optional[bool] = None,
         screenshots: typing.Optional[bool] = None,
-        sources: typing.Optional[bool] = None
+        sources: typing.Optional[bool] = None,
     ) -> None:
         """Tracing.start
 
@@ -13400,15 +13209,13 @@ class Tracing(SyncBase):
             Whether to include source files for trace actions.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.start(
-                    name=name,
-                    title=title,
-                    snapshots=snapshots,
-                    screenshots=screenshots,
-                    sources=sources,
-                )
+        return self._sync(
+            self._impl_obj.start(
+                name=name,
+                title=title,
+                snapshots=snapshots,
+                screenshots=screenshots,
+                sources=sources,
             )
         )
 
@@ -13441,9 +13248,7 @@ class Tracing(SyncBase):
             Trace name to be shown in the Trace Viewer.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.start_chunk(title=title))
-        )
+        return self._sync(self._impl_obj.start_chunk(title=title))
 
     def stop_chunk(
         self, *, path: typing.Optional[typing.Union[str, pathlib.Path]] = None
@@ -13458,7 +13263,7 @@ class Tracing(SyncBase):
             Export trace collected since the last `tracing.start_chunk()` call into the file with the given path.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.stop_chunk(path=path)))
+        return self._sync(self._impl_obj.stop_chunk(path=path))
 
     def stop(
         self, *, path: typing.Optional[typing.Union[str, pathlib.Path]] = None
@@ -13473,7 +13278,7 @@ class Tracing(SyncBase):
             Export trace into the file with the given path.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.stop(path=path)))
+        return self._sync(self._impl_obj.stop(path=path))
 
 
 mapping.register(TracingImpl, Tracing)
@@ -13561,7 +13366,7 @@ class Locator(SyncBase):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Locator.check
 
@@ -13598,15 +13403,13 @@ class Locator(SyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.check(
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.check(
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                trial=trial,
             )
         )
 
@@ -13623,7 +13426,7 @@ class Locator(SyncBase):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Locator.click
 
@@ -13666,19 +13469,17 @@ class Locator(SyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.click(
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    delay=delay,
-                    button=button,
-                    clickCount=click_count,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.click(
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                delay=delay,
+                button=button,
+                clickCount=click_count,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                trial=trial,
             )
         )
 
@@ -13694,7 +13495,7 @@ class Locator(SyncBase):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Locator.dblclick
 
@@ -13738,18 +13539,16 @@ class Locator(SyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.dblclick(
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    delay=delay,
-                    button=button,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.dblclick(
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                delay=delay,
+                button=button,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                trial=trial,
             )
         )
 
@@ -13758,7 +13557,7 @@ class Locator(SyncBase):
         type: str,
         event_init: typing.Optional[typing.Dict] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Locator.dispatch_event
 
@@ -13801,11 +13600,9 @@ class Locator(SyncBase):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.dispatch_event(
-                    type=type, eventInit=mapping.to_impl(event_init), timeout=timeout
-                )
+        return self._sync(
+            self._impl_obj.dispatch_event(
+                type=type, eventInit=mapping.to_impl(event_init), timeout=timeout
             )
         )
 
@@ -13814,7 +13611,7 @@ class Locator(SyncBase):
         expression: str,
         arg: typing.Optional[typing.Any] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> typing.Any:
         """Locator.evaluate
 
@@ -13899,7 +13696,7 @@ class Locator(SyncBase):
         expression: str,
         arg: typing.Optional[typing.Any] = None,
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> "JSHandle":
         """Locator.evaluate_handle
 
@@ -13945,7 +13742,7 @@ class Locator(SyncBase):
         *,
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
-        force: typing.Optional[bool] = None
+        force: typing.Optional[bool] = None,
     ) -> None:
         """Locator.fill
 
@@ -13974,11 +13771,9 @@ class Locator(SyncBase):
             Whether to bypass the [actionability](../actionability.md) checks. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.fill(
-                    value=value, timeout=timeout, noWaitAfter=no_wait_after, force=force
-                )
+        return self._sync(
+            self._impl_obj.fill(
+                value=value, timeout=timeout, noWaitAfter=no_wait_after, force=force
             )
         )
 
@@ -13987,7 +13782,7 @@ class Locator(SyncBase):
         *,
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
-        force: typing.Optional[bool] = None
+        force: typing.Optional[bool] = None,
     ) -> None:
         """Locator.clear
 
@@ -14012,11 +13807,9 @@ class Locator(SyncBase):
             Whether to bypass the [actionability](../actionability.md) checks. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.clear(
-                    timeout=timeout, noWaitAfter=no_wait_after, force=force
-                )
+        return self._sync(
+            self._impl_obj.clear(
+                timeout=timeout, noWaitAfter=no_wait_after, force=force
             )
         )
 
@@ -14025,7 +13818,7 @@ class Locator(SyncBase):
         selector: str,
         *,
         has_text: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
-        has: typing.Optional["Locator"] = None
+        has: typing.Optional["Locator"] = None,
     ) -> "Locator":
         """Locator.locator
 
@@ -14063,7 +13856,7 @@ class Locator(SyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Locator.get_by_alt_text
 
@@ -14092,7 +13885,7 @@ class Locator(SyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Locator.get_by_label
 
@@ -14123,7 +13916,7 @@ class Locator(SyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Locator.get_by_placeholder
 
@@ -14246,7 +14039,7 @@ class Locator(SyncBase):
         name: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
         pressed: typing.Optional[bool] = None,
         selected: typing.Optional[bool] = None,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Locator.get_by_role
 
@@ -14346,7 +14139,7 @@ class Locator(SyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Locator.get_by_text
 
@@ -14403,7 +14196,7 @@ class Locator(SyncBase):
         self,
         text: typing.Union[str, typing.Pattern[str]],
         *,
-        exact: typing.Optional[bool] = None
+        exact: typing.Optional[bool] = None,
     ) -> "Locator":
         """Locator.get_by_title
 
@@ -14506,7 +14299,7 @@ class Locator(SyncBase):
         self,
         *,
         has_text: typing.Optional[typing.Union[str, typing.Pattern[str]]] = None,
-        has: typing.Optional["Locator"] = None
+        has: typing.Optional["Locator"] = None,
     ) -> "Locator":
         """Locator.filter
 
@@ -14555,9 +14348,7 @@ class Locator(SyncBase):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.focus(timeout=timeout))
-        )
+        return self._sync(self._impl_obj.focus(timeout=timeout))
 
     def blur(self, *, timeout: typing.Optional[float] = None) -> None:
         """Locator.blur
@@ -14571,7 +14362,7 @@ class Locator(SyncBase):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.blur(timeout=timeout)))
+        return self._sync(self._impl_obj.blur(timeout=timeout))
 
     def count(self) -> int:
         """Locator.count
@@ -14594,7 +14385,7 @@ class Locator(SyncBase):
         timeout: typing.Optional[float] = None,
         trial: typing.Optional[bool] = None,
         source_position: typing.Optional[Position] = None,
-        target_position: typing.Optional[Position] = None
+        target_position: typing.Optional[Position] = None,
     ) -> None:
         """Locator.drag_to
 
@@ -14638,17 +14429,15 @@ class Locator(SyncBase):
             specified, some visible point of the element is used.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.drag_to(
-                    target=target._impl_obj,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    timeout=timeout,
-                    trial=trial,
-                    sourcePosition=source_position,
-                    targetPosition=target_position,
-                )
+        return self._sync(
+            self._impl_obj.drag_to(
+                target=target._impl_obj,
+                force=force,
+                noWaitAfter=no_wait_after,
+                timeout=timeout,
+                trial=trial,
+                sourcePosition=source_position,
+                targetPosition=target_position,
             )
         )
 
@@ -14686,7 +14475,7 @@ class Locator(SyncBase):
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
         force: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Locator.hover
 
@@ -14723,16 +14512,14 @@ class Locator(SyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.hover(
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                    force=force,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.hover(
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                timeout=timeout,
+                noWaitAfter=no_wait_after,
+                force=force,
+                trial=trial,
             )
         )
 
@@ -14925,7 +14712,7 @@ class Locator(SyncBase):
         *,
         delay: typing.Optional[float] = None,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """Locator.press
 
@@ -14963,11 +14750,9 @@ class Locator(SyncBase):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.press(
-                    key=key, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
-                )
+        return self._sync(
+            self._impl_obj.press(
+                key=key, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
             )
         )
 
@@ -14982,7 +14767,7 @@ class Locator(SyncBase):
         animations: typing.Optional[Literal["allow", "disabled"]] = None,
         caret: typing.Optional[Literal["hide", "initial"]] = None,
         scale: typing.Optional[Literal["css", "device"]] = None,
-        mask: typing.Optional[typing.List["Locator"]] = None
+        mask: typing.Optional[typing.List["Locator"]] = None,
     ) -> bytes:
         """Locator.screenshot
 
@@ -15068,9 +14853,7 @@ class Locator(SyncBase):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.scroll_into_view_if_needed(timeout=timeout))
-        )
+        return self._sync(self._impl_obj.scroll_into_view_if_needed(timeout=timeout))
 
     def select_option(
         self,
@@ -15083,7 +14866,7 @@ class Locator(SyncBase):
         ] = None,
         timeout: typing.Optional[float] = None,
         no_wait_after: typing.Optional[bool] = None,
-        force: typing.Optional[bool] = None
+        force: typing.Optional[bool] = None,
     ) -> typing.List[str]:
         """Locator.select_option
 
@@ -15152,7 +14935,7 @@ class Locator(SyncBase):
         self,
         *,
         force: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """Locator.select_text
 
@@ -15172,9 +14955,7 @@ class Locator(SyncBase):
             using the `browser_context.set_default_timeout()` or `page.set_default_timeout()` methods.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.select_text(force=force, timeout=timeout))
-        )
+        return self._sync(self._impl_obj.select_text(force=force, timeout=timeout))
 
     def set_input_files(
         self,
@@ -15187,7 +14968,7 @@ class Locator(SyncBase):
         ],
         *,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """Locator.set_input_files
 
@@ -15211,13 +14992,9 @@ class Locator(SyncBase):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.set_input_files(
-                    files=mapping.to_impl(files),
-                    timeout=timeout,
-                    noWaitAfter=no_wait_after,
-                )
+        return self._sync(
+            self._impl_obj.set_input_files(
+                files=mapping.to_impl(files), timeout=timeout, noWaitAfter=no_wait_after
             )
         )
 
@@ -15231,7 +15008,7 @@ class Locator(SyncBase):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Locator.tap
 
@@ -15270,16 +15047,14 @@ class Locator(SyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.tap(
-                    modifiers=mapping.to_impl(modifiers),
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.tap(
+                modifiers=mapping.to_impl(modifiers),
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                trial=trial,
             )
         )
 
@@ -15311,7 +15086,7 @@ class Locator(SyncBase):
         *,
         delay: typing.Optional[float] = None,
         timeout: typing.Optional[float] = None,
-        no_wait_after: typing.Optional[bool] = None
+        no_wait_after: typing.Optional[bool] = None,
     ) -> None:
         """Locator.type
 
@@ -15347,11 +15122,9 @@ class Locator(SyncBase):
             inaccessible pages. Defaults to `false`.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.type(
-                    text=text, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
-                )
+        return self._sync(
+            self._impl_obj.type(
+                text=text, delay=delay, timeout=timeout, noWaitAfter=no_wait_after
             )
         )
 
@@ -15362,7 +15135,7 @@ class Locator(SyncBase):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Locator.uncheck
 
@@ -15399,15 +15172,13 @@ class Locator(SyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.uncheck(
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.uncheck(
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                trial=trial,
             )
         )
 
@@ -15441,7 +15212,7 @@ class Locator(SyncBase):
         timeout: typing.Optional[float] = None,
         state: typing.Optional[
             Literal["attached", "detached", "hidden", "visible"]
-        ] = None
+        ] = None,
     ) -> None:
         """Locator.wait_for
 
@@ -15470,9 +15241,7 @@ class Locator(SyncBase):
               This is opposite to the `'visible'` option.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.wait_for(timeout=timeout, state=state))
-        )
+        return self._sync(self._impl_obj.wait_for(timeout=timeout, state=state))
 
     def set_checked(
         self,
@@ -15482,7 +15251,7 @@ class Locator(SyncBase):
         timeout: typing.Optional[float] = None,
         force: typing.Optional[bool] = None,
         no_wait_after: typing.Optional[bool] = None,
-        trial: typing.Optional[bool] = None
+        trial: typing.Optional[bool] = None,
     ) -> None:
         """Locator.set_checked
 
@@ -15520,16 +15289,14 @@ class Locator(SyncBase):
             `false`. Useful to wait until the element is ready for the action without performing it.
         """
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.set_checked(
-                    checked=checked,
-                    position=position,
-                    timeout=timeout,
-                    force=force,
-                    noWaitAfter=no_wait_after,
-                    trial=trial,
-                )
+        return self._sync(
+            self._impl_obj.set_checked(
+                checked=checked,
+                position=position,
+                timeout=timeout,
+                force=force,
+                noWaitAfter=no_wait_after,
+                trial=trial,
             )
         )
 
@@ -15540,7 +15307,7 @@ class Locator(SyncBase):
         `locator.highlight()`.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.highlight()))
+        return self._sync(self._impl_obj.highlight())
 
 
 mapping.register(LocatorImpl, Locator)
@@ -15557,7 +15324,7 @@ class APIResponse(SyncBase):
         -------
         bool
         """
-        return mapping.from_maybe_impl(self._impl_obj.ok)
+        return self._impl_obj.ok
 
     @property
     def url(self) -> str:
@@ -15569,7 +15336,7 @@ class APIResponse(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.url)
+        return self._impl_obj.url
 
     @property
     def status(self) -> int:
@@ -15581,7 +15348,7 @@ class APIResponse(SyncBase):
         -------
         int
         """
-        return mapping.from_maybe_impl(self._impl_obj.status)
+        return self._impl_obj.status
 
     @property
     def status_text(self) -> str:
@@ -15593,7 +15360,7 @@ class APIResponse(SyncBase):
         -------
         str
         """
-        return mapping.from_maybe_impl(self._impl_obj.status_text)
+        return self._impl_obj.status_text
 
     @property
     def headers(self) -> typing.Dict[str, str]:
@@ -15664,7 +15431,7 @@ class APIResponse(SyncBase):
         Disposes the body of this response. If not called then the body will stay in memory until the context closes.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.dispose()))
+        return self._sync(self._impl_obj.dispose())
 
 
 mapping.register(APIResponseImpl, APIResponse)
@@ -15679,7 +15446,7 @@ class APIRequestContext(SyncBase):
         `a_pi_response.body()` throw \"Response disposed\" error.
         """
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.dispose()))
+        return self._sync(self._impl_obj.dispose())
 
     def delete(
         self,
@@ -15697,7 +15464,7 @@ class APIRequestContext(SyncBase):
         timeout: typing.Optional[float] = None,
         fail_on_status_code: typing.Optional[bool] = None,
         ignore_https_errors: typing.Optional[bool] = None,
-        max_redirects: typing.Optional[int] = None
+        max_redirects: typing.Optional[int] = None,
     ) -> "APIResponse":
         """APIRequestContext.delete
 
@@ -15774,7 +15541,7 @@ class APIRequestContext(SyncBase):
         timeout: typing.Optional[float] = None,
         fail_on_status_code: typing.Optional[bool] = None,
         ignore_https_errors: typing.Optional[bool] = None,
-        max_redirects: typing.Optional[int] = None
+        max_redirects: typing.Optional[int] = None,
     ) -> "APIResponse":
         """APIRequestContext.head
 
@@ -15851,7 +15618,7 @@ class APIRequestContext(SyncBase):
         timeout: typing.Optional[float] = None,
         fail_on_status_code: typing.Optional[bool] = None,
         ignore_https_errors: typing.Optional[bool] = None,
-        max_redirects: typing.Optional[int] = None
+        max_redirects: typing.Optional[int] = None,
     ) -> "APIResponse":
         """APIRequestContext.get
 
@@ -15938,7 +15705,7 @@ class APIRequestContext(SyncBase):
         timeout: typing.Optional[float] = None,
         fail_on_status_code: typing.Optional[bool] = None,
         ignore_https_errors: typing.Optional[bool] = None,
-        max_redirects: typing.Optional[int] = None
+        max_redirects: typing.Optional[int] = None,
     ) -> "APIResponse":
         """APIRequestContext.patch
 
@@ -16015,7 +15782,7 @@ class APIRequestContext(SyncBase):
         timeout: typing.Optional[float] = None,
         fail_on_status_code: typing.Optional[bool] = None,
         ignore_https_errors: typing.Optional[bool] = None,
-        max_redirects: typing.Optional[int] = None
+        max_redirects: typing.Optional[int] = None,
     ) -> "APIResponse":
         """APIRequestContext.put
 
@@ -16092,7 +15859,7 @@ class APIRequestContext(SyncBase):
         timeout: typing.Optional[float] = None,
         fail_on_status_code: typing.Optional[bool] = None,
         ignore_https_errors: typing.Optional[bool] = None,
-        max_redirects: typing.Optional[int] = None
+        max_redirects: typing.Optional[int] = None,
     ) -> "APIResponse":
         """APIRequestContext.post
 
@@ -16206,7 +15973,7 @@ class APIRequestContext(SyncBase):
         timeout: typing.Optional[float] = None,
         fail_on_status_code: typing.Optional[bool] = None,
         ignore_https_errors: typing.Optional[bool] = None,
-        max_redirects: typing.Optional[int] = None
+        max_redirects: typing.Optional[int] = None,
     ) -> "APIResponse":
         """APIRequestContext.fetch
 
@@ -16334,7 +16101,7 @@ class APIRequest(SyncBase):
         timeout: typing.Optional[float] = None,
         storage_state: typing.Optional[
             typing.Union[StorageState, str, pathlib.Path]
-        ] = None
+        ] = None,
     ) -> "APIRequestContext":
         """APIRequest.new_context
 
@@ -16398,7 +16165,7 @@ class PageAssertions(SyncBase):
         self,
         title_or_reg_exp: typing.Union[typing.Pattern[str], str],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """PageAssertions.to_have_title
 
@@ -16421,11 +16188,9 @@ class PageAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.to_have_title(
-                    title_or_reg_exp=title_or_reg_exp, timeout=timeout
-                )
+        return self._sync(
+            self._impl_obj.to_have_title(
+                title_or_reg_exp=title_or_reg_exp, timeout=timeout
             )
         )
 
@@ -16433,7 +16198,7 @@ class PageAssertions(SyncBase):
         self,
         title_or_reg_exp: typing.Union[typing.Pattern[str], str],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """PageAssertions.not_to_have_title
 
@@ -16448,11 +16213,9 @@ class PageAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.not_to_have_title(
-                    title_or_reg_exp=title_or_reg_exp, timeout=timeout
-                )
+        return self._sync(
+            self._impl_obj.not_to_have_title(
+                title_or_reg_exp=title_or_reg_exp, timeout=timeout
             )
         )
 
@@ -16460,7 +16223,7 @@ class PageAssertions(SyncBase):
         self,
         url_or_reg_exp: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """PageAssertions.to_have_url
 
@@ -16483,19 +16246,15 @@ class PageAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.to_have_url(
-                    url_or_reg_exp=url_or_reg_exp, timeout=timeout
-                )
-            )
+        return self._sync(
+            self._impl_obj.to_have_url(url_or_reg_exp=url_or_reg_exp, timeout=timeout)
         )
 
     def not_to_have_url(
         self,
         url_or_reg_exp: typing.Union[typing.Pattern[str], str],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """PageAssertions.not_to_have_url
 
@@ -16510,11 +16269,9 @@ class PageAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.not_to_have_url(
-                    url_or_reg_exp=url_or_reg_exp, timeout=timeout
-                )
+        return self._sync(
+            self._impl_obj.not_to_have_url(
+                url_or_reg_exp=url_or_reg_exp, timeout=timeout
             )
         )
 
@@ -16533,7 +16290,7 @@ class LocatorAssertions(SyncBase):
         *,
         use_inner_text: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        ignore_case: typing.Optional[bool] = None
+        ignore_case: typing.Optional[bool] = None,
     ) -> None:
         """LocatorAssertions.to_contain_text
 
@@ -16597,14 +16354,12 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.to_contain_text(
-                    expected=mapping.to_impl(expected),
-                    use_inner_text=use_inner_text,
-                    timeout=timeout,
-                    ignore_case=ignore_case,
-                )
+        return self._sync(
+            self._impl_obj.to_contain_text(
+                expected=mapping.to_impl(expected),
+                use_inner_text=use_inner_text,
+                timeout=timeout,
+                ignore_case=ignore_case,
             )
         )
 
@@ -16618,7 +16373,7 @@ class LocatorAssertions(SyncBase):
         *,
         use_inner_text: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        ignore_case: typing.Optional[bool] = None
+        ignore_case: typing.Optional[bool] = None,
     ) -> None:
         """LocatorAssertions.not_to_contain_text
 
@@ -16638,14 +16393,12 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.not_to_contain_text(
-                    expected=mapping.to_impl(expected),
-                    use_inner_text=use_inner_text,
-                    timeout=timeout,
-                    ignore_case=ignore_case,
-                )
+        return self._sync(
+            self._impl_obj.not_to_contain_text(
+                expected=mapping.to_impl(expected),
+                use_inner_text=use_inner_text,
+                timeout=timeout,
+                ignore_case=ignore_case,
             )
         )
 
@@ -16654,7 +16407,7 @@ class LocatorAssertions(SyncBase):
         name: str,
         value: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_have_attribute
 
@@ -16678,12 +16431,8 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.to_have_attribute(
-                    name=name, value=value, timeout=timeout
-                )
-            )
+        return self._sync(
+            self._impl_obj.to_have_attribute(name=name, value=value, timeout=timeout)
         )
 
     def not_to_have_attribute(
@@ -16691,7 +16440,7 @@ class LocatorAssertions(SyncBase):
         name: str,
         value: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_have_attribute
 
@@ -16708,11 +16457,9 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.not_to_have_attribute(
-                    name=name, value=value, timeout=timeout
-                )
+        return self._sync(
+            self._impl_obj.not_to_have_attribute(
+                name=name, value=value, timeout=timeout
             )
         )
 
@@ -16724,7 +16471,7 @@ class LocatorAssertions(SyncBase):
             str,
         ],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_have_class
 
@@ -16761,11 +16508,9 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.to_have_class(
-                    expected=mapping.to_impl(expected), timeout=timeout
-                )
+        return self._sync(
+            self._impl_obj.to_have_class(
+                expected=mapping.to_impl(expected), timeout=timeout
             )
         )
 
@@ -16777,7 +16522,7 @@ class LocatorAssertions(SyncBase):
             str,
         ],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_have_class
 
@@ -16792,11 +16537,9 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.not_to_have_class(
-                    expected=mapping.to_impl(expected), timeout=timeout
-                )
+        return self._sync(
+            self._impl_obj.not_to_have_class(
+                expected=mapping.to_impl(expected), timeout=timeout
             )
         )
 
@@ -16823,9 +16566,7 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.to_have_count(count=count, timeout=timeout))
-        )
+        return self._sync(self._impl_obj.to_have_count(count=count, timeout=timeout))
 
     def not_to_have_count(
         self, count: int, *, timeout: typing.Optional[float] = None
@@ -16843,8 +16584,8 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.not_to_have_count(count=count, timeout=timeout))
+        return self._sync(
+            self._impl_obj.not_to_have_count(count=count, timeout=timeout)
         )
 
     def to_have_css(
@@ -16852,7 +16593,7 @@ class LocatorAssertions(SyncBase):
         name: str,
         value: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_have_css
 
@@ -16876,10 +16617,8 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.to_have_css(name=name, value=value, timeout=timeout)
-            )
+        return self._sync(
+            self._impl_obj.to_have_css(name=name, value=value, timeout=timeout)
         )
 
     def not_to_have_css(
@@ -16887,7 +16626,7 @@ class LocatorAssertions(SyncBase):
         name: str,
         value: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_have_css
 
@@ -16904,17 +16643,15 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.not_to_have_css(name=name, value=value, timeout=timeout)
-            )
+        return self._sync(
+            self._impl_obj.not_to_have_css(name=name, value=value, timeout=timeout)
         )
 
     def to_have_id(
         self,
         id: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_have_id
 
@@ -16936,15 +16673,13 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.to_have_id(id=id, timeout=timeout))
-        )
+        return self._sync(self._impl_obj.to_have_id(id=id, timeout=timeout))
 
     def not_to_have_id(
         self,
         id: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_have_id
 
@@ -16959,9 +16694,7 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.not_to_have_id(id=id, timeout=timeout))
-        )
+        return self._sync(self._impl_obj.not_to_have_id(id=id, timeout=timeout))
 
     def to_have_js_property(
         self, name: str, value: typing.Any, *, timeout: typing.Optional[float] = None
@@ -16989,11 +16722,9 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.to_have_js_property(
-                    name=name, value=mapping.to_impl(value), timeout=timeout
-                )
+        return self._sync(
+            self._impl_obj.to_have_js_property(
+                name=name, value=mapping.to_impl(value), timeout=timeout
             )
         )
 
@@ -17015,11 +16746,9 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.not_to_have_js_property(
-                    name=name, value=mapping.to_impl(value), timeout=timeout
-                )
+        return self._sync(
+            self._impl_obj.not_to_have_js_property(
+                name=name, value=mapping.to_impl(value), timeout=timeout
             )
         )
 
@@ -17027,7 +16756,7 @@ class LocatorAssertions(SyncBase):
         self,
         value: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_have_value
 
@@ -17051,15 +16780,13 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.to_have_value(value=value, timeout=timeout))
-        )
+        return self._sync(self._impl_obj.to_have_value(value=value, timeout=timeout))
 
     def not_to_have_value(
         self,
         value: typing.Union[str, typing.Pattern[str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_have_value
 
@@ -17074,15 +16801,15 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.not_to_have_value(value=value, timeout=timeout))
+        return self._sync(
+            self._impl_obj.not_to_have_value(value=value, timeout=timeout)
         )
 
     def to_have_values(
         self,
         values: typing.List[typing.Union[typing.Pattern[str], str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_have_values
 
@@ -17117,11 +16844,9 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.to_have_values(
-                    values=mapping.to_impl(values), timeout=timeout
-                )
+        return self._sync(
+            self._impl_obj.to_have_values(
+                values=mapping.to_impl(values), timeout=timeout
             )
         )
 
@@ -17129,7 +16854,7 @@ class LocatorAssertions(SyncBase):
         self,
         values: typing.List[typing.Union[typing.Pattern[str], str]],
         *,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_have_values
 
@@ -17144,11 +16869,9 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.not_to_have_values(
-                    values=mapping.to_impl(values), timeout=timeout
-                )
+        return self._sync(
+            self._impl_obj.not_to_have_values(
+                values=mapping.to_impl(values), timeout=timeout
             )
         )
 
@@ -17162,7 +16885,7 @@ class LocatorAssertions(SyncBase):
         *,
         use_inner_text: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        ignore_case: typing.Optional[bool] = None
+        ignore_case: typing.Optional[bool] = None,
     ) -> None:
         """LocatorAssertions.to_have_text
 
@@ -17224,14 +16947,12 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.to_have_text(
-                    expected=mapping.to_impl(expected),
-                    use_inner_text=use_inner_text,
-                    timeout=timeout,
-                    ignore_case=ignore_case,
-                )
+        return self._sync(
+            self._impl_obj.to_have_text(
+                expected=mapping.to_impl(expected),
+                use_inner_text=use_inner_text,
+                timeout=timeout,
+                ignore_case=ignore_case,
             )
         )
 
@@ -17245,7 +16966,7 @@ class LocatorAssertions(SyncBase):
         *,
         use_inner_text: typing.Optional[bool] = None,
         timeout: typing.Optional[float] = None,
-        ignore_case: typing.Optional[bool] = None
+        ignore_case: typing.Optional[bool] = None,
     ) -> None:
         """LocatorAssertions.not_to_have_text
 
@@ -17265,14 +16986,12 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.not_to_have_text(
-                    expected=mapping.to_impl(expected),
-                    use_inner_text=use_inner_text,
-                    timeout=timeout,
-                    ignore_case=ignore_case,
-                )
+        return self._sync(
+            self._impl_obj.not_to_have_text(
+                expected=mapping.to_impl(expected),
+                use_inner_text=use_inner_text,
+                timeout=timeout,
+                ignore_case=ignore_case,
             )
         )
 
@@ -17280,7 +16999,7 @@ class LocatorAssertions(SyncBase):
         self,
         *,
         timeout: typing.Optional[float] = None,
-        checked: typing.Optional[bool] = None
+        checked: typing.Optional[bool] = None,
     ) -> None:
         """LocatorAssertions.to_be_checked
 
@@ -17301,8 +17020,8 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.to_be_checked(timeout=timeout, checked=checked))
+        return self._sync(
+            self._impl_obj.to_be_checked(timeout=timeout, checked=checked)
         )
 
     def not_to_be_checked(self, *, timeout: typing.Optional[float] = None) -> None:
@@ -17317,9 +17036,7 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.not_to_be_checked(timeout=timeout))
-        )
+        return self._sync(self._impl_obj.not_to_be_checked(timeout=timeout))
 
     def to_be_disabled(self, *, timeout: typing.Optional[float] = None) -> None:
         """LocatorAssertions.to_be_disabled
@@ -17343,9 +17060,7 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.to_be_disabled(timeout=timeout))
-        )
+        return self._sync(self._impl_obj.to_be_disabled(timeout=timeout))
 
     def not_to_be_disabled(self, *, timeout: typing.Optional[float] = None) -> None:
         """LocatorAssertions.not_to_be_disabled
@@ -17359,15 +17074,13 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.not_to_be_disabled(timeout=timeout))
-        )
+        return self._sync(self._impl_obj.not_to_be_disabled(timeout=timeout))
 
     def to_be_editable(
         self,
         *,
         editable: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_be_editable
 
@@ -17388,17 +17101,15 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.to_be_editable(editable=editable, timeout=timeout)
-            )
+        return self._sync(
+            self._impl_obj.to_be_editable(editable=editable, timeout=timeout)
         )
 
     def not_to_be_editable(
         self,
         *,
         editable: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_be_editable
 
@@ -17412,10 +17123,8 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.not_to_be_editable(editable=editable, timeout=timeout)
-            )
+        return self._sync(
+            self._impl_obj.not_to_be_editable(editable=editable, timeout=timeout)
         )
 
     def to_be_empty(self, *, timeout: typing.Optional[float] = None) -> None:
@@ -17437,9 +17146,7 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.to_be_empty(timeout=timeout))
-        )
+        return self._sync(self._impl_obj.to_be_empty(timeout=timeout))
 
     def not_to_be_empty(self, *, timeout: typing.Optional[float] = None) -> None:
         """LocatorAssertions.not_to_be_empty
@@ -17453,15 +17160,13 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.not_to_be_empty(timeout=timeout))
-        )
+        return self._sync(self._impl_obj.not_to_be_empty(timeout=timeout))
 
     def to_be_enabled(
         self,
         *,
         enabled: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_be_enabled
 
@@ -17482,15 +17187,15 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.to_be_enabled(enabled=enabled, timeout=timeout))
+        return self._sync(
+            self._impl_obj.to_be_enabled(enabled=enabled, timeout=timeout)
         )
 
     def not_to_be_enabled(
         self,
         *,
         enabled: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_be_enabled
 
@@ -17504,10 +17209,8 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.not_to_be_enabled(enabled=enabled, timeout=timeout)
-            )
+        return self._sync(
+            self._impl_obj.not_to_be_enabled(enabled=enabled, timeout=timeout)
         )
 
     def to_be_hidden(self, *, timeout: typing.Optional[float] = None) -> None:
@@ -17530,9 +17233,7 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.to_be_hidden(timeout=timeout))
-        )
+        return self._sync(self._impl_obj.to_be_hidden(timeout=timeout))
 
     def not_to_be_hidden(self, *, timeout: typing.Optional[float] = None) -> None:
         """LocatorAssertions.not_to_be_hidden
@@ -17546,15 +17247,13 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.not_to_be_hidden(timeout=timeout))
-        )
+        return self._sync(self._impl_obj.not_to_be_hidden(timeout=timeout))
 
     def to_be_visible(
         self,
         *,
         visible: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.to_be_visible
 
@@ -17576,15 +17275,15 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.to_be_visible(visible=visible, timeout=timeout))
+        return self._sync(
+            self._impl_obj.to_be_visible(visible=visible, timeout=timeout)
         )
 
     def not_to_be_visible(
         self,
         *,
         visible: typing.Optional[bool] = None,
-        timeout: typing.Optional[float] = None
+        timeout: typing.Optional[float] = None,
     ) -> None:
         """LocatorAssertions.not_to_be_visible
 
@@ -17598,10 +17297,8 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(
-                self._impl_obj.not_to_be_visible(visible=visible, timeout=timeout)
-            )
+        return self._sync(
+            self._impl_obj.not_to_be_visible(visible=visible, timeout=timeout)
         )
 
     def to_be_focused(self, *, timeout: typing.Optional[float] = None) -> None:
@@ -17623,9 +17320,7 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.to_be_focused(timeout=timeout))
-        )
+        return self._sync(self._impl_obj.to_be_focused(timeout=timeout))
 
     def not_to_be_focused(self, *, timeout: typing.Optional[float] = None) -> None:
         """LocatorAssertions.not_to_be_focused
@@ -17639,9 +17334,7 @@ class LocatorAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(
-            self._sync(self._impl_obj.not_to_be_focused(timeout=timeout))
-        )
+        return self._sync(self._impl_obj.not_to_be_focused(timeout=timeout))
 
 
 mapping.register(LocatorAssertionsImpl, LocatorAssertions)
@@ -17663,7 +17356,7 @@ class APIResponseAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.to_be_ok()))
+        return self._sync(self._impl_obj.to_be_ok())
 
     def not_to_be_ok(self) -> None:
         """APIResponseAssertions.not_to_be_ok
@@ -17672,7 +17365,7 @@ class APIResponseAssertions(SyncBase):
         """
         __tracebackhide__ = True
 
-        return mapping.from_maybe_impl(self._sync(self._impl_obj.not_to_be_ok()))
+        return self._sync(self._impl_obj.not_to_be_ok())
 
 
 mapping.register(APIResponseAssertionsImpl, APIResponseAssertions)
@@ -56,6 +56,8 @@ from playwright._impl._selectors import Selectors
 from playwright._impl._tracing import Tracing
 from playwright._impl._video import Video
 
+NoneType = type(None)
+
 
 def process_type(value: Any, param: bool = False) -> str:
     value = str(value)
@@ -180,14 +182,29 @@ def short_name(t: Any) -> str:
     return match.group(1)
 
 
+def property_return_value(value: Any) -> List[str]:
+    # Properties returning plain values don't need to go through the mapping.
+    scalar_types = (str, bool, int, float, bytes)
+    if value in scalar_types or (
+        get_origin(value) == Union
+        and len(get_args(value)) == 2
+        and get_args(value)[0] in scalar_types
+        and get_args(value)[1] is NoneType
+    ):
+        return ["", ""]
+    return return_value(value)
+
+
 def return_value(value: Any) -> List[str]:
+    if value is NoneType:
+        return ["", ""]
     value_str = str(value)
     if "playwright" not in value_str:
         return ["mapping.from_maybe_impl(", ")"]
     if (
         get_origin(value) == Union
         and len(get_args(value)) == 2
-        and str(get_args(value)[1]) == "<class 'NoneType'>"
+        and get_args(value)[1] is NoneType
     ):
         return ["mapping.from_impl_nullable(", ")"]
     if str(get_origin(value)) == "<class 'list'>":
@@ -212,6 +229,7 @@ header = """
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
 
 import typing
 import sys
@@ -26,6 +26,7 @@ from scripts.generate_api import (
     get_type_hints,
     header,
     process_type,
+    property_return_value,
     return_type,
     return_value,
     short_name,
@@ -69,7 +70,7 @@ def generate(t: Any) -> None:
             documentation_provider.print_entry(
                 class_name, name, get_type_hints(value, api_globals), True
             )
-            [prefix, suffix] = return_value(
+            [prefix, suffix] = property_return_value(
                 get_type_hints(value, api_globals)["return"]
             )
             prefix = "        return " + prefix + f"self._impl_obj.{name}"
@@ -73,6 +73,17 @@ async def test_evaluate_throw_for_detached_frames(page, server, utils):
     assert "Frame was detached" in error.message
 
 
+async def test_page_frames_should_reflect_attach_and_detach(page, server, utils):
+    await page.goto(server.EMPTY_PAGE)
+    assert page.frames == [page.main_frame]
+    frame1 = await utils.attach_frame(page, "frame1", server.EMPTY_PAGE)
+    assert page.frames == [page.main_frame, frame1]
+    page.frames.clear()
+    assert page.frames == [page.main_frame, frame1]
+    await utils.detach_frame(page, "frame1")
+    assert page.frames == [page.main_frame]
+
+
 async def test_evaluate_isolated_between_frames(page, server, utils):
     await page.goto(server.EMPTY_PAGE)
     await utils.attach_frame(page, "frame1", server.EMPTY_PAGE)
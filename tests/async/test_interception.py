@@ -91,6 +91,24 @@ async def test_page_route_should_unroute(page: Page, server):
     assert intercepted == [1]
 
 
+async def test_page_route_should_intercept_after_concurrent_route_calls(
+    page: Page, server: Server
+):
+    intercepted = []
+
+    async def handle_request(route: Route) -> None:
+        intercepted.append(route.request.url)
+        await route.continue_()
+
+    await asyncio.gather(
+        page.route("**/empty.html", handle_request),
+        page.route("**/title.html", handle_request),
+    )
+    await page.goto(server.EMPTY_PAGE)
+    await page.goto(server.PREFIX + "/title.html")
+    assert intercepted == [server.EMPTY_PAGE, server.PREFIX + "/title.html"]
+
+
 async def test_page_route_should_work_when_POST_is_redirected_with_302(page, server):
     server.set_redirect("/rredirect", "/empty.html")
     await page.goto(server.EMPTY_PAGE)
@@ -337,6 +337,28 @@ async def test_response_headers_should_work(page: Page, server):
     assert (await response.all_headers())["foo"] == "bar"
 
 
+async def test_headers_should_not_be_affected_by_mutating_returned_dicts(
+    page: Page, server
+):
+    server.set_route("/empty.html", lambda r: (r.setHeader("foo", "bar"), r.finish()))
+
+    response = await page.goto(server.EMPTY_PAGE)
+    request = response.request
+    for owner in (request, response):
+        headers = owner.headers
+        expected = dict(headers)
+        headers.clear()
+        headers["injected"] = "1"
+        assert owner.headers == expected
+        all_headers = await owner.all_headers()
+        expected_all = dict(all_headers)
+        all_headers.clear()
+        all_headers["injected"] = "1"
+        assert await owner.all_headers() == expected_all
+    assert response.headers["foo"] == "bar"
+    assert (await response.all_headers())["foo"] == "bar"
+
+
 async def test_request_post_data_should_work(page, server):
     await page.goto(server.EMPTY_PAGE)
     server.set_route("/post", lambda r: r.finish())
@@ -1265,6 +1265,24 @@ async def test_frame_should_respect_name(page, server):
     assert frame == page.main_frame.child_frames[0]
 
 
+async def test_frame_should_not_return_detached_frame_by_name(page, server, utils):
+    await utils.attach_frame(page, "frame1", server.EMPTY_PAGE)
+    assert page.frame(name="frame1")
+    await utils.detach_frame(page, "frame1")
+    assert page.frame(name="frame1") is None
+
+
+async def test_frame_should_find_frame_by_name_after_rename(page, server):
+    await page.set_content("<iframe name=old></iframe>")
+    frame = page.frame(name="old")
+    assert frame
+    await frame.evaluate("window.name = 'new'")
+    await frame.goto(server.EMPTY_PAGE)
+    assert frame.name == "new"
+    assert page.frame(name="new") == frame
+    assert page.frame(name="old") is None
+
+
 async def test_frame_should_respect_url(page, server):
     await page.set_content(f'<iframe src="{server.EMPTY_PAGE}"></iframe>')
     assert page.frame(url=re.compile(r"bogus")) is None
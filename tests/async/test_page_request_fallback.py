@@ -298,6 +298,34 @@ async def test_should_amend_post_data(page: Page, server: Server) -> None:
     assert server_request.post_body == b"doggo"
 
 
+async def test_should_amend_post_data_json(page: Page, server: Server) -> None:
+    await page.goto(server.EMPTY_PAGE)
+    post_data_json = []
+
+    async def handle_first(route: Route) -> None:
+        post_data_json.append(route.request.post_data_json)
+        await route.continue_()
+
+    async def handle_second(route: Route) -> None:
+        post_data_json.append(route.request.post_data_json)
+        await route.fallback(post_data='{"foo": "baz"}')
+
+    await page.route("**/*", handle_first)
+    await page.route("**/*", handle_second)
+    [server_request, _] = await asyncio.gather(
+        server.wait_for_request("/sleep.zzz"),
+        page.evaluate(
+            """() => fetch('/sleep.zzz', {
+                method: 'POST',
+                headers: { 'content-type': 'application/json' },
+                body: JSON.stringify({ foo: 'bar' }),
+            })"""
+        ),
+    )
+    assert post_data_json == [{"foo": "bar"}, {"foo": "baz"}]
+    assert server_request.post_body == b'{"foo": "baz"}'
+
+
 async def test_should_amend_binary_post_data(page, server):
     await page.goto(server.EMPTY_PAGE)
     post_data_buffer = []
@@ -56,6 +56,25 @@ async def test_workers_should_emit_created_and_destroyed_events(page: Page):
     )
 
 
+async def test_workers_page_workers_should_reflect_created_and_closed_workers(
+    page: Page,
+):
+    assert page.workers == []
+    async with page.expect_worker() as worker_info:
+        worker_obj = await page.evaluate_handle(
+            "() => new Worker(URL.createObjectURL(new Blob(['1'], {type: 'application/javascript'})))"
+        )
+    worker = await worker_info.value
+    assert page.workers == [worker]
+    page.workers.clear()
+    assert page.workers == [worker]
+    worker_destroyed_promise: Future[Worker] = asyncio.Future()
+    worker.once("close", lambda w: worker_destroyed_promise.set_result(w))
+    await page.evaluate("workerObj => workerObj.terminate()", worker_obj)
+    await worker_destroyed_promise
+    assert page.workers == []
+
+
 async def test_workers_should_report_console_logs(page):
     async with page.expect_console_message() as message_info:
         await page.evaluate(
@@ -0,0 +1,61 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from typing import Any, Dict, List, cast
+
+import pytest
+
+from playwright._impl._connection import Channel
+from playwright._impl._helper import InterceptionEnabler
+
+
+class SlowChannel:
+    def __init__(self) -> None:
+        self.sent: List[str] = []
+        self.reply: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+
+    async def send(self, method: str, params: Dict) -> Any:
+        self.sent.append(method)
+        return await self.reply
+
+
+async def test_concurrent_route_should_wait_for_interception_to_be_enabled() -> None:
+    channel = SlowChannel()
+    interception = InterceptionEnabler(cast(Channel, channel))
+    first = asyncio.create_task(interception.enable())
+    await asyncio.sleep(0)
+    second = asyncio.create_task(interception.wait())
+    await asyncio.sleep(0)
+    assert not second.done()
+    channel.reply.set_result(None)
+    await asyncio.gather(first, second)
+    assert channel.sent == ["setNetworkInterceptionEnabled"]
+    # Once enabled, later routes don't wait on anything.
+    await asyncio.wait_for(interception.wait(), 1)
+
+
+async def test_interception_enable_failure_should_reach_all_callers() -> None:
+    channel = SlowChannel()
+    interception = InterceptionEnabler(cast(Channel, channel))
+    first = asyncio.create_task(interception.enable())
+    await asyncio.sleep(0)
+    second = asyncio.create_task(interception.wait())
+    await asyncio.sleep(0)
+    channel.reply.set_exception(RuntimeError("enable failed"))
+    for task in (first, second):
+        with pytest.raises(RuntimeError, match="enable failed"):
+            await task
+    # The failed attempt isn't replayed to later callers.
+    await asyncio.wait_for(interception.wait(), 1)
@@ -0,0 +1,102 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import base64
+from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, cast
+
+import pytest
+
+from playwright._impl._set_input_files_helpers import convert_input_files
+
+if TYPE_CHECKING:  # pragma: no cover
+    from playwright._impl._browser_context import BrowserContext
+
+
+def make_context(
+    is_remote: bool = False,
+    is_connected_over_cdp: bool = False,
+    has_browser: bool = True,
+) -> "BrowserContext":
+    browser = (
+        SimpleNamespace(_is_connected_over_cdp=is_connected_over_cdp)
+        if has_browser
+        else None
+    )
+    return cast(
+        "BrowserContext",
+        SimpleNamespace(
+            _channel=SimpleNamespace(_connection=SimpleNamespace(is_remote=is_remote)),
+            _browser=browser,
+        ),
+    )
+
+
+@pytest.fixture
+def file_path(tmp_path: Path) -> Path:
+    path = tmp_path / "file-to-upload.txt"
+    path.write_text("contents of the file")
+    return path
+
+
+@pytest.mark.parametrize("has_browser", [True, False])
+async def test_should_pass_local_paths_to_a_launched_browser(
+    file_path: Path, has_browser: bool
+) -> None:
+    converted = await convert_input_files(
+        file_path, make_context(has_browser=has_browser)
+    )
+    assert converted == {
+        "streams": None,
+        "localPaths": [str(file_path.absolute().resolve())],
+        "files": None,
+    }
+
+
+@pytest.mark.parametrize(
+    "context",
+    [make_context(is_connected_over_cdp=True), make_context(is_remote=True)],
+    ids=["connect_over_cdp", "connect"],
+)
+async def test_should_send_small_file_contents_to_other_browsers(
+    file_path: Path, context: "BrowserContext"
+) -> None:
+    converted = await convert_input_files(file_path, context)
+    assert converted == {
+        "streams": None,
+        "localPaths": None,
+        "files": [
+            {
+                "name": "file-to-upload.txt",
+                "buffer": base64.b64encode(b"contents of the file").decode(),
+            }
+        ],
+    }
+
+
+@pytest.mark.parametrize(
+    "context",
+    [
+        make_context(),
+        make_context(is_connected_over_cdp=True),
+        make_context(is_remote=True),
+    ],
+    ids=["launch", "connect_over_cdp", "connect"],
+)
+async def test_should_raise_for_missing_file(
+    tmp_path: Path, context: "BrowserContext"
+) -> None:
+    with pytest.raises(FileNotFoundError):
+        await convert_input_files(tmp_path / "does-not-exist.txt", context)
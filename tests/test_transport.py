@@ -0,0 +1,87 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import math
+from typing import Dict, Generator
+from unittest.mock import patch
+
+import pytest
+
+from playwright._impl import _transport
+from playwright._impl._transport import Transport
+
+
+class MessageTransport(Transport):
+    def request_stop(self) -> None:
+        pass
+
+    async def wait_until_stopped(self) -> None:
+        pass
+
+    async def connect(self) -> None:
+        pass
+
+    async def run(self) -> None:
+        pass
+
+    def send(self, message: Dict) -> None:
+        pass
+
+
+@pytest.fixture(params=["orjson", "json"])
+def transport(request: pytest.FixtureRequest) -> Generator[Transport, None, None]:
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    loop = asyncio.new_event_loop()
+    try:
+        if request.param == "json":
+            with patch.object(_transport, "orjson", None):
+                yield MessageTransport(loop)
+        else:
+            yield MessageTransport(loop)
+    finally:
+        loop.close()
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        {"id": 1, "guid": "page@1", "method": "goto", "params": {"url": "ü"}},
+        {"id": 2, "params": {"value": {"bi": str(2**70)}, "n": 2**70}},
+        {"id": 3, "params": {"value": {"s": "\ud800"}}},
+    ],
+)
+def test_serialize_message_round_trips(transport: Transport, message: Dict) -> None:
+    assert transport.deserialize_message(transport.serialize_message(message)) == (
+        message
+    )
+
+
+def test_deserialize_message_accepts_escaped_lone_surrogate(
+    transport: Transport,
+) -> None:
+    assert transport.deserialize_message(b'{"s": "a\\ud800b"}') == {"s": "a\ud800b"}
+
+
+def test_serialize_message_non_finite_float(transport: Transport) -> None:
+    # The stdlib emits the non-standard NaN token, orjson emits null; neither
+    # reaches the driver as a number.
+    parsed = transport.deserialize_message(
+        transport.serialize_message({"n": float("nan")})
+    )
+    if _transport.orjson:
+        assert parsed == {"n": None}
+    else:
+        assert math.isnan(parsed["n"])
@@ -0,0 +1,79 @@
+# Copyright (c) Microsoft Corporation.
+#
+# Licensed under the Apache License, Version 2.0 (the "License")
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+import threading
+from typing import List
+from unittest.mock import MagicMock
+
+from playwright._impl._helper import URLMatcher
+
+
+def test_url_matcher_should_match_glob_regex_and_callback() -> None:
+    assert URLMatcher(None, "**/*.js").matches("https://x/a.js")
+    assert not URLMatcher(None, "**/*.js").matches("https://x/a.css")
+    assert URLMatcher("https://x/dir/", "a.js").matches("https://x/dir/a.js")
+    assert not URLMatcher("https://x/dir/", "a.js").matches("https://x/a.js")
+    assert URLMatcher(None, re.compile(r"\.css$")).matches("https://x/a.css")
+    assert URLMatcher(None, lambda url: "foo" in url).matches("https://x/foo")
+
+
+def test_url_matcher_should_reuse_cached_results() -> None:
+    matcher = URLMatcher(None, "**/*.js")
+    regex = MagicMock(wraps=matcher._regex_obj)
+    matcher._regex_obj = regex
+    assert matcher.matches("https://x/a.js")
+    assert matcher.matches("https://x/a.js")
+    assert not matcher.matches("https://x/a.css")
+    assert not matcher.matches("https://x/a.css")
+    assert regex.search.call_count == 2
+
+
+def test_url_matcher_should_not_cache_callback_results() -> None:
+    results = [True, False]
+    matcher = URLMatcher(None, lambda url: results.pop(0))
+    assert matcher.matches("https://x/a.js")
+    assert not matcher.matches("https://x/a.js")
+
+
+def test_url_matcher_should_bound_cache_size() -> None:
+    matcher = URLMatcher(None, "**/*.js")
+    matcher._max_cached_matches = 10
+    for i in range(25):
+        assert matcher.matches(f"https://x/{i}.js")
+        assert not matcher.matches(f"https://x/{i}.css")
+        assert len(matcher._match_cache) <= 10
+    assert matcher.matches("https://x/0.js")
+    assert not matcher.matches("https://x/0.css")
+
+
+def test_url_matcher_should_be_safe_to_share_between_threads() -> None:
+    matcher = URLMatcher(None, "**/*.js")
+    matcher._max_cached_matches = 64
+    urls = [f"https://x/{i}.js" for i in range(1500)]
+    errors: List[BaseException] = []
+
+    def run() -> None:
+        try:
+            for url in urls:
+                assert matcher.matches(url)
+        except BaseException as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []